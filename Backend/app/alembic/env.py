@@ -1 +1,67 @@
+# backend/app/alembic/env.py
+"""
+Alembic environment.
 
+Each revision runs in its own transaction (transaction_per_migration=True):
+a failure only rolls back the revision that failed, and the next deploy
+resumes from the last committed one instead of replaying the whole chain.
+Revisions that backfill data or build indexes CONCURRENTLY step out of that
+transaction with concurrent_block() (backend/app/utils/migrations.py), which
+wraps op.get_context().autocommit_block(); timeouts inside a revision's
+transaction are SET LOCAL (migration_timeouts()) so they end with it.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from backend.app.config import settings
+from backend.app.db import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """Emit SQL to stdout without a DB connection (alembic upgrade --sql)."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Run migrations against the configured database."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
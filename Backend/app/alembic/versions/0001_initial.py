@@ -1 +1,184 @@
+# backend/app/alembic/versions/0001_initial.py
+"""initial schema: users, api_keys, bulk_jobs, credit_transactions, extractor_jobs, verification_results
 
+Base of the revision chain. Creates the core tables in the shape later
+revisions expect: billing columns (users.plan / users.credits,
+bulk_jobs.team_id / estimated_cost / output_path, credit_transactions.team_id,
+extractor_jobs.team_id, users.stripe_customer_id) are added by 0002, 0003,
+0006 and 0016.
+
+Revision ID: 0001_initial
+Revises:
+Create Date: 2025-11-01 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import migration_timeouts
+
+# revision identifiers, used by Alembic.
+revision = '0001_initial'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    ]
+
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # new, empty tables: plain CREATE INDEX, no need for CONCURRENTLY
+
+    # -----------------------
+    # users
+    # -----------------------
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('email', sa.String(255), nullable=False),
+        sa.Column('hashed_password', sa.String(255), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_admin', sa.Boolean(), nullable=True),
+        sa.Column('email_verified', sa.Boolean(), nullable=True),
+        sa.Column('first_name', sa.String(100), nullable=True),
+        sa.Column('last_name', sa.String(100), nullable=True),
+        sa.Column('country', sa.String(100), nullable=True),
+        sa.Column('timezone', sa.String(100), nullable=True),
+        sa.Column('default_payment_method_id', sa.String(255), nullable=True),
+        sa.Column('last_login_at', sa.String(50), nullable=True),
+        sa.Column('last_login_ip', sa.String(50), nullable=True),
+        *_timestamps()
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('idx_user_email_active', 'users', ['email', 'is_active'])
+
+    # -----------------------
+    # api_keys
+    # -----------------------
+    op.create_table(
+        'api_keys',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('key_hash', sa.String(64), nullable=False),
+        sa.Column('name', sa.String(255), nullable=True),
+        sa.Column('active', sa.Boolean(), nullable=True),
+        sa.Column('daily_limit', sa.Integer(), nullable=True),
+        sa.Column('used_today', sa.Integer(), nullable=True),
+        sa.Column('rate_limit_per_sec', sa.Integer(), nullable=True),
+        *_timestamps(),
+        sa.UniqueConstraint('user_id', 'name', name='uq_user_key_name')
+    )
+    op.create_index('ix_api_keys_key_hash', 'api_keys', ['key_hash'], unique=True)
+    op.create_index('idx_api_key_user_active', 'api_keys', ['user_id', 'active'])
+
+    # -----------------------
+    # bulk_jobs
+    # -----------------------
+    op.create_table(
+        'bulk_jobs',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('job_id', sa.String(128), nullable=False),
+        sa.Column('status', sa.String(50), nullable=True),
+        sa.Column('input_path', sa.Text(), nullable=True),
+        sa.Column('total', sa.Integer(), nullable=True),
+        sa.Column('processed', sa.Integer(), nullable=True),
+        sa.Column('valid', sa.Integer(), nullable=True),
+        sa.Column('invalid', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('webhook_url', sa.String(1024), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        *_timestamps()
+    )
+    op.create_index('ix_bulk_jobs_job_id', 'bulk_jobs', ['job_id'], unique=True)
+    op.create_index('ix_bulk_jobs_status', 'bulk_jobs', ['status'])
+    op.create_index('idx_bulkjob_status_user', 'bulk_jobs', ['status', 'user_id'])
+
+    # -----------------------
+    # credit_transactions (ledger)
+    # -----------------------
+    op.create_table(
+        'credit_transactions',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('amount', sa.BigInteger(), nullable=False),
+        sa.Column('balance_after', sa.BigInteger(), nullable=False),
+        sa.Column('type', sa.String(50), nullable=False),
+        sa.Column('reference', sa.String(255), nullable=True),
+        sa.Column('details', sa.Text(), nullable=True),
+        *_timestamps()
+    )
+    op.create_index('ix_credit_transactions_user_id', 'credit_transactions', ['user_id'])
+    op.create_index('idx_credit_txn_user_type', 'credit_transactions', ['user_id', 'type'])
+
+    # -----------------------
+    # extractor_jobs
+    # -----------------------
+    op.create_table(
+        'extractor_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('job_id', sa.String(128), nullable=False),
+        sa.Column('status', sa.String(50), nullable=True),
+        sa.Column('input_path', sa.String(500), nullable=True),
+        sa.Column('output_path', sa.String(500), nullable=True),
+        sa.Column('total', sa.Integer(), nullable=True),
+        sa.Column('processed', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        *_timestamps()
+    )
+    op.create_index('ix_extractor_jobs_user_id', 'extractor_jobs', ['user_id'])
+    op.create_index('ix_extractor_jobs_job_id', 'extractor_jobs', ['job_id'], unique=True)
+    op.create_index('ix_extractor_jobs_status', 'extractor_jobs', ['status'])
+    op.create_index('idx_extractor_status_user', 'extractor_jobs', ['status', 'user_id'])
+
+    # -----------------------
+    # verification_results
+    # (team_id has no FK here: teams is created by 0002)
+    # -----------------------
+    op.create_table(
+        'verification_results',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.Column('bulk_job_id', sa.BigInteger(), sa.ForeignKey('bulk_jobs.id', ondelete='SET NULL'), nullable=True),
+        sa.Column('email', sa.String(320), nullable=False),
+        sa.Column('domain', sa.String(255), nullable=True),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('sub_status', sa.String(100), nullable=True),
+        sa.Column('is_disposable', sa.Boolean(), nullable=True),
+        sa.Column('is_role_account', sa.Boolean(), nullable=True),
+        sa.Column('is_catch_all', sa.Boolean(), nullable=True),
+        sa.Column('smtp_success', sa.Boolean(), nullable=True),
+        sa.Column('mx_records_found', sa.Boolean(), nullable=True),
+        sa.Column('has_dns', sa.Boolean(), nullable=True),
+        sa.Column('diagnostics', sa.Text(), nullable=True),
+        sa.Column('cost', sa.Numeric(10, 4), nullable=True),
+        sa.Column('verified_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        *_timestamps()
+    )
+    op.create_index('ix_verification_results_team_id', 'verification_results', ['team_id'])
+    op.create_index('ix_verification_results_bulk_job_id', 'verification_results', ['bulk_job_id'])
+    op.create_index('ix_verification_results_email', 'verification_results', ['email'])
+    op.create_index('ix_verification_results_verified_at', 'verification_results', ['verified_at'])
+    op.create_index('idx_verify_user_email', 'verification_results', ['user_id', 'email'])
+    op.create_index('idx_verify_domain_status', 'verification_results', ['domain', 'status'])
+
+
+def downgrade():
+    # reverse order of creation (indexes go with their tables)
+    op.drop_table('verification_results')
+    op.drop_table('extractor_jobs')
+    op.drop_table('credit_transactions')
+    op.drop_table('bulk_jobs')
+    op.drop_table('api_keys')
+    op.drop_table('users')
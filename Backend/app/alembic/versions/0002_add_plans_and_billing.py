@@ -1,5 +1,10 @@
 # backend/app/alembic/versions/0002_add_plans_and_billing.py
-"""add plans table, user.plan, user.credits, teams, team_members, team_credit_transactions, bulk_job.team_id, bulk_job.estimated_cost, credit_reservation.job_id
+"""add plans table, webhook_events, user.plan, user.credits, teams, team_members, team_credit_transactions, bulk_jobs.team_id, bulk_jobs.estimated_cost
+
+Canonical revision 0002. Supersedes the former sibling revisions
+0002_add_plans_and_user_plan, 0002_add_plans_and_webhook_events and
+0002_create_teams_and_teamid_bulkjob (and their 0003 children), which all
+branched from 0001_initial and re-created the same tables.
 
 Revision ID: 0002_add_plans_and_billing
 Revises: 0001_initial
@@ -7,6 +12,8 @@ Create Date: 2025-11-22 00:00:00.000000
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
 
 # revision identifiers, used by Alembic.
 revision = '0002_add_plans_and_billing'
@@ -14,11 +21,43 @@ down_revision = '0001_initial'
 branch_labels = None
 depends_on = None
 
+# rows per UPDATE when backfilling new columns on large tables
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _backfill_in_batches(table, column, value):
+    """
+    Fill NULLs in `table.column` with `value` one keyset page at a time
+    (id > last_id ORDER BY id LIMIT n), committing each page. Every page is
+    an index seek on the PK, so the backfill stays O(n) instead of
+    re-scanning already-filled rows, and only short row locks are held.
+    """
+    conn = op.get_bind()
+    next_upper = sa.text(
+        f"SELECT max(id) FROM (SELECT id FROM {table} WHERE id > :last_id ORDER BY id LIMIT :batch) p"
+    )
+    fill_page = sa.text(
+        f"UPDATE {table} SET {column} = :value "
+        f"WHERE id > :last_id AND id <= :upper AND {column} IS NULL"
+    )
+    last_id = 0
+    with concurrent_block():
+        while True:
+            upper = conn.execute(next_upper, {"last_id": last_id, "batch": BACKFILL_BATCH_SIZE}).scalar()
+            if upper is None:
+                break
+            conn.execute(fill_page, {"value": value, "last_id": last_id, "upper": upper})
+            last_id = upper
+
+
 def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
     # -----------------------
     # plans table
     # -----------------------
-    op.create_table(
+    plans_table = op.create_table(
         'plans',
         sa.Column('id', sa.Integer(), primary_key=True),
         sa.Column('name', sa.String(100), nullable=False, unique=True),
@@ -32,12 +71,32 @@ def upgrade():
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
     )
 
+    # default plans: one multi-row INSERT instead of a statement per plan
+    op.bulk_insert(plans_table, [
+        {'name': 'free', 'display_name': 'Free', 'monthly_price_usd': 0, 'daily_search_limit': 20, 'monthly_credit_allowance': 0, 'rate_limit_per_sec': 1},
+        {'name': 'pro', 'display_name': 'Pro', 'monthly_price_usd': 29, 'daily_search_limit': 200, 'monthly_credit_allowance': 10000, 'rate_limit_per_sec': 5},
+        {'name': 'team', 'display_name': 'Team', 'monthly_price_usd': 199, 'daily_search_limit': 2000, 'monthly_credit_allowance': 100000, 'rate_limit_per_sec': 10},
+        {'name': 'enterprise', 'display_name': 'Enterprise', 'monthly_price_usd': 0, 'daily_search_limit': 0, 'monthly_credit_allowance': 0, 'rate_limit_per_sec': 0},
+    ])
+
+    # -----------------------
+    # webhook_events table
+    # -----------------------
+    op.create_table(
+        'webhook_events',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('provider', sa.String(100), nullable=True),
+        sa.Column('event_type', sa.String(200), nullable=True),
+        sa.Column('payload', sa.Text(), nullable=True),
+        sa.Column('received_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
+    )
+
     # -----------------------
     # add user.plan and user.credits
+    # credits is added nullable without a default (no table rewrite);
+    # it is backfilled in batches and made NOT NULL at the end
     # -----------------------
-    with op.batch_alter_table('users') as batch_op:
-        batch_op.add_column(sa.Column('plan', sa.String(100), nullable=True))
-        batch_op.add_column(sa.Column('credits', sa.Numeric(18,6), nullable=True, server_default='0'))
+    op.execute("ALTER TABLE users ADD COLUMN plan VARCHAR(100), ADD COLUMN credits BIGINT")
 
     # -----------------------
     # Teams + members + team transactions
@@ -46,10 +105,13 @@ def upgrade():
         'teams',
         sa.Column('id', sa.Integer(), primary_key=True),
         sa.Column('name', sa.String(200), nullable=False, unique=True),
+        sa.Column('slug', sa.String(200), nullable=True),
         sa.Column('owner_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
-        sa.Column('credits', sa.Numeric(18,6), nullable=False, server_default='0'),
+        sa.Column('meta_json', postgresql.JSONB(), nullable=True, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('credits', sa.BigInteger(), nullable=False, server_default='0'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
     )
 
     op.create_table(
@@ -58,51 +120,67 @@ def upgrade():
         sa.Column('team_id', sa.Integer(), sa.ForeignKey('teams.id'), nullable=False),
         sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
         sa.Column('role', sa.String(50), nullable=True),
-        sa.Column('joined_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
+        sa.Column('joined_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
     )
 
     op.create_table(
         'team_credit_transactions',
         sa.Column('id', sa.Integer(), primary_key=True),
         sa.Column('team_id', sa.Integer(), sa.ForeignKey('teams.id'), nullable=False),
-        sa.Column('amount', sa.Numeric(18,6), nullable=False),
-        sa.Column('balance_after', sa.Numeric(18,6), nullable=False),
+        sa.Column('amount', sa.BigInteger(), nullable=False),
+        sa.Column('balance_after', sa.BigInteger(), nullable=False),
         sa.Column('type', sa.String(50), nullable=False),
         sa.Column('reference', sa.String(255), nullable=True),
-        sa.Column('metadata', sa.Text(), nullable=True),
+        sa.Column('meta_json', postgresql.JSONB(), nullable=True, server_default=sa.text("'{}'::jsonb")),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'))
     )
 
     # -----------------------
-    # bulk_job changes: team_id, estimated_cost
+    # bulk_jobs changes: team_id, estimated_cost (one ALTER, one table pass)
+    # canonical owner of bulk_jobs.team_id / ix_bulk_jobs_team_id
+    # -----------------------
+    op.execute("ALTER TABLE bulk_jobs ADD COLUMN IF NOT EXISTS team_id INTEGER, ADD COLUMN IF NOT EXISTS estimated_cost BIGINT")
+
+    # -----------------------
+    # users.credits backfill -> default + NOT NULL
     # -----------------------
-    with op.batch_alter_table('bulk_job') as batch_op:
-        batch_op.add_column(sa.Column('team_id', sa.Integer(), nullable=True))
-        batch_op.add_column(sa.Column('estimated_cost', sa.Numeric(18,6), nullable=True))
+    _backfill_in_batches('users', 'credits', 0)
+    op.alter_column('users', 'credits', server_default='0', nullable=False)
 
     # -----------------------
-    # credit_reservations: add job_id
+    # FK indexes: CONCURRENTLY cannot run inside a transaction, so build
+    # them in autocommit mode and keep bulk_jobs writable meanwhile
     # -----------------------
-    with op.batch_alter_table('credit_reservations') as batch_op:
-        batch_op.add_column(sa.Column('job_id', sa.String(128), nullable=True))
+    with concurrent_block():
+        create_index_concurrently("ix_teams_owner_id", "ON teams (owner_id)")
+        create_index_concurrently("ix_team_members_team_id", "ON team_members (team_id)")
+        create_index_concurrently("ix_team_members_user_id", "ON team_members (user_id)")
+        create_index_concurrently("ix_team_credit_transactions_team_id", "ON team_credit_transactions (team_id)")
+        create_index_concurrently("ix_team_credit_transactions_meta_gin", "ON team_credit_transactions USING GIN (meta_json jsonb_path_ops)")
+        create_index_concurrently("ix_bulk_jobs_team_id", "ON bulk_jobs (team_id)")
 
 
 def downgrade():
-    # reverse order of creation
-    with op.batch_alter_table('credit_reservations') as batch_op:
-        batch_op.drop_column('job_id')
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_team_credit_transactions_meta_gin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_team_credit_transactions_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_team_members_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_team_members_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_teams_owner_id")
 
-    with op.batch_alter_table('bulk_job') as batch_op:
-        batch_op.drop_column('estimated_cost')
-        batch_op.drop_column('team_id')
+    # reverse order of creation
+    op.execute("ALTER TABLE bulk_jobs DROP COLUMN estimated_cost, DROP COLUMN team_id")
 
     op.drop_table('team_credit_transactions')
     op.drop_table('team_members')
     op.drop_table('teams')
 
-    with op.batch_alter_table('users') as batch_op:
-        batch_op.drop_column('credits')
-        batch_op.drop_column('plan')
+    op.execute("ALTER TABLE users DROP COLUMN credits, DROP COLUMN plan")
 
+    op.drop_table('webhook_events')
     op.drop_table('plans')
@@ -1,21 +1,40 @@
 from alembic import op
 import sqlalchemy as sa
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
 
 revision = "0004_create_credit_reservations"
-down_revision = "0003_add_user_credits"
+down_revision = "0003_add_teamid_bulkjob_and_credit_tx"
 
 def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # Reservations stay a separate, un-partitioned table: rows are short-lived
+    # holds that are updated in place (locked / expires_at / job_id) and
+    # deleted or finalized into credit_transactions, which is the append-only
+    # ledger. Folding both into one RANGE-partitioned table would turn every
+    # hold update into a cross-partition lookup.
     op.create_table(
         "credit_reservations",
-        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("id", sa.BigInteger, primary_key=True),
         sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id")),
         sa.Column("team_id", sa.Integer, nullable=True),
-        sa.Column("amount", sa.Numeric(20, 6), nullable=False),
+        sa.Column("amount", sa.BigInteger(), nullable=False),
         sa.Column("job_id", sa.String(100), nullable=True),
         sa.Column("locked", sa.Boolean, default=True),
         sa.Column("expires_at", sa.DateTime(timezone=True)),
         sa.Column("reference", sa.String(255), nullable=True),
     )
 
+    # Postgres does not index FK / lookup columns on its own
+    with concurrent_block():
+        create_index_concurrently("ix_credit_reservations_user_id", "ON credit_reservations (user_id)")
+        create_index_concurrently("ix_credit_reservations_team_id", "ON credit_reservations (team_id)")
+        create_index_concurrently("ix_credit_reservations_job_id", "ON credit_reservations (job_id)")
+
 def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_credit_reservations_job_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_credit_reservations_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_credit_reservations_user_id")
     op.drop_table("credit_reservations")
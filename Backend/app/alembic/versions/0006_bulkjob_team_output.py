@@ -3,14 +3,64 @@
 
 from alembic import op
 import sqlalchemy as sa
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
 
 revision = "0006_bulkjob_team_output"
 down_revision = "0005_create_team_tables"
 
+# bulk_jobs rows per committed page during the team_id backfill
+BACKFILL_PAGE_SIZE = 500
+
+# secondary indexes the backfill does not read, dropped around it and rebuilt
+# afterwards: team_id is indexed, so every page update would otherwise add
+# an entry to each of them. The PK and the unique job_id index (used by the
+# join) stay. Fixed definitions, so a rerun after a failed backfill still
+# rebuilds them.
+BACKFILL_DROPPED_INDEXES = {
+    "ix_bulk_jobs_team_id": "ON bulk_jobs (team_id)",
+    "ix_bulk_jobs_status": "ON bulk_jobs (status)",
+    "idx_bulkjob_status_user": "ON bulk_jobs (status, user_id)",
+}
+
+def _backfill_team_id_from_reservations():
+    """
+    Legacy team jobs only carried their team on the credit reservation.
+    Copy it onto bulk_jobs.team_id one id-range page at a time, committing
+    each page, so the migration never holds the whole table in one
+    transaction.
+    """
+    conn = op.get_bind()
+    next_upper = sa.text(
+        "SELECT max(id) FROM (SELECT id FROM bulk_jobs WHERE id > :last_id ORDER BY id LIMIT :page) p"
+    )
+    copy_page = sa.text(
+        "UPDATE bulk_jobs b SET team_id = r.team_id FROM credit_reservations r "
+        "WHERE b.id > :last_id AND b.id <= :upper AND b.team_id IS NULL "
+        "AND r.job_id = b.job_id AND r.team_id IS NOT NULL"
+    )
+    last_id = 0
+    with concurrent_block():
+        while True:
+            upper = conn.execute(next_upper, {"last_id": last_id, "page": BACKFILL_PAGE_SIZE}).scalar()
+            if upper is None:
+                break
+            conn.execute(copy_page, {"last_id": last_id, "upper": upper})
+            last_id = upper
+
 def upgrade():
-    op.add_column("bulk_jobs", sa.Column("team_id", sa.Integer, nullable=True))
-    op.add_column("bulk_jobs", sa.Column("output_path", sa.String(500), nullable=True))
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # team_id is owned by 0002; only guard it here before the backfill. The
+    # backfill commits this ALTER, so a failed run must be able to repeat it
+    op.execute("ALTER TABLE bulk_jobs ADD COLUMN IF NOT EXISTS team_id INTEGER, ADD COLUMN IF NOT EXISTS output_path VARCHAR(500)")
+    with concurrent_block():
+        for name in BACKFILL_DROPPED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    _backfill_team_id_from_reservations()
+    with concurrent_block():
+        for name, definition in BACKFILL_DROPPED_INDEXES.items():
+            create_index_concurrently(name, definition)
 
 def downgrade():
-    op.drop_column("bulk_jobs", "output_path")
-    op.drop_column("bulk_jobs", "team_id")
+    op.execute("ALTER TABLE bulk_jobs DROP COLUMN output_path")
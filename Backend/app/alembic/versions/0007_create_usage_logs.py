@@ -1,25 +1,57 @@
 
 ## 0007_create_usage_logs.py
 
+from datetime import date
+
 from alembic import op
-import sqlalchemy as sa
+from backend.app.utils.migrations import migration_timeouts
 
 revision = "0007_create_usage_logs"
 down_revision = "0006_bulkjob_team_output"
 
+# monthly partitions created up front (rows outside them land in usage_logs_default)
+USAGE_LOG_PARTITION_MONTHS = 12
+
+def _month_start(d, offset):
+    y, m = divmod(d.month - 1 + offset, 12)
+    return date(d.year + y, m + 1, 1)
+
 def upgrade():
-    op.create_table(
-        "usage_logs",
-        sa.Column("id", sa.Integer, primary_key=True),
-        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id")),
-        sa.Column("api_key_id", sa.Integer, sa.ForeignKey("api_keys.id")),
-        sa.Column("endpoint", sa.String(255), nullable=False),
-        sa.Column("method", sa.String(20), nullable=False),
-        sa.Column("status_code", sa.Integer, nullable=False),
-        sa.Column("ip", sa.String(100)),
-        sa.Column("user_agent", sa.String(255)),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # one row per API call: RANGE-partitioned by month so rollups only scan
+    # the months they ask for and old months are dropped with DETACH PARTITION.
+    # The partition key has to be part of the primary key.
+    op.execute(
+        """
+        CREATE TABLE usage_logs (
+            id BIGSERIAL NOT NULL,
+            user_id INTEGER REFERENCES users (id),
+            api_key_id INTEGER REFERENCES api_keys (id),
+            endpoint VARCHAR(255) NOT NULL,
+            method VARCHAR(20) NOT NULL,
+            status_code INTEGER NOT NULL,
+            ip VARCHAR(100),
+            user_agent VARCHAR(255),
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
     )
 
+    first = date.today().replace(day=1)
+    for i in range(USAGE_LOG_PARTITION_MONTHS):
+        start, end = _month_start(first, i), _month_start(first, i + 1)
+        op.execute(
+            f"CREATE TABLE usage_logs_{start:%Y_%m} PARTITION OF usage_logs "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("CREATE TABLE usage_logs_default PARTITION OF usage_logs DEFAULT")
+
+    # declared on the parent, created on every partition
+    op.execute("CREATE INDEX ix_usage_logs_user_created ON usage_logs (user_id, created_at)")
+
 def downgrade():
-    op.drop_table("usage_logs")
+    # dropping the parent drops every partition
+    op.execute("DROP TABLE usage_logs")
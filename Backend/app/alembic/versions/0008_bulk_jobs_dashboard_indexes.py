@@ -0,0 +1,29 @@
+
+## 0008_bulk_jobs_dashboard_indexes.py
+
+from alembic import op
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
+
+revision = "0008_bulk_jobs_dashboard_indexes"
+down_revision = "0007_create_usage_logs"
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # team job listing: WHERE team_id=? AND status=?
+    # user job listing: WHERE user_id=? ORDER BY created_at DESC LIMIT N
+    with concurrent_block():
+        create_index_concurrently("ix_bulk_jobs_team_status", "ON bulk_jobs (team_id, status)")
+        create_index_concurrently("ix_bulk_jobs_user_created", "ON bulk_jobs (user_id, created_at DESC)")
+
+        # single-column prefixes of the composites above only add write cost
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_user_id")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bulk_jobs_team_id ON bulk_jobs (team_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bulk_jobs_user_id ON bulk_jobs (user_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_user_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_team_status")
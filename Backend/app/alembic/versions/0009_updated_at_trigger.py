@@ -0,0 +1,42 @@
+
+## 0009_updated_at_trigger.py
+
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import migration_timeouts
+
+revision = "0009_updated_at_trigger"
+down_revision = "0008_bulk_jobs_dashboard_indexes"
+
+_TABLES_WITH_UPDATED_AT = sa.text(
+    "SELECT table_name FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND column_name = 'updated_at'"
+)
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # one shared BEFORE UPDATE trigger keeps updated_at correct for raw SQL
+    # and bulk worker updates too, not only ORM flushes
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for (table,) in op.get_bind().execute(_TABLES_WITH_UPDATED_AT).fetchall():
+        op.execute(f"DROP TRIGGER IF EXISTS trg_set_updated_at ON {table}")
+        op.execute(
+            f"CREATE TRIGGER trg_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+def downgrade():
+    for (table,) in op.get_bind().execute(_TABLES_WITH_UPDATED_AT).fetchall():
+        op.execute(f"DROP TRIGGER IF EXISTS trg_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,25 @@
+
+## 0010_verification_results_admin_indexes.py
+
+from alembic import op
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
+
+revision = "0010_verification_results_admin_indexes"
+down_revision = "0009_updated_at_trigger"
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # recent failures: WHERE status='invalid' ORDER BY created_at DESC LIMIT N
+    #   (partial: only invalid rows are indexed)
+    # user history:    WHERE user_id=? ORDER BY created_at DESC LIMIT N
+    # bulk_jobs (user_id, created_at DESC) already exists (0008)
+    with concurrent_block():
+        create_index_concurrently("ix_vr_invalid_created", "ON verification_results (created_at DESC) WHERE status = 'invalid'")
+        create_index_concurrently("ix_vr_user_created", "ON verification_results (user_id, created_at DESC)")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vr_user_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vr_invalid_created")
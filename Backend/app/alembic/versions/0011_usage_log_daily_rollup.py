@@ -0,0 +1,66 @@
+## 0011_usage_log_daily_rollup.py
+
+from alembic import op
+from backend.app.utils.migrations import migration_timeouts
+
+revision = "0011_usage_log_daily_rollup"
+down_revision = "0010_verification_results_admin_indexes"
+
+_DAY = "(created_at AT TIME ZONE 'UTC')::date"
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # admin analytics read these instead of scanning usage_logs; kept fresh
+    # by the daily_usage_rollup task (app/services/usage_rollup.py)
+    op.execute(
+        """
+        CREATE TABLE usage_log_daily (
+            day DATE NOT NULL,
+            endpoint VARCHAR(255) NOT NULL,
+            requests BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, endpoint)
+        )
+        """
+    )
+    # distinct users / keys per day: unique counts over a window merge these
+    # (postgres:15 ships without the hll extension, so no sketches)
+    op.execute(
+        """
+        CREATE TABLE usage_log_daily_users (
+            day DATE NOT NULL,
+            user_id INTEGER NOT NULL,
+            PRIMARY KEY (day, user_id)
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE usage_log_daily_keys (
+            day DATE NOT NULL,
+            api_key_id INTEGER NOT NULL,
+            PRIMARY KEY (day, api_key_id)
+        )
+        """
+    )
+
+    # one-off backfill of the existing history; the task only re-aggregates
+    # the last two days
+    op.execute(
+        f"INSERT INTO usage_log_daily (day, endpoint, requests) "
+        f"SELECT {_DAY}, endpoint, count(*) FROM usage_logs GROUP BY 1, 2"
+    )
+    op.execute(
+        f"INSERT INTO usage_log_daily_users (day, user_id) "
+        f"SELECT DISTINCT {_DAY}, user_id FROM usage_logs WHERE user_id IS NOT NULL"
+    )
+    op.execute(
+        f"INSERT INTO usage_log_daily_keys (day, api_key_id) "
+        f"SELECT DISTINCT {_DAY}, api_key_id FROM usage_logs WHERE api_key_id IS NOT NULL"
+    )
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS usage_log_daily_keys")
+    op.execute("DROP TABLE IF EXISTS usage_log_daily_users")
+    op.execute("DROP TABLE IF EXISTS usage_log_daily")
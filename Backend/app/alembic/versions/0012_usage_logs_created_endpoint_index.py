@@ -0,0 +1,51 @@
+## 0012_usage_logs_created_endpoint_index.py
+
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
+
+revision = "0012_usage_logs_created_endpoint_index"
+down_revision = "0011_usage_log_daily_rollup"
+
+INDEX = "ix_usage_logs_created_endpoint"
+
+# 'p' = partitioned (0007 as it is now), 'r' = plain table
+_RELKIND = sa.text("SELECT relkind FROM pg_class WHERE oid = CAST('usage_logs' AS regclass)")
+
+_PARTITIONS = sa.text(
+    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = CAST('usage_logs' AS regclass) ORDER BY c.relname"
+)
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # WHERE created_at >= :since GROUP BY day, endpoint (+ DISTINCT user_id /
+    # api_key_id) in the usage rollup becomes an index-only range scan.
+    columns = "(created_at, endpoint) INCLUDE (user_id, api_key_id)"
+
+    # databases that ran 0007 before it partitioned usage_logs still have a
+    # plain table: build the index concurrently on it directly
+    if op.get_bind().execute(_RELKIND).scalar() != "p":
+        with concurrent_block():
+            create_index_concurrently(INDEX, f"ON usage_logs {columns}")
+            op.execute("ANALYZE usage_logs")
+        return
+
+    # CREATE INDEX CONCURRENTLY does not work on a partitioned parent: declare
+    # the index on the parent only (invalid), build each partition's index
+    # concurrently, then attach them; the parent index turns valid once every
+    # partition is attached.
+    partitions = [r[0] for r in op.get_bind().execute(_PARTITIONS)]
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX} ON ONLY usage_logs {columns}")
+    with concurrent_block():
+        for part in partitions:
+            create_index_concurrently(f"{part}_created_endpoint_idx", f"ON {part} {columns}")
+            op.execute(f"ALTER INDEX {INDEX} ATTACH PARTITION {part}_created_endpoint_idx")
+        op.execute("ANALYZE usage_logs")
+
+def downgrade():
+    # dropping the parent index drops the attached partition indexes (plain
+    # table: just the one index)
+    op.execute(f"DROP INDEX IF EXISTS {INDEX}")
@@ -0,0 +1,23 @@
+## 0013_bulk_jobs_user_created_id_index.py
+
+from alembic import op
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
+
+revision = "0013_bulk_jobs_user_created_id_index"
+down_revision = "0012_usage_logs_created_endpoint_index"
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # /my-jobs keyset pages: WHERE user_id=? AND (created_at, id) < (?, ?)
+    # ORDER BY created_at DESC, id DESC LIMIT N -> one index range scan
+    with concurrent_block():
+        create_index_concurrently("ix_bulk_jobs_user_created_id", "ON bulk_jobs (user_id, created_at DESC, id DESC)")
+        # prefix of the index above
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_user_created")
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bulk_jobs_user_created ON bulk_jobs (user_id, created_at DESC)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bulk_jobs_user_created_id")
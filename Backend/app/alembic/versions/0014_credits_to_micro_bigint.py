@@ -0,0 +1,73 @@
+# backend/app/alembic/versions/0014_credits_to_micro_bigint.py
+"""store existing credit columns as BIGINT micro-credits
+
+Converts the MicroCredits columns of databases created before the switch
+from NUMERIC to a BIGINT count of 1e-6 credits; columns that are already
+BIGINT are left alone.
+
+Revision ID: 0014_credits_to_micro_bigint
+Revises: 0013_bulk_jobs_user_created_id_index
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import migration_timeouts
+
+# revision identifiers, used by Alembic.
+revision = "0014_credits_to_micro_bigint"
+down_revision = "0013_bulk_jobs_user_created_id_index"
+branch_labels = None
+depends_on = None
+
+# columns mapped with models.base.MicroCredits (BIGINT count of 1e-6 credits)
+MICRO_CREDIT_COLUMNS = {
+    "users": ("credits",),
+    "teams": ("credits",),
+    "team_balances": ("balance",),
+    "credit_reservations": ("amount",),
+    "credit_transactions": ("amount", "balance_after"),
+    "team_credit_transactions": ("amount", "balance_after"),
+    "bulk_jobs": ("estimated_cost",),
+}
+
+MICRO_CREDITS_SCALE = 1_000_000
+
+_COLUMN_TYPES = sa.text(
+    "SELECT column_name, data_type FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = :table"
+)
+
+def _columns(table, bigint):
+    """MicroCredits columns present on `table` whose type is (or is not) BIGINT."""
+    types = dict(op.get_bind().execute(_COLUMN_TYPES, {"table": table}).fetchall())
+    return [c for c in MICRO_CREDIT_COLUMNS[table] if c in types and (types[c] == "bigint") == bigint]
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # databases created before the switch still hold NUMERIC credits; fresh
+    # ones already create BIGINT, so only columns not yet bigint are touched.
+    # One ALTER per table so each table is rewritten once.
+    for table in MICRO_CREDIT_COLUMNS:
+        cols = _columns(table, bigint=False)
+        if cols:
+            op.execute(
+                f"ALTER TABLE {table} "
+                + ", ".join(
+                    f"ALTER COLUMN {c} TYPE BIGINT USING round({c} * {MICRO_CREDITS_SCALE})::bigint"
+                    for c in cols
+                )
+            )
+
+def downgrade():
+    for table in MICRO_CREDIT_COLUMNS:
+        cols = _columns(table, bigint=True)
+        if cols:
+            op.execute(
+                f"ALTER TABLE {table} "
+                + ", ".join(
+                    f"ALTER COLUMN {c} TYPE NUMERIC(18,6) USING ({c}::numeric / {MICRO_CREDITS_SCALE})"
+                    for c in cols
+                )
+            )
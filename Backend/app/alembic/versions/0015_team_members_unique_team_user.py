@@ -0,0 +1,65 @@
+# backend/app/alembic/versions/0015_team_members_unique_team_user.py
+"""enforce one team_members row per (team_id, user_id)
+
+Removes duplicate memberships, builds the unique index without blocking
+writes and attaches it as uq_team_members_team_user, the constraint the
+add-member INSERT .. ON CONFLICT paths name. ix_team_members_team_id is
+dropped afterwards: team_id leads the unique index.
+
+Revision ID: 0015_team_members_unique_team_user
+Revises: 0014_credits_to_micro_bigint
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import concurrent_block, migration_timeouts
+
+# revision identifiers, used by Alembic.
+revision = "0015_team_members_unique_team_user"
+down_revision = "0014_credits_to_micro_bigint"
+branch_labels = None
+depends_on = None
+
+CONSTRAINT = "uq_team_members_team_user"
+
+_HAS_CONSTRAINT = sa.text(
+    "SELECT 1 FROM pg_constraint "
+    "WHERE conname = :name AND conrelid = CAST('team_members' AS regclass)"
+)
+
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # databases created with Base.metadata.create_all already have it
+    if not op.get_bind().execute(_HAS_CONSTRAINT, {"name": CONSTRAINT}).scalar():
+        # keep the oldest membership of each (team, user) pair
+        op.execute(
+            """
+            DELETE FROM team_members tm
+            USING team_members older
+            WHERE older.team_id = tm.team_id
+              AND older.user_id = tm.user_id
+              AND older.id < tm.id
+            """
+        )
+
+        with concurrent_block():
+            # a failed CONCURRENTLY build leaves an INVALID index behind
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {CONSTRAINT}")
+            op.execute(f"CREATE UNIQUE INDEX CONCURRENTLY {CONSTRAINT} ON team_members (team_id, user_id)")
+
+        # catalog-only: the index is already built and validated
+        op.execute(f"ALTER TABLE team_members ADD CONSTRAINT {CONSTRAINT} UNIQUE USING INDEX {CONSTRAINT}")
+
+    # prefix of the unique index above
+    with concurrent_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_team_members_team_id")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_team_members_team_id ON team_members (team_id)")
+    # dropping the constraint drops its index too
+    op.execute(f"ALTER TABLE team_members DROP CONSTRAINT IF EXISTS {CONSTRAINT}")
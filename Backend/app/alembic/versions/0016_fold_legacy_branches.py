@@ -0,0 +1,126 @@
+# backend/app/alembic/versions/0016_fold_legacy_branches.py
+"""fold the removed side branches into the chain: stripe_customer_id, extractor_jobs.team_id, users.plan index, subscriptions, fk_bulkjob_team
+
+The versions directory used to hold several extra roots
+(0001_add_job_id_to_credit_reservations .. 0009_seed_plans,
+20250101_01 .. 20250101_02, 20251122_add_teams_and_billing and
+team_billing_001) next to 0001_initial, so `alembic upgrade head` stopped
+at "multiple heads". Everything they created that the models map and the
+chain did not is created here, including the fk_bulkjob_team foreign key.
+Every statement is guarded, so databases that ran one of those branches
+only get what is missing.
+
+Revision ID: 0016_fold_legacy_branches
+Revises: 0015_team_members_unique_team_user
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from backend.app.utils.migrations import concurrent_block, create_index_concurrently, migration_timeouts
+
+# revision identifiers, used by Alembic.
+revision = "0016_fold_legacy_branches"
+down_revision = "0015_team_members_unique_team_user"
+branch_labels = None
+depends_on = None
+
+_HAS_CONSTRAINT = sa.text(
+    "SELECT 1 FROM pg_constraint "
+    "WHERE conname = :name AND conrelid = CAST('bulk_jobs' AS regclass)"
+)
+
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    # nullable, no default: catalog-only changes, no table rewrite
+    op.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS stripe_customer_id VARCHAR(255)")
+    op.execute("ALTER TABLE teams ADD COLUMN IF NOT EXISTS stripe_customer_id VARCHAR(255)")
+    op.execute("ALTER TABLE extractor_jobs ADD COLUMN IF NOT EXISTS team_id INTEGER")
+
+    # subscriptions (from 20250101_01 / 20250101_02)
+    if "subscriptions" not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            "subscriptions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("stripe_subscription_id", sa.String(255), nullable=False),
+            sa.Column("stripe_customer_id", sa.String(255), nullable=False),
+            sa.Column("stripe_price_id", sa.String(255), nullable=True),
+            sa.Column("stripe_product_id", sa.String(255), nullable=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("plan_id", sa.Integer(), sa.ForeignKey("plans.id", ondelete="SET NULL"), nullable=True),
+            sa.Column("price_amount", sa.Numeric(10, 2), nullable=True),
+            sa.Column("price_interval", sa.String(20), nullable=True),
+            sa.Column("status", sa.String(50), nullable=False),
+            sa.Column("cancel_at_period_end", sa.Boolean(), server_default="false"),
+            sa.Column("current_period_start", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("current_period_end", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("canceled_at", sa.DateTime(timezone=True), nullable=True),
+            # Stripe payload, queryable with -> / ->> / @>
+            sa.Column("raw", postgresql.JSONB(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        )
+        # the set_updated_at() trigger from 0009 only covers tables that existed then
+        op.execute(
+            "CREATE TRIGGER trg_set_updated_at BEFORE UPDATE ON subscriptions "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+    else:
+        # the old branch created it without the columns the model maps
+        op.execute(
+            "ALTER TABLE subscriptions "
+            "ADD COLUMN IF NOT EXISTS stripe_price_id VARCHAR(255), "
+            "ADD COLUMN IF NOT EXISTS stripe_product_id VARCHAR(255), "
+            "ADD COLUMN IF NOT EXISTS plan_id INTEGER REFERENCES plans (id) ON DELETE SET NULL, "
+            "ADD COLUMN IF NOT EXISTS canceled_at TIMESTAMPTZ"
+        )
+
+    # bulk_jobs.team_id -> teams (from 20251122_add_teams_and_billing; 0002
+    # adds the column without it). NOT VALID: no scan of bulk_jobs under the
+    # ALTER's lock, only new and updated rows are checked
+    if not op.get_bind().execute(_HAS_CONSTRAINT, {"name": "fk_bulkjob_team"}).scalar():
+        op.execute(
+            "ALTER TABLE bulk_jobs ADD CONSTRAINT fk_bulkjob_team "
+            "FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE SET NULL NOT VALID"
+        )
+        # rows pointing at deleted teams would fail VALIDATE below
+        op.execute(
+            "UPDATE bulk_jobs b SET team_id = NULL "
+            "WHERE b.team_id IS NOT NULL "
+            "AND NOT EXISTS (SELECT 1 FROM teams t WHERE t.id = b.team_id)"
+        )
+
+    # CONCURRENTLY must run outside the migration transaction
+    with concurrent_block():
+        # own transaction: the ALTER above has committed and released its
+        # lock; VALIDATE only takes SHARE UPDATE EXCLUSIVE, so reads and
+        # writes on bulk_jobs continue during the scan (no-op once valid)
+        op.execute("ALTER TABLE bulk_jobs VALIDATE CONSTRAINT fk_bulkjob_team")
+
+        create_index_concurrently("ix_users_plan", "ON users (plan)")
+        create_index_concurrently("ix_extractor_jobs_team_id", "ON extractor_jobs (team_id)")
+
+        # one row per Stripe subscription, enforced by the DB
+        create_index_concurrently("uq_subscriptions_stripe_sub_id", "ON subscriptions (stripe_subscription_id)", unique=True)
+        create_index_concurrently("ix_subscriptions_user_id", "ON subscriptions (user_id)")
+        create_index_concurrently("ix_subscriptions_plan_id", "ON subscriptions (plan_id)")
+        create_index_concurrently("idx_subscriptions_status", "ON subscriptions (status)")
+        # entitlement / dashboard lookups only look at live subscriptions
+        create_index_concurrently("ix_subscriptions_active_user", "ON subscriptions (user_id) WHERE status IN ('active', 'trialing')")
+        create_index_concurrently("ix_subscriptions_raw_gin", "ON subscriptions USING GIN (raw jsonb_path_ops)")
+
+
+def downgrade():
+    # reverse order of creation (subscriptions indexes go with the table)
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_extractor_jobs_team_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_plan")
+
+    op.execute("DROP TABLE IF EXISTS subscriptions")
+    op.execute("ALTER TABLE bulk_jobs DROP CONSTRAINT IF EXISTS fk_bulkjob_team")
+    op.execute("ALTER TABLE extractor_jobs DROP COLUMN IF EXISTS team_id")
+    op.execute("ALTER TABLE teams DROP COLUMN IF EXISTS stripe_customer_id")
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS stripe_customer_id")
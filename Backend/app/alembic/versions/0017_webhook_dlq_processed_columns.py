@@ -0,0 +1,81 @@
+# backend/app/alembic/versions/0017_webhook_dlq_processed_columns.py
+"""webhook_dlq: error_message -> error, resolved -> processed, add processed_at
+
+Brings existing webhook_dlq tables in line with the WebhookDLQ model that
+WebhookDLQRepository.list_rows / mark_processed_many query. Databases
+without the table get it created with the model's columns.
+
+Revision ID: 0017_webhook_dlq_processed_columns
+Revises: 0016_fold_legacy_branches
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from backend.app.utils.migrations import migration_timeouts
+
+# revision identifiers, used by Alembic.
+revision = "0017_webhook_dlq_processed_columns"
+down_revision = "0016_fold_legacy_branches"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # fail fast instead of queueing behind long transactions
+    migration_timeouts()
+
+    inspector = sa.inspect(op.get_bind())
+    if "webhook_dlq" not in inspector.get_table_names():
+        op.create_table(
+            "webhook_dlq",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("url", sa.String(500), nullable=False),
+            sa.Column("payload", sa.Text(), nullable=False),
+            sa.Column("headers", sa.Text(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=True),
+            sa.Column("processed", sa.Boolean(), nullable=False, server_default="false"),
+            sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()")),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        return
+
+    columns = {c["name"] for c in inspector.get_columns("webhook_dlq")}
+    # renames are catalog-only
+    if "error_message" in columns and "error" not in columns:
+        op.execute("ALTER TABLE webhook_dlq RENAME COLUMN error_message TO error")
+    if "resolved" in columns and "processed" not in columns:
+        op.execute("ALTER TABLE webhook_dlq RENAME COLUMN resolved TO processed")
+    op.execute(
+        "ALTER TABLE webhook_dlq "
+        "ADD COLUMN IF NOT EXISTS error TEXT, "
+        "ADD COLUMN IF NOT EXISTS processed BOOLEAN, "
+        "ADD COLUMN IF NOT EXISTS processed_at TIMESTAMPTZ"
+    )
+
+    # the DLQ only holds failed deliveries: one UPDATE, no paging needed.
+    # resolved had no NOT NULL / default; entries resolved before this
+    # revision take their last update as processed_at
+    op.execute(
+        "UPDATE webhook_dlq SET "
+        "processed = COALESCE(processed, false), "
+        "processed_at = CASE WHEN processed THEN COALESCE(processed_at, updated_at, created_at) END "
+        "WHERE processed IS NULL OR (processed AND processed_at IS NULL)"
+    )
+    op.execute(
+        "ALTER TABLE webhook_dlq "
+        "ALTER COLUMN processed SET DEFAULT false, "
+        "ALTER COLUMN processed SET NOT NULL"
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE webhook_dlq "
+        "DROP COLUMN processed_at, "
+        "ALTER COLUMN processed DROP NOT NULL, "
+        "ALTER COLUMN processed DROP DEFAULT"
+    )
+    op.execute("ALTER TABLE webhook_dlq RENAME COLUMN processed TO resolved")
+    op.execute("ALTER TABLE webhook_dlq RENAME COLUMN error TO error_message")
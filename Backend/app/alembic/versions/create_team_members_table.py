@@ -1,26 +0,0 @@
-"""create team_members table"""
-
-from alembic import op
-import sqlalchemy as sa
-
-revision = "0007_create_team_members"
-down_revision = "0006_create_teams"
-branch_labels = None
-depends_on = None
-
-def upgrade():
-    op.create_table(
-        "team_members",
-        sa.Column("id", sa.Integer(), primary_key=True),
-        sa.Column("team_id", sa.Integer(), nullable=False),
-        sa.Column("user_id", sa.Integer(), nullable=False),
-        sa.Column("role", sa.String(50), server_default="member"),
-        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-    op.create_index("ix_team_members_team_id", "team_members", ["team_id"])
-    op.create_index("ix_team_members_user_id", "team_members", ["user_id"])
-
-def downgrade():
-    op.drop_index("ix_team_members_user_id", table_name="team_members")
-    op.drop_index("ix_team_members_team_id", table_name="team_members")
-    op.drop_table("team_members")
@@ -1,12 +1,75 @@
+import csv
+import io
+
+import redis
+import sqlalchemy as sa
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from backend.app.config import settings
+from backend.app.db import SessionLocal, get_db
+from backend.app.models.api_key import ApiKey
+from backend.app.models.credit_reservation import CreditReservation
+from backend.app.models.decision_maker import DecisionMaker
+from backend.app.models.usage_log import UsageLog
+from backend.app.models.user import User
+from backend.app.models.verification_result import VerificationResult
+from backend.app.services.api_key_service import (
+    reset_all_api_keys_usage,
+    reset_api_key_usage,
+    set_api_key_active,
+)
+from backend.app.services.credits_service import get_balance
 from backend.app.utils.security import get_current_admin
-from backend.app.services.deliverability_monitor import compute_domain_score
+from backend.app.services.deliverability_monitor import (
+    compute_domain_score,
+    ensure_domain_aggregates,
+    GOOD_RATIO_ZSET,
+    FAIL_RATE_ZSET,
+    TOTALS_HASH,
+)
 from backend.app.services.mx_lookup import choose_mx_for_domain
 
 router = APIRouter(prefix="/v1/admin", tags=["Admin"])
 
 # --- Existing endpoints above ---
 
+# one connection pool per process, shared by every admin request
+_REDIS_POOL = redis.ConnectionPool.from_url(settings.REDIS_URL, max_connections=32)
+
+
+def _redis():
+    return redis.Redis(connection_pool=_REDIS_POOL)
+
+
+def _top_domains(r, zset: str, limit: int):
+    """
+    [(domain, good, bad, score)] for the `limit` highest-scored members of a
+    ranking zset maintained by record_domain_result: O(log N + K) on Redis,
+    plus one MGET for the K domains' counters.
+    """
+    if limit <= 0:
+        return []
+
+    ensure_domain_aggregates(r)
+
+    top = r.zrevrange(zset, 0, limit - 1, withscores=True)
+    if not top:
+        return []
+
+    domains = [member.decode() for member, _ in top]
+    keys = []
+    for domain in domains:
+        keys += [f"domain:{domain}:good", f"domain:{domain}:bad"]
+    values = r.mget(keys)
+
+    return [
+        (domain, int(values[2 * i] or 0), int(values[2 * i + 1] or 0), score)
+        for i, (domain, (_, score)) in enumerate(zip(domains, top))
+    ]
+
 
 @router.get("/domain-reputation/{domain}")
 def get_domain_reputation(domain: str, admin = Depends(get_current_admin)):
@@ -39,61 +102,27 @@ def top_good_domains(limit: int = 50, admin = Depends(get_current_admin)):
     Returns domains with highest good:bad ratio.
     Based on Redis counters.
     """
-    import redis, json
-
     try:
-        r = redis.from_url("redis://redis:6379/0")
-    except:
+        top = _top_domains(_redis(), GOOD_RATIO_ZSET, limit)
+    except redis.exceptions.ConnectionError:
         raise HTTPException(500, "redis_not_connected")
 
-    keys = r.keys("domain:*:good")
-    final = []
-
-    for k in keys:
-        domain = k.decode().split(":")[1]
-        good = int(r.get(f"domain:{domain}:good") or 0)
-        bad = int(r.get(f"domain:{domain}:bad") or 0)
-        total = good + bad
-        if total == 0:
-            continue
-        ratio = good / total
-        final.append({
-            "domain": domain,
-            "good": good,
-            "bad": bad,
-            "ratio": ratio
-        })
-
-    final_sorted = sorted(final, key=lambda x: x["ratio"], reverse=True)
-    return final_sorted[:limit]
+    return [
+        {"domain": domain, "good": good, "bad": bad, "ratio": ratio}
+        for domain, good, bad, ratio in top
+    ]
 
 @router.get("/domains/top-bad")
 def top_bad_domains(limit: int = 50, admin = Depends(get_current_admin)):
-    import redis
     try:
-        r = redis.from_url("redis://redis:6379/0")
-    except:
+        top = _top_domains(_redis(), FAIL_RATE_ZSET, limit)
+    except redis.exceptions.ConnectionError:
         raise HTTPException(500, "redis_not_connected")
 
-    keys = r.keys("domain:*:bad")
-    final = []
-
-    for k in keys:
-        domain = k.decode().split(":")[1]
-        good = int(r.get(f"domain:{domain}:good") or 0)
-        bad = int(r.get(f"domain:{domain}:bad") or 0)
-        total = good + bad
-        if total == 0:
-            continue
-        final.append({
-            "domain": domain,
-            "good": good,
-            "bad": bad,
-            "fail_rate": bad / total
-        })
-
-    final_sorted = sorted(final, key=lambda x: x["fail_rate"], reverse=True)
-    return final_sorted[:limit]
+    return [
+        {"domain": domain, "good": good, "bad": bad, "fail_rate": fail_rate}
+        for domain, good, bad, fail_rate in top
+    ]
 
 
 @router.get("/domain-trends/{domain}")
@@ -102,16 +131,14 @@ def domain_trends(domain: str, admin = Depends(get_current_admin)):
     In future you will store time-series. 
     For now return historical good/bad counts (real-time).
     """
-    import redis
     domain = domain.lower()
 
     try:
-        r = redis.from_url("redis://redis:6379/0")
-    except:
+        values = _redis().mget(f"domain:{domain}:good", f"domain:{domain}:bad")
+    except redis.exceptions.ConnectionError:
         raise HTTPException(500, "redis_not_connected")
 
-    good = int(r.get(f"domain:{domain}:good") or 0)
-    bad = int(r.get(f"domain:{domain}:bad") or 0)
+    good, bad = (int(v or 0) for v in values)
 
     return {
         "domain": domain,
@@ -126,17 +153,16 @@ def deliverability_summary(admin = Depends(get_current_admin)):
     """
     Aggregated deliverability KPI for admin dashboard.
     """
-    import redis
+    # O(1): totals are maintained by record_domain_result
+    r = _redis()
     try:
-        r = redis.from_url("redis://redis:6379/0")
-    except:
+        ensure_domain_aggregates(r)
+        totals = r.hgetall(TOTALS_HASH)
+    except redis.exceptions.ConnectionError:
         raise HTTPException(500, "redis_not_connected")
 
-    good_keys = r.keys("domain:*:good")
-    bad_keys = r.keys("domain:*:bad")
-
-    good_total = sum(int(r.get(k) or 0) for k in good_keys)
-    bad_total = sum(int(r.get(k) or 0) for k in bad_keys)
+    good_total = int(totals.get(b"good", 0))
+    bad_total = int(totals.get(b"bad", 0))
 
     total = good_total + bad_total
     if total == 0:
@@ -153,91 +179,78 @@ def deliverability_summary(admin = Depends(get_current_admin)):
 
 
 
+# The list endpoints below SELECT only the columns they return and read
+# plain row mappings: no full-width rows, no ORM instances per result.
+
+# verification_results has no risk_score column; the field is kept in the
+# response shape as null
+_VERIFICATION_COLUMNS = (
+    VerificationResult.email,
+    VerificationResult.status,
+    sa.null().label("risk_score"),
+    VerificationResult.created_at,
+)
+
+
 @router.get("/recent-failures")
-def recent_failures(limit: int = 100, admin = Depends(get_current_admin)):
+def recent_failures(limit: int = 100, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
     """
     Fetch recent invalid emails from DB.
     """
-    db = SessionLocal()
-    try:
-        rows = db.query(VerificationResult)\
-                 .filter(VerificationResult.status == "invalid")\
-                 .order_by(VerificationResult.created_at.desc())\
-                 .limit(limit).all()
-
-        return [{
-            "email": r.email,
-            "status": r.status,
-            "risk_score": r.risk_score,
-            "created_at": r.created_at
-        } for r in rows]
-    finally:
-        db.close()
+    stmt = sa.select(*_VERIFICATION_COLUMNS)\
+             .where(VerificationResult.status == "invalid")\
+             .order_by(VerificationResult.created_at.desc())\
+             .limit(limit)
 
+    return [dict(r) for r in db.execute(stmt).mappings()]
 
-@router.get("/users")
-def admin_list_users(limit: int = 50, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        rows = db.query(User)\
-                 .order_by(User.created_at.desc())\
-                 .limit(limit).all()
-        return [{"id": u.id, "email": u.email, "is_active": u.is_active,
-                 "created_at": u.created_at} for u in rows]
-    finally:
-        db.close()
 
+@router.get("/users")
+def admin_list_users(limit: int = 50, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    stmt = sa.select(User.id, User.email, User.is_active, User.created_at)\
+             .order_by(User.created_at.desc())\
+             .limit(limit)
+    return [dict(u) for u in db.execute(stmt).mappings()]
 
-from backend.app.services.credits_service import get_balance
 
 @router.get("/user/{user_id}/credits")
-def admin_user_credits(user_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        bal = get_balance(db, user_id)
-        return {"user_id": user_id, "balance": float(bal)}
-    finally:
-        db.close()
+def admin_user_credits(user_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    bal = get_balance(db, user_id)
+    return {"user_id": user_id, "balance": float(bal)}
 
 
 
 @router.get("/user/{user_id}/verifications")
-def admin_user_verifications(user_id: int, limit: int = 100, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        rows = db.query(VerificationResult)\
-                 .filter(VerificationResult.user_id == user_id)\
-                 .order_by(VerificationResult.created_at.desc())\
-                 .limit(limit).all()
-
-        return [{
-            "email": r.email,
-            "status": r.status,
-            "risk_score": r.risk_score,
-            "created_at": r.created_at
-        } for r in rows]
-    finally:
-        db.close()
+def admin_user_verifications(user_id: int, limit: int = 100, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    stmt = sa.select(*_VERIFICATION_COLUMNS)\
+             .where(VerificationResult.user_id == user_id)\
+             .order_by(VerificationResult.created_at.desc())\
+             .limit(limit)
+
+    return [dict(r) for r in db.execute(stmt).mappings()]
 
 
 
 @router.get("/bulk-jobs")
-def admin_bulk_jobs(limit: int = 50, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        rows = db.query(CreditReservation)\
-                 .order_by(CreditReservation.created_at.desc())\
-                 .limit(limit).all()
-        return [{
-            "job_id": r.job_id,
-            "user_id": r.user_id,
-            "amount_reserved": float(r.amount),
-            "locked": r.locked,
-            "expires_at": r.expires_at,
-            "created_at": r.created_at
-        } for r in rows]
-    finally:
-        db.close()
+def admin_bulk_jobs(limit: int = 50, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    stmt = sa.select(
+                 CreditReservation.job_id,
+                 CreditReservation.user_id,
+                 CreditReservation.amount,
+                 CreditReservation.locked,
+                 CreditReservation.expires_at,
+                 CreditReservation.created_at,
+             )\
+             .order_by(CreditReservation.created_at.desc())\
+             .limit(limit)
+    return [{
+        "job_id": r["job_id"],
+        "user_id": r["user_id"],
+        "amount_reserved": float(r["amount"]),
+        "locked": r["locked"],
+        "expires_at": r["expires_at"],
+        "created_at": r["created_at"]
+    } for r in db.execute(stmt).mappings()]
 
 
 @router.delete("/clear-domain-cache/{domain}")
@@ -245,66 +258,69 @@ def clear_domain_cache(domain: str, admin = Depends(get_current_admin)):
     """
     Clears cached reputation for a domain.
     """
-    import redis
     try:
-        r = redis.from_url("redis://redis:6379/0")
-        r.delete(f"domain:reputation:{domain}")
-        return {"cleared": domain}
-    except:
+        _redis().delete(f"domain:reputation:{domain}")
+    except redis.exceptions.ConnectionError:
         raise HTTPException(500, "redis_not_connected")
+    return {"cleared": domain}
 
 
 
 
-from backend.app.models.decision_maker import DecisionMaker
-from backend.app.db import SessionLocal
-
 @router.get("/decision-makers")
 def admin_list_decision_makers(
     company: str = None,
     domain: str = None,
     verified: bool = None,
     limit: int = 100,
-    admin = Depends(get_current_admin)
+    admin = Depends(get_current_admin),
+    db: Session = Depends(get_db)
 ):
     """
     Admin: List decision makers with optional filters.
     """
-    db = SessionLocal()
-    try:
-        q = db.query(DecisionMaker)
+    stmt = sa.select(
+        DecisionMaker.id,
+        DecisionMaker.company,
+        DecisionMaker.domain,
+        DecisionMaker.first_name,
+        DecisionMaker.last_name,
+        DecisionMaker.title,
+        DecisionMaker.email,
+        DecisionMaker.source,
+        DecisionMaker.verified,
+        DecisionMaker.created_at,
+    )
 
-        if company:
-            q = q.filter(DecisionMaker.company.ilike(f"%{company}%"))
-        if domain:
-            q = q.filter(DecisionMaker.domain == domain.lower())
-        if verified is not None:
-            q = q.filter(DecisionMaker.verified == verified)
+    if company:
+        stmt = stmt.where(DecisionMaker.company.ilike(f"%{company}%"))
+    if domain:
+        stmt = stmt.where(DecisionMaker.domain == domain.lower())
+    if verified is not None:
+        stmt = stmt.where(DecisionMaker.verified == verified)
 
-        q = q.order_by(DecisionMaker.created_at.desc()).limit(limit)
-        rows = q.all()
-
-        return [
-            {
-                "id": r.id,
-                "company": r.company,
-                "domain": r.domain,
-                "name": r.full_name(),
-                "title": r.title,
-                "email": r.email,
-                "source": r.source,
-                "verified": r.verified,
-                "created_at": r.created_at,
-            }
-            for r in rows
-        ]
-    finally:
-        db.close()
+    stmt = stmt.order_by(DecisionMaker.created_at.desc()).limit(limit)
+
+    return [
+        {
+            "id": r["id"],
+            "company": r["company"],
+            "domain": r["domain"],
+            # same as DecisionMaker.full_name()
+            "name": " ".join(p for p in (r["first_name"], r["last_name"]) if p),
+            "title": r["title"],
+            "email": r["email"],
+            "source": r["source"],
+            "verified": r["verified"],
+            "created_at": r["created_at"],
+        }
+        for r in db.execute(stmt).mappings()
+    ]
 
 
 
-import csv
-from fastapi.responses import StreamingResponse
+# rows fetched per server-side cursor batch / written per yielded CSV chunk
+CSV_EXPORT_BATCH = 1000
 
 @router.get("/decision-makers/export")
 def export_decision_makers_csv(
@@ -317,6 +333,8 @@ def export_decision_makers_csv(
     Admin: Export decision makers as CSV file.
     """
 
+    # not Depends(get_db): the session must stay open while the response
+    # streams, so it is closed by the BackgroundTask below instead
     db = SessionLocal()
     try:
         q = db.query(DecisionMaker)
@@ -328,113 +346,104 @@ def export_decision_makers_csv(
         if verified is not None:
             q = q.filter(DecisionMaker.verified == verified)
 
-        q = q.order_by(DecisionMaker.created_at.desc())
-        rows = q.all()
+        # server-side cursor: rows arrive CSV_EXPORT_BATCH at a time
+        # instead of being materialized up front
+        rows = q.order_by(DecisionMaker.created_at.desc()).yield_per(CSV_EXPORT_BATCH)
 
         # generator stream — low memory usage
         def iter_csv():
-            header = [
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow([
                 "id", "company", "domain", "first_name", "last_name",
                 "title", "email", "verified", "source", "created_at"
-            ]
-            yield ",".join(header) + "\n"
-
-            for r in rows:
-                yield ",".join([
-                    str(r.id or ""),
-                    str(r.company or ""),
-                    str(r.domain or ""),
-                    str(r.first_name or ""),
-                    str(r.last_name or ""),
-                    str(r.title or ""),
-                    str(r.email or ""),
-                    str(r.verified),
-                    str(r.source or ""),
-                    str(r.created_at or "")
-                ]) + "\n"
-
+            ])
+
+            for n, r in enumerate(rows, 1):
+                writer.writerow([
+                    r.id, r.company, r.domain, r.first_name, r.last_name,
+                    r.title, r.email, r.verified, r.source, r.created_at
+                ])
+                if n % CSV_EXPORT_BATCH == 0:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+
+            yield buf.getvalue()
+
+        # the session has to outlive this function: close it once the
+        # response has been fully streamed
         return StreamingResponse(
             iter_csv(),
             media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=decision_makers.csv"}
+            headers={"Content-Disposition": "attachment; filename=decision_makers.csv"},
+            background=BackgroundTask(db.close)
         )
 
-    finally:
+    except Exception:
         db.close()
+        raise
 
 
 @router.get("/decision-makers/{dm_id}")
-def admin_get_decision_maker(dm_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        r = db.query(DecisionMaker).get(dm_id)
-        if not r:
-            raise HTTPException(status_code=404, detail="not_found")
-        return {
-            "id": r.id,
-            "company": r.company,
-            "domain": r.domain,
-            "first_name": r.first_name,
-            "last_name": r.last_name,
-            "title": r.title,
-            "email": r.email,
-            "verified": r.verified,
-            "source": r.source,
-            "raw": r.raw,
-            "created_at": r.created_at,
-        }
-    finally:
-        db.close()
+def admin_get_decision_maker(dm_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    r = db.get(DecisionMaker, dm_id)
+    if not r:
+        raise HTTPException(status_code=404, detail="not_found")
+    return {
+        "id": r.id,
+        "company": r.company,
+        "domain": r.domain,
+        "first_name": r.first_name,
+        "last_name": r.last_name,
+        "title": r.title,
+        "email": r.email,
+        "verified": r.verified,
+        "source": r.source,
+        "raw": r.raw,
+        "created_at": r.created_at,
+    }
 
 
 
 @router.delete("/decision-makers/{dm_id}")
-def admin_delete_decision_maker(dm_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        r = db.query(DecisionMaker).get(dm_id)
-        if not r:
-            raise HTTPException(status_code=404, detail="not_found")
-
-        db.delete(r)
-        db.commit()
-        return {"deleted": dm_id}
+def admin_delete_decision_maker(dm_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    # one DELETE .. RETURNING instead of SELECT then DELETE
+    deleted = db.execute(
+        sa.delete(DecisionMaker)
+        .where(DecisionMaker.id == dm_id)
+        .returning(DecisionMaker.id)
+    ).scalar()
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="not_found")
 
-    finally:
-        db.close()
+    db.commit()
+    return {"deleted": dm_id}
 
 
-from backend.app.models.api_key import ApiKey
 
 @router.get("/api-keys")
-def admin_list_api_keys(limit: int = 100, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        rows = db.query(ApiKey).order_by(ApiKey.created_at.desc()).limit(limit).all()
-        return [{"id": r.id, "key": r.key, "user_id": r.user_id, "active": r.active, "daily_limit": r.daily_limit, "rate_limit_per_sec": r.rate_limit_per_sec} for r in rows]
-    finally:
-        db.close()
+def admin_list_api_keys(limit: int = 100, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    # only the hash of a key is stored; list a short prefix of it to tell keys
+    # apart, never the full hash (and nothing named like a usable key)
+    stmt = sa.select(
+        ApiKey.id, sa.func.substr(ApiKey.key_hash, 1, 8).label("key_hash_prefix"), ApiKey.user_id, ApiKey.active,
+        ApiKey.daily_limit, ApiKey.rate_limit_per_sec,
+    ).order_by(ApiKey.created_at.desc()).limit(limit)
+    return [dict(r) for r in db.execute(stmt).mappings()]
 
 @router.post("/api-keys/{api_key_id}/update-rate")
-def admin_update_api_key_rate(api_key_id: int, rate_limit_per_sec: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        ak = db.query(ApiKey).get(api_key_id)
-        if not ak:
-            raise HTTPException(status_code=404, detail="api_key_not_found")
-        ak.rate_limit_per_sec = int(rate_limit_per_sec)
-        db.commit()
-        return {"id": ak.id, "rate_limit_per_sec": ak.rate_limit_per_sec}
-    finally:
-        db.close()
+def admin_update_api_key_rate(api_key_id: int, rate_limit_per_sec: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    ak = db.query(ApiKey).get(api_key_id)
+    if not ak:
+        raise HTTPException(status_code=404, detail="api_key_not_found")
+    ak.rate_limit_per_sec = int(rate_limit_per_sec)
+    db.commit()
+    return {"id": ak.id, "rate_limit_per_sec": ak.rate_limit_per_sec}
 
 
 @router.get("/usage", summary="Admin Usage Viewer")
-def admin_usage(limit: int = 100, admin=Depends(get_current_admin)):
-    from backend.app.db import SessionLocal
-    from backend.app.models.usage_log import UsageLog
-
-    db = SessionLocal()
+def admin_usage(limit: int = 100, admin=Depends(get_current_admin), db: Session = Depends(get_db)):
     rows = (
         db.query(UsageLog)
         .order_by(UsageLog.id.desc())
@@ -458,50 +467,27 @@ def admin_usage(limit: int = 100, admin=Depends(get_current_admin)):
 
     return out
 
-# inside admin.py (append)
-
-from backend.app.models.api_key import ApiKey
-from backend.app.services.api_key_service import set_api_key_active, reset_api_key_usage
-
 @router.get("/api-keys/{api_key_id}/usage")
-def admin_get_api_key_usage(api_key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        ak = db.query(ApiKey).get(api_key_id)
-        if not ak:
-            raise HTTPException(status_code=404, detail="api_key_not_found")
-        return {"id": ak.id, "key": ak.key, "user_id": ak.user_id, "daily_limit": ak.daily_limit, "used_today": ak.used_today, "rate_limit_per_sec": ak.rate_limit_per_sec, "active": ak.active}
-    finally:
-        db.close()
+def admin_get_api_key_usage(api_key_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    ak = db.query(ApiKey).get(api_key_id)
+    if not ak:
+        raise HTTPException(status_code=404, detail="api_key_not_found")
+    return {"id": ak.id, "key_hash_prefix": ak.key_hash[:8], "user_id": ak.user_id, "daily_limit": ak.daily_limit, "used_today": ak.used_today, "rate_limit_per_sec": ak.rate_limit_per_sec, "active": ak.active}
 
 @router.post("/api-keys/{api_key_id}/disable")
-def admin_disable_api_key(api_key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        ak = set_api_key_active(db, api_key_id, active=False)
-        return {"id": ak.id, "active": ak.active}
-    finally:
-        db.close()
+def admin_disable_api_key(api_key_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    ak = set_api_key_active(db, api_key_id, active=False)
+    return {"id": ak.id, "active": ak.active}
 
 @router.post("/api-keys/{api_key_id}/enable")
-def admin_enable_api_key(api_key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        ak = set_api_key_active(db, api_key_id, active=True)
-        return {"id": ak.id, "active": ak.active}
-    finally:
-        db.close()
+def admin_enable_api_key(api_key_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    ak = set_api_key_active(db, api_key_id, active=True)
+    return {"id": ak.id, "active": ak.active}
 
 @router.post("/api-keys/{api_key_id}/reset-usage")
-def admin_reset_api_key_usage(api_key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        ak = reset_api_key_usage(db, api_key_id)
-        return {"id": ak.id, "used_today": ak.used_today}
-    finally:
-        db.close()
-
-from backend.app.services.api_key_service import reset_all_api_keys_usage
+def admin_reset_api_key_usage(api_key_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    ak = reset_api_key_usage(db, api_key_id)
+    return {"id": ak.id, "used_today": ak.used_today}
 
 @router.post("/api-keys/reset-all", summary="Reset usage for ALL API keys")
 def admin_reset_all(admin=Depends(get_current_admin)):
@@ -509,38 +495,9 @@ def admin_reset_all(admin=Depends(get_current_admin)):
     return {"status": "ok", "message": "all api keys usage reset"}
 
 
-@router.post("/api-keys/{key_id}/reset-usage")
-def reset_api_key_usage(key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    from backend.app.services.api_key_service import reset_usage
-
-    out = reset_usage(db, key_id)
-    return out
-
-@router.get("/api-keys")
-def list_api_keys(admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    ApiKey = __import__("backend.app.models.api_key", fromlist=["ApiKey"]).ApiKey
-
-    rows = db.query(ApiKey).order_by(ApiKey.id.desc()).all()
-    return [
-        {
-            "id": r.id,
-            "user_id": r.user_id,
-            "active": r.active,
-            "daily_limit": r.daily_limit,
-            "used_today": r.used_today,
-            "created_at": str(r.created_at),
-        }
-        for r in rows
-                                  ]
-
-    @router.get("/api-keys/{key_id}")
-def get_api_key_details(key_id: int, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    ApiKey = __import__("backend.app.models.api_key", fromlist=["ApiKey"]).ApiKey
-
-    row = db.query(ApiKey).get(key_id)
+@router.get("/api-keys/{key_id}")
+def get_api_key_details(key_id: int, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    row = db.get(ApiKey, key_id)
     if not row:
         raise HTTPException(status_code=404, detail="not_found")
 
@@ -1,84 +1,49 @@
-
+# backend/app/api/v1/admin_analytics.py
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
-from datetime import datetime, timedelta
+from backend.app.db import get_db
+from sqlalchemy.orm import Session
 from sqlalchemy import func
+from backend.app.models.usage_log_daily import UsageLogDaily, UsageLogDailyUser, UsageLogDailyKey
+from backend.app.services.usage_rollup import KEYS_HLL_KEY, USERS_HLL_KEY, approx_unique, window_days
+from backend.app.utils.ttl_cache import ttl_cache
+
+# aggregates are polled by dashboards; serve repeats from memory for a minute
+ADMIN_ANALYTICS_CACHE_TTL = 60
 
-router = APIRouter(prefix="/api/v1/admin/analytics", tags=["admin-analytics"])
+router = APIRouter(prefix="/api/v1/admin/analytics", tags=["admin-analytics"], default_response_class=ORJSONResponse)
 
 @router.get("/usage-summary")
-def usage_summary(days: int = Query(7), admin = Depends(get_current_admin)):
+@ttl_cache(ttl=ADMIN_ANALYTICS_CACHE_TTL)
+def usage_summary(days: int = Query(7), admin = Depends(get_current_admin), db: Session = Depends(get_db)):
     """
-    Returns summary: total requests, total unique users, total api keys, top endpoints
+    Returns summary: total requests, total unique users, total api keys, top endpoints.
+    Read from the usage_log_daily rollups (whole UTC days, up to ~5 min behind).
     """
-    db = SessionLocal()
-    try:
-        since = datetime.utcnow() - timedelta(days=days)
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-        q_total = db.query(func.count(UsageLog.id)).filter(UsageLog.created_at >= since).scalar() or 0
-        q_users = db.query(func.count(func.distinct(UsageLog.user_id))).filter(UsageLog.created_at >= since).scalar() or 0
-        q_keys = db.query(func.count(func.distinct(UsageLog.api_key_id))).filter(UsageLog.created_at >= since).scalar() or 0
-        top_endpoints = db.query(UsageLog.endpoint, func.count(UsageLog.id).label("cnt")).filter(UsageLog.created_at >= since).group_by(UsageLog.endpoint).order_by(func.count(UsageLog.id).desc()).limit(10).all()
-        top = [{"endpoint": r[0], "count": int(r[1])} for r in top_endpoints]
-        return {"days": days, "total_requests": int(q_total), "unique_users": int(q_users), "unique_api_keys": int(q_keys), "top_endpoints": top}
-    finally:
-        db.close()
-
-@router.get("/daily-trends")
-def daily_trends(days: int = Query(30), admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-        data = []
-        for i in range(days):
-            dt = datetime.utcnow().date() - timedelta(days=i)
-            start = datetime(dt.year, dt.month, dt.day)
-            end = start + timedelta(days=1)
-            cnt = db.query(func.count(UsageLog.id)).filter(UsageLog.created_at >= start, UsageLog.created_at < end).scalar() or 0
-            data.append({"date": start.strftime("%Y-%m-%d"), "count": int(cnt)})
-        data.reverse()
-        return {"days": days, "series": data}
-    finally:
-        db.close()
-        # backend/app/api/v1/admin_analytics.py
-from fastapi import APIRouter, Depends, Query
-from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
-from datetime import datetime, timedelta
-from sqlalchemy import func
-
-router = APIRouter(prefix="/api/v1/admin/analytics", tags=["admin-analytics"])
-
-@router.get("/usage-summary")
-def usage_summary(days: int = Query(7), admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        since = datetime.utcnow() - timedelta(days=days)
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-        total = db.query(func.count(UsageLog.id)).filter(UsageLog.created_at >= since).scalar() or 0
-        users = db.query(func.count(func.distinct(UsageLog.user_id))).filter(UsageLog.created_at >= since).scalar() or 0
-        keys = db.query(func.count(func.distinct(UsageLog.api_key))).filter(UsageLog.created_at >= since).scalar() or 0
-        top = db.query(UsageLog.endpoint, func.count(UsageLog.id).label("cnt")).filter(UsageLog.created_at >= since).group_by(UsageLog.endpoint).order_by(func.count(UsageLog.id).desc()).limit(10).all()
-        top_list = [{"endpoint": r[0], "count": int(r[1])} for r in top]
-        return {"days": days, "total_requests": int(total), "unique_users": int(users), "unique_api_keys": int(keys), "top_endpoints": top_list}
-    finally:
-        db.close()
+    window = window_days(days)
+    since = window[0]
+    total = db.query(func.sum(UsageLogDaily.requests)).filter(UsageLogDaily.day >= since).scalar() or 0
+    # HyperLogLog estimate (~1%); exact COUNT(DISTINCT) only if Redis can't answer
+    users = approx_unique(USERS_HLL_KEY, window)
+    if users is None:
+        users = db.query(func.count(func.distinct(UsageLogDailyUser.user_id))).filter(UsageLogDailyUser.day >= since).scalar() or 0
+    keys = approx_unique(KEYS_HLL_KEY, window)
+    if keys is None:
+        keys = db.query(func.count(func.distinct(UsageLogDailyKey.api_key_id))).filter(UsageLogDailyKey.day >= since).scalar() or 0
+    requests = func.sum(UsageLogDaily.requests)
+    top = db.query(UsageLogDaily.endpoint, requests.label("cnt")).filter(UsageLogDaily.day >= since).group_by(UsageLogDaily.endpoint).order_by(requests.desc()).limit(10).all()
+    top_list = [{"endpoint": r[0], "count": int(r[1])} for r in top]
+    return {"days": days, "total_requests": int(total), "unique_users": int(users), "unique_api_keys": int(keys), "top_endpoints": top_list}
 
 @router.get("/daily-trends")
-def daily_trends(days: int = Query(30), admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-        series = []
-        for i in range(days):
-            d = (datetime.utcnow().date() - timedelta(days=(days - i - 1)))
-            start = datetime(d.year, d.month, d.day)
-            end = start + timedelta(days=1)
-            cnt = db.query(func.count(UsageLog.id)).filter(UsageLog.created_at >= start, UsageLog.created_at < end).scalar() or 0
-            series.append({"date": start.strftime("%Y-%m-%d"), "count": int(cnt)})
-        return {"days": days, "series": series}
-    finally:
-        db.close()
+@ttl_cache(ttl=ADMIN_ANALYTICS_CACHE_TTL)
+def daily_trends(days: int = Query(30), admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    window = window_days(days)  # one clock read; every day computed once
+    # one GROUP BY over the daily rollup instead of one COUNT per day
+    rows = db.query(UsageLogDaily.day, func.sum(UsageLogDaily.requests)).filter(UsageLogDaily.day >= window[0]).group_by(UsageLogDaily.day).all()
+    counts = {d: int(cnt) for d, cnt in rows}
+    series = [{"date": d.isoformat(), "count": counts.get(d, 0)} for d in window]
+    return {"days": days, "series": series}
 
 
@@ -1,35 +1,44 @@
 # backend/app/api/v1/admin_billing.py
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
-from datetime import datetime, timedelta
-from sqlalchemy import func
+from backend.app.db import get_db
+from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from backend.app.models.base import MICRO_CREDITS_SCALE
+from backend.app.models.user import User
+from backend.app.models.usage_log_daily import UsageLogDaily, UsageLogDailyUser
+from backend.app.services.usage_rollup import USERS_HLL_KEY, approx_unique, window_start
+from backend.app.utils.ttl_cache import ttl_cache
 
-router = APIRouter(prefix="/api/v1/admin/billing", tags=["admin-billing"])
+# aggregates are polled by dashboards; serve repeats from memory for a minute
+ADMIN_ANALYTICS_CACHE_TTL = 60
+
+# built once so the engine's compiled-statement cache is hit on every call
+TOP_PAYERS_SQL = text("""
+    SELECT u.id, u.email, COALESCE(SUM(ct.amount), 0) AS paid
+    FROM users u LEFT JOIN credit_transactions ct ON ct.user_id = u.id
+    GROUP BY u.id ORDER BY paid DESC LIMIT :limit
+""")
+
+router = APIRouter(prefix="/api/v1/admin/billing", tags=["admin-billing"], default_response_class=ORJSONResponse)
 
 @router.get("/overview")
-def billing_overview(days: int = Query(30), admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-        total_requests = db.query(func.count(UsageLog.id)).filter(UsageLog.created_at >= datetime.utcnow() - timedelta(days=days)).scalar() or 0
-        total_users = db.query(func.count(func.distinct(UsageLog.user_id))).scalar() or 0
-        q = db.execute("SELECT COUNT(*) FROM users").scalar()
-        # Stripe stats require calling Stripe API and aggregating (if desired).
-        return {"time_range_days": days, "total_api_requests": int(total_requests), "total_api_users": int(total_users), "total_users": int(q)}
-    finally:
-        db.close()
+@ttl_cache(ttl=ADMIN_ANALYTICS_CACHE_TTL)
+def billing_overview(days: int = Query(30), admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    # served from the usage_log_daily rollups, not a usage_logs scan
+    total_requests = db.query(func.sum(UsageLogDaily.requests)).filter(UsageLogDaily.day >= window_start(days)).scalar() or 0
+    total_users = approx_unique(USERS_HLL_KEY)
+    if total_users is None:
+        total_users = db.query(func.count(func.distinct(UsageLogDailyUser.user_id))).scalar() or 0
+    q = db.query(func.count(User.id)).scalar() or 0
+    # Stripe stats require calling Stripe API and aggregating (if desired).
+    return {"time_range_days": days, "total_api_requests": int(total_requests), "total_api_users": int(total_users), "total_users": int(q)}
 
 @router.get("/top-payers")
-def top_payers(limit: int = Query(20), admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        res = db.execute("""
-            SELECT u.id, u.email, COALESCE(SUM(ct.amount),0) as paid
-            FROM users u LEFT JOIN credit_transactions ct ON ct.user_id = u.id
-            GROUP BY u.id ORDER BY paid DESC LIMIT :limit
-        """, {"limit": limit}).fetchall()
-        out = [{"id": r[0], "email": r[1], "paid": float(r[2])} for r in res]
-        return {"rows": out}
-    finally:
-        db.close()
+@ttl_cache(ttl=ADMIN_ANALYTICS_CACHE_TTL)
+def top_payers(limit: int = Query(20), admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    res = db.execute(TOP_PAYERS_SQL, {"limit": limit}).fetchall()
+    # ct.amount is stored in micro-credits (MicroCredits column)
+    out = [{"id": r[0], "email": r[1], "paid": r[2] / MICRO_CREDITS_SCALE} for r in res]
+    return {"rows": out}
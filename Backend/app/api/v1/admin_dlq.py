@@ -1,12 +1,15 @@
 # backend/app/api/v1/admin_dlq.py
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List
-from backend.app.repositories.webhook_dlq_repository import WebhookDLQRepository
+from backend.app.repositories.webhook_dlq_repository import WebhookDLQRepository, get_dlq_repo
 from backend.app.schemas.base import ORMBase
 from pydantic import BaseModel
-from backend.app.services.auth_service import get_current_admin
+from backend.app.utils.security import get_current_admin
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class WebhookDLQOut(BaseModel):
@@ -17,36 +20,21 @@ class WebhookDLQOut(BaseModel):
     error: str | None
     attempts: int
     processed: bool
-    created_at: str | None
+    created_at: datetime | None
 
 
 @router.get("/api/v1/admin/dlq", response_model=List[WebhookDLQOut], dependencies=[Depends(get_current_admin)])
-def list_dlq(limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0)):
-    repo = WebhookDLQRepository()
-    rows = repo.list(limit=limit, offset=offset, only_unprocessed=False)
-    out = []
-    for r in rows:
-        out.append({
-            "id": r.id,
-            "url": r.url,
-            "payload": r.payload,
-            "headers": r.headers,
-            "error": r.error,
-            "attempts": r.attempts,
-            "processed": r.processed,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-        })
-    return out
+def list_dlq(limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0), repo: WebhookDLQRepository = Depends(get_dlq_repo)):
+    return [dict(r) for r in repo.list_rows(limit=limit, offset=offset, only_unprocessed=False)]
 
 
 @router.post("/api/v1/admin/dlq/{entry_id}/requeue", dependencies=[Depends(get_current_admin)])
-def requeue_dlq_entry(entry_id: int):
+def requeue_dlq_entry(entry_id: int, repo: WebhookDLQRepository = Depends(get_dlq_repo)):
     """
     Requeue: attempts a single re-delivery synchronously (quick attempt).
     On success => marks processed. On failure => increments attempts and returns 502.
     Admins can use this to quickly repush selected entries.
     """
-    repo = WebhookDLQRepository()
     entry = repo.get(entry_id)
     if not entry:
         raise HTTPException(status_code=404, detail="dlq_entry_not_found")
@@ -67,8 +55,7 @@ def requeue_dlq_entry(entry_id: int):
 
 
 @router.delete("/api/v1/admin/dlq/{entry_id}", dependencies=[Depends(get_current_admin)])
-def delete_dlq_entry(entry_id: int):
-    repo = WebhookDLQRepository()
+def delete_dlq_entry(entry_id: int, repo: WebhookDLQRepository = Depends(get_dlq_repo)):
     ok = repo.delete(entry_id)
     if not ok:
         raise HTTPException(status_code=404, detail="dlq_entry_not_found")
@@ -1,31 +1,37 @@
 # backend/app/api/v1/admin_extractor.py
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import update
 from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
+from backend.app.db import get_db
+from sqlalchemy.orm import Session
 from backend.app.models.extractor_job import ExtractorJob
+from backend.app.models.credit_reservation import CreditReservation
+from backend.app.services.job_status_cache import cache_job, get_cached_job
 from backend.app.services.credits_service import capture_reservation_by_job, release_reservation_by_job
 
 router = APIRouter(prefix="/api/v1/admin/extractor", tags=["admin-extractor"])
 
 @router.get("/job/{job_id}")
-def get_job(job_id: str, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        job = db.query(ExtractorJob).filter(ExtractorJob.job_id == job_id).first()
-        if not job:
-            raise HTTPException(status_code=404, detail="job_not_found")
-        return {
-            "job_id": job.job_id,
-            "status": job.status,
-            "input_path": job.input_path,
-            "output_path": job.output_path,
-            "processed": job.processed,
-            "success": getattr(job, "success", None),
-            "fail": getattr(job, "fail", None),
-            "error_message": job.error_message
-        }
-    finally:
-        db.close()
+def get_job(job_id: str, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    cached = get_cached_job("extractor", job_id)
+    if cached is not None:
+        return cached
+
+    job = db.query(ExtractorJob).filter(ExtractorJob.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="job_not_found")
+    result = {
+        "job_id": job.job_id,
+        "status": job.status,
+        "input_path": job.input_path,
+        "output_path": job.output_path,
+        "processed": job.processed,
+        "success": getattr(job, "success", None),
+        "fail": getattr(job, "fail", None),
+        "error_message": job.error_message
+    }
+    cache_job("extractor", job_id, result)
+    return result
 
 @router.post("/finalize/{job_id}")
 def finalize_capture(job_id: str, processed_count: int = None, admin = Depends(get_current_admin)):
@@ -36,21 +42,16 @@ def finalize_capture(job_id: str, processed_count: int = None, admin = Depends(g
     return {"ok": True, "result": res}
 
 @router.post("/release/{job_id}")
-def release_all(job_id: str, admin = Depends(get_current_admin)):
+def release_all(job_id: str, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
     """
     Release remaining reservations for job_id (refund).
     """
-    # find reservations and release them — reuse release_reservation_by_job if implemented, else simple loop
-    db = SessionLocal()
-    try:
-        from backend.app.models.credit_reservation import CreditReservation
-        rows = db.query(CreditReservation).filter(CreditReservation.job_id == job_id, CreditReservation.locked == True).all()
-        released = []
-        for r in rows:
-            r.locked = False
-            db.add(r)
-            released.append(r.id)
-        db.commit()
-        return {"released": released}
-    finally:
-        db.close()
+    # one UPDATE .. RETURNING id instead of loading rows and flushing one UPDATE each
+    released = db.execute(
+        update(CreditReservation)
+        .where(CreditReservation.job_id == job_id, CreditReservation.locked == True)
+        .values(locked=False)
+        .returning(CreditReservation.id)
+    ).scalars().all()
+    db.commit()
+    return {"released": released}
@@ -1,32 +1,35 @@
 # backend/app/api/v1/admin_jobs.py
 from fastapi import APIRouter, Depends, HTTPException
 from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
+from backend.app.db import get_db
+from sqlalchemy.orm import Session
 from backend.app.models.bulk_job import BulkJob
+from backend.app.services.job_status_cache import cache_job, get_cached_job
 import json
 
 router = APIRouter(prefix="/api/v1/admin/jobs", tags=["admin-jobs"])
 
 @router.get("/reconcile/{job_id}")
-def reconcile_job(job_id: str, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
-        if not job:
-            raise HTTPException(status_code=404, detail="job_not_found")
+def reconcile_job(job_id: str, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    cached = get_cached_job("bulk", job_id)
+    if cached is not None:
+        return cached
 
-        result = {
-            "job_id": job.job_id,
-            "status": job.status,
-            "total": job.total,
-            "processed": job.processed,
-            "valid": job.valid,
-            "invalid": job.invalid,
-            "output_path": job.output_path,
-            "error_message": job.error_message,
-            "has_output": job.output_path is not None
-        }
+    job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="job_not_found")
 
-        return result
-    finally:
-        db.close()
+    result = {
+        "job_id": job.job_id,
+        "status": job.status,
+        "total": job.total,
+        "processed": job.processed,
+        "valid": job.valid,
+        "invalid": job.invalid,
+        "output_path": job.output_path,
+        "error_message": job.error_message,
+        "has_output": job.output_path is not None
+    }
+
+    cache_job("bulk", job_id, result)
+    return result
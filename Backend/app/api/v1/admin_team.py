@@ -1,110 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException
+# backend/app/api/v1/admin_team.py
 from decimal import Decimal
+from typing import Dict, Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
 from backend.app.utils.security import get_current_admin
-from backend.app.services.team_billing_service import add_team_credits
+from backend.app.db import approx_count, get_db
+from backend.app.models.team import Team
+from backend.app.models.team_member import TeamMember
+from backend.app.models.user import User
+from backend.app.services.team_billing_service import add_team_credits, get_team_balance
 from backend.app.services.team_service import create_team, add_member
 
-router = APIRouter(prefix="/api/v1/admin/team", tags=["admin-team"])
+router = APIRouter(prefix="/api/v1/admin/team", tags=["admin-team"], default_response_class=ORJSONResponse)
+
+# below this many rows an exact COUNT(*) is cheap enough to always run
+EXACT_COUNT_BELOW = 10000
 
 @router.post("/topup")
 def topup_team(team_id: int, amount: float, ref: str = None, admin=Depends(get_current_admin)):
-    tx = add_team_credits(team_id, Decimal(str(amount)), reference=ref)
+    tx = add_team_credits(team_id, Decimal(str(amount)), reference=ref or f"admin_topup:{admin.id}")
     return {"ok": True, "tx": tx}
 
 @router.post("/create")
-def create_team_admin(owner_id: int, name: str, slug: str = None, admin=Depends(get_current_admin)):
-    team = create_team(owner_id, name, slug)
-    return {"team_id": team.id, "name": team.name}
+def create_team_admin(owner_id: int, name: str, admin=Depends(get_current_admin)):
+    team = create_team(owner_id, name)
+    return {"ok": True, "team_id": team.id, "name": team.name}
 
 @router.post("/add-member")
 def add_member_admin(team_id: int, user_id: int, role: str = "member", admin=Depends(get_current_admin)):
-    add_member(team_id, user_id, role)
-    return {"ok": True}
-
-
-# backend/app/api/v1/admin_team.py
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
-from typing import List, Dict, Any
-from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
-from backend.app.models.team import Team
-from backend.app.models.team_member import TeamMember
-from backend.app.models.user import User
+    return add_member(team_id, user_id, role)
 
-router = APIRouter(prefix="/api/v1/admin/team", tags=["admin-team"])
+@router.get("/{team_id}/balance")
+def team_balance_admin(team_id: int, admin=Depends(get_current_admin)):
+    return {"team_id": team_id, "balance": float(get_team_balance(team_id))}
 
 @router.get("/list")
-def list_teams(page: int = Query(1, ge=1), per_page: int = Query(50, ge=1, le=200), admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def list_teams(page: int = Query(1, ge=1), per_page: int = Query(50, ge=1, le=200), exact: bool = Query(False), admin = Depends(get_current_admin), db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
     Return paginated list of teams with owner info and member_count.
+    `total` is the planner's estimate unless ?exact=true (or the table is
+    small / has no estimate yet).
     """
-    db = SessionLocal()
-    try:
-        q = db.query(Team)
-        total = q.count()
-        rows = q.order_by(Team.created_at.desc()).limit(per_page).offset((page-1)*per_page).all()
-
-        out = []
-        for t in rows:
-            # owner info (if present)
-            owner = None
-            try:
-                if t.owner_id:
-                    owner_row = db.query(User).get(t.owner_id)
-                    owner = {"id": owner_row.id, "email": owner_row.email} if owner_row else None
-            except Exception:
-                owner = None
-
-            # member count
-            member_count = db.query(func.count(TeamMember.id)).filter(TeamMember.team_id == t.id, TeamMember.is_active == True).scalar() or 0
-
-            out.append({
-                "id": t.id,
-                "name": t.name,
-                "slug": t.slug,
-                "owner_id": t.owner_id,
-                "owner": owner,
-                "credits": float(t.credits or 0),
-                "is_active": bool(t.is_active),
-                "member_count": int(member_count),
-                "created_at": str(t.created_at)
-            })
-
-        return {"page": page, "per_page": per_page, "total": total, "teams": out}
-    finally:
-        db.close()
-
-from fastapi import APIRouter, Depends, HTTPException
-from backend.app.utils.security import get_current_admin
-from backend.app.services.team_service import create_team, add_member, get_team
-from backend.app.services.team_billing_service import add_team_credits, get_team_balance
-from pydantic import BaseModel
-
-router = APIRouter(prefix="/api/v1/admin/teams", tags=["admin-teams"])
-
-class CreateTeamIn(BaseModel):
-    name: str
-    owner_id: int
-
-@router.post("/create")
-def admin_create_team(payload: CreateTeamIn, admin = Depends(get_current_admin)):
-    t = create_team(payload.name, payload.owner_id)
-    return {"ok": True, "team_id": t.id, "name": t.name}
-
-@router.post("/{team_id}/add-member")
-def admin_add_member(team_id: int, user_id: int, role: str = "member", admin = Depends(get_current_admin)):
-    add_member(team_id, user_id, role=role)
-    return {"ok": True}
-
-@router.post("/{team_id}/topup")
-def admin_topup(team_id: int, amount: float, admin = Depends(get_current_admin)):
-    res = add_team_credits(team_id, amount, reference=f"admin_topup:{admin.id}")
-    return res
-
-@router.get("/{team_id}/balance")
-def admin_team_balance(team_id: int, admin = Depends(get_current_admin)):
-    b = get_team_balance(team_id)
-    return {"team_id": team_id, "balance": float(b)}
-
+    total = None if exact else approx_count(db, Team.__tablename__)
+    total_exact = total is None or total < EXACT_COUNT_BELOW
+    if total_exact:
+        total = db.query(func.count(Team.id)).scalar() or 0
+
+    # owner + active member count in the same query instead of 2 per team;
+    # only the columns the response uses, no Team instances
+    member_count = func.count(TeamMember.id).filter(TeamMember.active == True).label("member_count")
+    rows = (
+        db.query(
+            Team.id,
+            Team.name,
+            Team.owner_id,
+            Team.credits,
+            Team.is_active,
+            Team.created_at,
+            User.email.label("owner_email"),
+            member_count,
+        )
+        .outerjoin(User, User.id == Team.owner_id)
+        .outerjoin(TeamMember, TeamMember.team_id == Team.id)
+        .group_by(Team.id, User.id)
+        .order_by(Team.created_at.desc())
+        .limit(per_page)
+        .offset((page-1)*per_page)
+        .all()
+    )
+
+    out = []
+    for r in rows:
+        owner = {"id": r.owner_id, "email": r.owner_email} if r.owner_email is not None else None
+        out.append({
+            "id": r.id,
+            "name": r.name,
+            "owner_id": r.owner_id,
+            "owner": owner,
+            "credits": float(r.credits or 0),
+            "is_active": bool(r.is_active),
+            "member_count": int(r.member_count or 0),
+            "created_at": r.created_at
+        })
+
+    return {"page": page, "per_page": per_page, "total": total, "total_exact": total_exact, "teams": out}
@@ -1,13 +1,16 @@
 # backend/app/api/v1/admin_team_billing.py
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from fastapi.responses import ORJSONResponse
 from backend.app.utils.security import get_current_admin
-from backend.app.db import SessionLocal
+from backend.app.db import get_db
+from sqlalchemy.orm import Session
+from sqlalchemy import select
 from backend.app.models.team import Team
 from backend.app.services.team_billing_service import add_team_credits, get_team_balance
 from pydantic import BaseModel
 from decimal import Decimal
 
-router = APIRouter(prefix="/api/v1/admin/team-billing", tags=["admin-team-billing"])
+router = APIRouter(prefix="/api/v1/admin/team-billing", tags=["admin-team-billing"], default_response_class=ORJSONResponse)
 
 class TopUpIn(BaseModel):
     team_id: int
@@ -15,13 +18,15 @@ class TopUpIn(BaseModel):
     reference: str = None
 
 @router.get("/teams")
-def list_teams(admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        rows = db.query(Team).order_by(Team.created_at.desc()).all()
-        return [{"id": r.id, "name": r.name, "owner_id": r.owner_id, "credits": float(r.credits or 0)} for r in rows]
-    finally:
-        db.close()
+def list_teams(page: int = Query(1, ge=1), per_page: int = Query(100, ge=1, le=500), admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    rows = db.execute(
+        select(Team.id, Team.name, Team.owner_id, Team.credits)
+        .order_by(Team.created_at.desc())
+        .limit(per_page)
+        .offset((page-1)*per_page)
+    ).all()
+    out = [{"id": r.id, "name": r.name, "owner_id": r.owner_id, "credits": float(r.credits or 0)} for r in rows]
+    return {"page": page, "per_page": per_page, "rows": out}
 
 @router.post("/topup")
 def topup(payload: TopUpIn, admin = Depends(get_current_admin)):
@@ -1,21 +1,21 @@
 # backend/app/api/v1/admin_webhook_dlq.py
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
-import json
+import orjson
+from celery import group
 
-from backend.app.repositories.webhook_dlq_repository import WebhookDLQRepository
+from backend.app.repositories.webhook_dlq_repository import WebhookDLQRepository, get_dlq_repo
 from backend.app.tasks.webhook_tasks import webhook_task
-from backend.app.api.dependencies.auth import get_current_admin
+from backend.app.utils.security import get_current_admin
 
 router = APIRouter(
     prefix="/admin/webhook-dlq",
-    tags=["Admin Webhook DLQ"]
+    tags=["Admin Webhook DLQ"],
+    default_response_class=ORJSONResponse,
 )
 
-repo = WebhookDLQRepository()
-
-
 # ----------------------------------------------------
 # LIST FAILED ENTRIES (Paginated)
 # ----------------------------------------------------
@@ -23,20 +23,21 @@ repo = WebhookDLQRepository()
 def list_failed_entries(
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    admin=Depends(get_current_admin)
+    admin=Depends(get_current_admin),
+    repo: WebhookDLQRepository = Depends(get_dlq_repo),
 ):
-    rows = repo.list(limit=limit, offset=offset, only_unprocessed=True)
+    rows = repo.list_rows(limit=limit, offset=offset, only_unprocessed=True)
     return {
         "count": len(rows),
         "results": [
             {
-                "id": r.id,
-                "url": r.url,
-                "payload": r.payload,
-                "headers": r.headers,
-                "error": r.error,
-                "attempts": r.attempts,
-                "created_at": r.created_at,
+                "id": r["id"],
+                "url": r["url"],
+                "payload": r["payload"],
+                "headers": r["headers"],
+                "error": r["error"],
+                "attempts": r["attempts"],
+                "created_at": r["created_at"],
             }
             for r in rows
         ]
@@ -47,18 +48,18 @@ def list_failed_entries(
 # REQUEUE ONE ENTRY
 # ----------------------------------------------------
 @router.post("/requeue/{entry_id}", summary="Retry a specific DLQ entry")
-def requeue_entry(entry_id: int, admin=Depends(get_current_admin)):
+def requeue_entry(entry_id: int, admin=Depends(get_current_admin), repo: WebhookDLQRepository = Depends(get_dlq_repo)):
     entry = repo.get(entry_id)
     if not entry:
         raise HTTPException(404, "DLQ entry not found")
 
     payload = (
-        json.loads(entry.payload)
+        orjson.loads(entry.payload)
         if isinstance(entry.payload, str)
         else entry.payload
     )
     headers = (
-        json.loads(entry.headers)
+        orjson.loads(entry.headers)
         if entry.headers and isinstance(entry.headers, str)
         else entry.headers
     )
@@ -73,7 +74,7 @@ def requeue_entry(entry_id: int, admin=Depends(get_current_admin)):
 # DELETE ENTRY
 # ----------------------------------------------------
 @router.delete("/{entry_id}", summary="Delete DLQ entry")
-def delete_entry(entry_id: int, admin=Depends(get_current_admin)):
+def delete_entry(entry_id: int, admin=Depends(get_current_admin), repo: WebhookDLQRepository = Depends(get_dlq_repo)):
     ok = repo.delete(entry_id)
     if not ok:
         raise HTTPException(404, "DLQ entry not found")
@@ -84,23 +85,28 @@ def delete_entry(entry_id: int, admin=Depends(get_current_admin)):
 # RETRY ALL FAILED ENTRIES
 # ----------------------------------------------------
 @router.post("/requeue-all", summary="Retry ALL failed DLQ entries")
-def requeue_all(admin=Depends(get_current_admin)):
+def requeue_all(admin=Depends(get_current_admin), repo: WebhookDLQRepository = Depends(get_dlq_repo)):
     rows = repo.list(limit=5000, offset=0, only_unprocessed=True)
 
-    count = 0
+    # one group publish + one UPDATE instead of a delay() and a commit per row
+    signatures = []
+    ids = []
     for r in rows:
         payload = (
-            json.loads(r.payload)
+            orjson.loads(r.payload)
             if isinstance(r.payload, str)
             else r.payload
         )
         headers = (
-            json.loads(r.headers)
+            orjson.loads(r.headers)
             if r.headers and isinstance(r.headers, str)
             else r.headers
         )
-        webhook_task.delay(r.url, payload, headers)
-        repo.mark_processed(r.id)
-        count += 1
+        signatures.append(webhook_task.s(r.url, payload, headers))
+        ids.append(r.id)
+
+    if signatures:
+        group(signatures).apply_async()
+        repo.mark_processed_many(ids)
 
-    return {"status": "queued", "total_requeued": count}
+    return {"status": "queued", "total_requeued": len(ids)}
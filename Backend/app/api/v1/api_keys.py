@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from backend.app.db import SessionLocal
+from backend.app.db import get_db
 from backend.app.utils.security import get_current_user
 from backend.app.services.api_key_service import create_api_key, deactivate_api_key
 from backend.app.models.api_key import ApiKey
@@ -9,14 +9,6 @@ from backend.app.models.api_key import ApiKey
 router = APIRouter(prefix="/v1/api-keys", tags=["API Keys"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.post("/create")
 def create_key(name: str = None, current_user=Depends(get_current_user), db: Session = Depends(get_db)):
     key = create_api_key(db, current_user.id, name)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 
-from backend.app.db import SessionLocal
+from backend.app.db import get_db
 from backend.app.models.user import User
 from backend.app.utils.hashing import hash_password, verify_password
 from backend.app.utils.security import create_access_token
@@ -25,14 +25,6 @@ class TokenOut(BaseModel):
     token_type: str = "bearer"
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.post("/signup", response_model=TokenOut)
 def signup(payload: SignupIn, db: Session = Depends(get_db)):
     existing = db.query(User).filter(User.email == payload.email).first()
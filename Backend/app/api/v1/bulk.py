@@ -1,20 +1,27 @@
 # backend/app/api/v1/bulk.py
 import os
 import io
+import base64
 import uuid
-import csv
-import zipfile
+import asyncio
+import shutil
 import logging
+from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, List
+from typing import Optional, Set
 
 from fastapi import APIRouter, Request, Depends, UploadFile, File, HTTPException
-from backend.app.db import SessionLocal
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.orm import Session
+from backend.app.db import get_db
 from backend.app.models.bulk_job import BulkJob
 from backend.app.services.pricing_service import get_cost_for_key
 from backend.app.services.credits_service import reserve_and_deduct, get_user_balance, add_credits
-from backend.app.workers.bulk_tasks import process_bulk_task
+from backend.app.celery_app import celery_app
 from backend.app.utils.security import get_current_user, get_current_admin
+from backend.app.utils.csv_emails import extract_csv_emails
+from backend.app.utils.email_scan import EmailScanner, scan_emails
+from backend.app.utils.ttl_cache import ttl_cache
 from backend.app.config import settings
 
 # MinIO client helper
@@ -26,44 +33,134 @@ router = APIRouter(prefix="/api/v1/bulk", tags=["bulk"])
 INPUT_FOLDER = getattr(settings, "BULK_INPUT_FOLDER", "/tmp/bulk_inputs")
 os.makedirs(INPUT_FOLDER, exist_ok=True)
 
+# multipart chunk size for streaming uploads to MinIO (also bounds memory per upload)
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+# published by name through the app's pooled producer, so the API process
+# never imports the worker module (verification engine, WS managers, ...)
+BULK_TASK_NAME = "bulk.process_bulk_task"
+
+# /my-jobs/count is served from memory for this long per user (per process)
+MY_JOBS_COUNT_TTL = 60
+
+# 6-dp quantizer for credit amounts, built once
+_Q6 = Decimal("0.000001")
+
+
 def _dec(x) -> Decimal:
-    return Decimal(str(x)).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
-
-
-def _extract_emails_from_zip_bytes(content: bytes) -> List[str]:
-    emails: List[str] = []
-    z = zipfile.ZipFile(io.BytesIO(content))
-    for name in z.namelist():
-        if name.endswith("/") or name.startswith("__MACOSX"):
-            continue
-        if name.lower().endswith(".csv"):
-            raw = z.read(name).decode("utf-8", errors="ignore")
-            reader = csv.reader(io.StringIO(raw))
-            for row in reader:
-                for col in row:
-                    v = col.strip()
-                    if v and "@" in v:
-                        emails.append(v)
-                        break
-        elif name.lower().endswith(".txt"):
-            txt = z.read(name).decode("utf-8", errors="ignore")
-            for line in txt.splitlines():
-                s = line.strip()
-                if s and "@" in s:
-                    emails.append(s)
-    return emails
-
-
-def _extract_emails_from_csv_text(text: str) -> List[str]:
-    emails: List[str] = []
-    reader = csv.reader(io.StringIO(text))
-    for row in reader:
-        for col in row:
-            v = col.strip()
-            if v and "@" in v:
-                emails.append(v)
-                break
-    return emails
+    return (x if isinstance(x, Decimal) else Decimal(str(x))).quantize(_Q6, rounding=ROUND_HALF_UP)
+
+
+class _TeeReader:
+    """File-like wrapper that hands every chunk read from `src` to a scanner."""
+
+    def __init__(self, src, scanner: EmailScanner):
+        self._src = src
+        self._scanner = scanner
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._src.read(size)
+        if chunk:
+            self._scanner.feed(chunk)
+        return chunk
+
+
+def _extract_emails_from_csv(fh) -> Set[str]:
+    # same rule the bulk workers verify with (first "@" cell per row), so a
+    # CSV is priced on exactly the addresses that will be verified
+    return set(map(str.lower, extract_csv_emails(fh)))
+
+
+def _put_upload(client, object_name: str, upload, content_type: str, scanner: Optional[EmailScanner] = None) -> None:
+    """
+    Stream the upload to MinIO. With a scanner, every multipart chunk is
+    also fed to it on the way through, so storing and parsing share one read.
+    """
+    upload.seek(0)
+    client.put_object(
+        MINIO_BUCKET,
+        object_name,
+        _TeeReader(upload, scanner) if scanner is not None else upload,
+        length=-1,
+        part_size=UPLOAD_PART_SIZE,
+        content_type=content_type,
+    )
+
+
+def _save_upload_to_disk(upload, path: str) -> None:
+    """
+    Copy the upload to `path`. When the spooled upload has already rolled
+    over to a real file, the kernel copies it with sendfile() (no userspace
+    buffers); in-memory spools fall back to chunked copyfileobj.
+    """
+    upload.seek(0)
+    try:
+        in_fd = getattr(upload, "_file", upload).fileno()
+    except (AttributeError, OSError):
+        in_fd = None
+    with open(path, "wb") as fh:
+        if in_fd is not None and hasattr(os, "sendfile"):
+            size = os.fstat(in_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fh.fileno(), in_fd, offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+            return
+        shutil.copyfileobj(upload, fh, UPLOAD_PART_SIZE)
+
+
+# extension (no dot, lowercase) -> parser, run on the stored upload; zips go
+# to the worker unparsed and anything else is text, scanned as it streams to MinIO
+_PARSERS = {
+    "csv": _extract_emails_from_csv,
+}
+
+
+def _upload_ext(filename: str) -> str:
+    return filename.rpartition(".")[2].lower()
+
+
+def _parse_upload(upload, ext: str) -> Set[str]:
+    upload.seek(0)
+    return _PARSERS.get(ext, scan_emails)(upload)
+
+
+def _insert_job(db: Session, job: BulkJob, link_reservations: bool = False) -> None:
+    """
+    Persist the job row on the request's session (blocking; submit runs it
+    in a worker thread). With link_reservations, the user's still-unlinked
+    locked reservations are attached to the job in one UPDATE (best-effort).
+    """
+    # nothing server-generated is read back (job_id is ours), so no refresh()
+    db.add(job)
+    db.commit()
+
+    if link_reservations:
+        try:
+            from backend.app.models.credit_reservation import CreditReservation
+            db.execute(
+                update(CreditReservation)
+                .where(
+                    CreditReservation.user_id == job.user_id,
+                    CreditReservation.locked == True,
+                    CreditReservation.job_id == None,
+                )
+                .values(job_id=job.job_id)
+            )
+            db.commit()
+        except Exception:
+            # not critical
+            db.rollback()
+
+
+def _enqueue_bulk_job(job_id: str, estimated_cost: Optional[Decimal]) -> None:
+    celery_app.send_task(
+        BULK_TASK_NAME,
+        args=(job_id, float(estimated_cost) if estimated_cost is not None else None),
+        retry=False,
+    )
 
 
 # ---- submit job endpoint ----
@@ -74,6 +171,7 @@ async def submit_bulk(
     request: Optional[Request] = None,
     team_id: Optional[int] = None,  # optional override from frontend
     current_user = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Submit a bulk verification job. Saves input to MinIO (preferred) or disk.
@@ -90,410 +188,281 @@ async def submit_bulk(
     if chosen_team:
         try:
             from backend.app.services.team_service import is_user_member_of_team
-            if not is_user_member_of_team(user.id, chosen_team):
+            if not await asyncio.to_thread(is_user_member_of_team, user.id, chosen_team):
                 raise HTTPException(status_code=403, detail="not_team_member")
         except HTTPException:
             raise
         except Exception:
             raise HTTPException(status_code=403, detail="not_team_member")
 
-    # read file content
-    content = await file.read()
+    # the upload stays in Starlette's SpooledTemporaryFile and is never read
+    # whole: text bytes are scanned as they stream to MinIO (one pass) with
+    # the workers' token rule (utils/email_scan), so `total` and
+    # `estimated_cost` cover exactly the addresses that get verified; CSVs
+    # are parsed after the upload with the workers' first-"@"-cell rule, and
+    # zips are left to the worker.
+    # Storage and parsing are blocking, so they run in worker threads.
+    upload = file.file
     filename = (file.filename or f"upload-{uuid.uuid4().hex}").lower()
+    ext = _upload_ext(filename)
+    is_zip = ext == "zip"
+    scanner = None if is_zip or ext in _PARSERS else EmailScanner()
 
     # Save to MinIO (preferred)
     try:
-        ensure_bucket()
+        await asyncio.to_thread(ensure_bucket)
         object_name = f"inputs/{user.id}-{uuid.uuid4().hex[:12]}-{filename}"
-        minio_client.put_object(
-            MINIO_BUCKET,
+        await asyncio.to_thread(
+            _put_upload,
+            minio_client,
             object_name,
-            io.BytesIO(content),
-            length=len(content),
-            content_type=file.content_type or "application/octet-stream"
+            upload,
+            file.content_type or "application/octet-stream",
+            scanner,
         )
         input_path = f"s3://{MINIO_BUCKET}/{object_name}"
     except Exception as e:
         logger.exception("minio save failed, fallback to disk: %s", e)
+        # the scanner may have seen only part of the upload; re-parse below
+        scanner = None
         # fallback to disk
         fname = f"{user.id}-{uuid.uuid4().hex[:12]}-{filename}"
         input_path = os.path.join(INPUT_FOLDER, fname)
         try:
-            with open(input_path, "wb") as fh:
-                fh.write(content)
+            await asyncio.to_thread(_save_upload_to_disk, upload, input_path)
         except Exception:
             logger.exception("disk save also failed")
             raise HTTPException(status_code=500, detail="save_input_failed")
 
-    # QUICK COUNT / PARSE of emails
-    emails = []
-    try:
-        _, ext = os.path.splitext(filename)
-        ext = ext.lower()
-        if ext == ".zip":
-            emails = _extract_emails_from_zip_bytes(content)
-        elif ext in (".csv", ".txt"):
-            raw = content.decode("utf-8", errors="ignore")
-            emails = _extract_emails_from_csv_text(raw)
-        else:
-            raw = content.decode("utf-8", errors="ignore")
-            for line in raw.splitlines():
-                s = line.strip()
-                if s and "@" in s:
-                    emails.append(s)
-    except Exception as e:
-        logger.exception("count parse failed: %s", e)
-        raise HTTPException(status_code=400, detail="parse_failed")
-
-    # dedupe + normalize
-    unique_emails = list(dict.fromkeys([e.lower().strip() for e in emails if "@" in e]))
-    total = len(unique_emails)
-    if total == 0:
-        raise HTTPException(status_code=400, detail="no_valid_emails")
-
-    # Pricing & reservation — pass chosen_team into reserve_and_deduct
-    per_cost = _dec(get_cost_for_key("verify.bulk_per_email") or 0)
-    estimated_cost = (per_cost * Decimal(total)).quantize(Decimal("0.000001"))
-
-    # Reserve credits up-front (team-first if chosen_team provided)
-    try:
-        reserve_tx = reserve_and_deduct(
-            user.id,
-            estimated_cost,
-            reference=f"bulk-reserve:{uuid.uuid4().hex[:8]}",
-            team_id=chosen_team,
-            job_id=None,  # will attach job_id after create
-        )
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        logger.exception("reserve failed: %s", e)
-        raise HTTPException(status_code=500, detail="reserve_failed")
+    # zips are counted, priced and reserved by the worker: decompressing them
+    # here would hold the request for the whole archive just to get `total`
+    total = 0
+    estimated_cost = None
+    reserve_tx = None
+    if not is_zip:
+        # QUICK COUNT / PARSE of emails
+        emails = set()
+        try:
+            if scanner is not None:
+                emails = scanner.close()
+            else:
+                emails = await asyncio.to_thread(_parse_upload, upload, ext)
+        except Exception as e:
+            logger.exception("count parse failed: %s", e)
+            raise HTTPException(status_code=400, detail="parse_failed")
+
+        # both parsers dedupe as they go and only the count is needed here
+        total = len(emails)
+        if total == 0:
+            raise HTTPException(status_code=400, detail="no_valid_emails")
+
+        # Pricing & reservation — pass chosen_team into reserve_and_deduct
+        per_cost = get_cost_for_key("verify.bulk_per_email")
+        estimated_cost = (per_cost * total).quantize(_Q6, rounding=ROUND_HALF_UP)
+
+        # Reserve credits up-front (team-first if chosen_team provided)
+        try:
+            reserve_tx = await asyncio.to_thread(
+                reserve_and_deduct,
+                user.id,
+                estimated_cost,
+                reference=f"bulk-reserve:{uuid.uuid4().hex[:8]}",
+                team_id=chosen_team,
+                job_id=None,  # will attach job_id after create
+            )
+        except HTTPException as e:
+            raise e
+        except Exception as e:
+            logger.exception("reserve failed: %s", e)
+            raise HTTPException(status_code=500, detail="reserve_failed")
 
     # create DB job with team_id recorded
-    db = SessionLocal()
     job_id = f"bulk-{uuid.uuid4().hex[:12]}"
     try:
         job = BulkJob(
             user_id = user.id,
             job_id = job_id,
-            status = "queued",
+            status = "counting" if is_zip else "queued",
             input_path = input_path,
             total = total,
             webhook_url = webhook_url,
-            estimated_cost = float(estimated_cost)
+            estimated_cost = float(estimated_cost) if estimated_cost is not None else None,
+            team_id = chosen_team,
         )
-        # attach team_id if BulkJob model has attribute
-        try:
-            setattr(job, "team_id", chosen_team)
-        except Exception:
-            pass
-
-        db.add(job)
-        db.commit()
-        db.refresh(job)
-
-        # Link reservation(s) to job_id if reservation system used job_id field
-        try:
-            from backend.app.models.credit_reservation import CreditReservation
-            res_rows = db.query(CreditReservation).filter(CreditReservation.user_id==user.id, CreditReservation.locked==True, CreditReservation.job_id==None).all()
-            for r in res_rows:
-                r.job_id = job_id
-                db.add(r)
-            db.commit()
-        except Exception:
-            # not critical
-            pass
+        # link reservation(s) to job_id if reservation system used job_id field
+        # (zip jobs have none yet; the worker reserves with the job_id set)
+        await asyncio.to_thread(_insert_job, db, job, not is_zip)
 
     except Exception as e:
         logger.exception("failed to create job row: %s", e)
         # attempt to refund reservation (best-effort)
-        try:
-            add_credits(user.id, estimated_cost, reference=f"{job_id}:refund_on_create_fail")
-        except Exception:
-            logger.exception("refund after job create fail also failed")
+        if estimated_cost is not None:
+            try:
+                await asyncio.to_thread(add_credits, user.id, estimated_cost, reference=f"{job_id}:refund_on_create_fail")
+            except Exception:
+                logger.exception("refund after job create fail also failed")
         raise HTTPException(status_code=500, detail="job_create_failed")
-    finally:
-        db.close()
 
-    # enqueue Celery task with estimated_cost (worker will finalize and handle refunds)
+    # enqueue Celery task with estimated_cost (worker will finalize and handle refunds;
+    # for zips it is None and the worker prices and reserves once it has counted)
     try:
-        process_bulk_task.delay(job_id, float(estimated_cost))
+        await asyncio.to_thread(_enqueue_bulk_job, job_id, estimated_cost)
     except Exception as e:
         logger.exception("enqueue failed, job created: %s", e)
         # keep job queued — worker may be restarted. We still return success to client.
 
     return {
         "job_id": job_id,
+        "status": "counting" if is_zip else "queued",
         "total": total,
-        "estimated_cost": float(estimated_cost),
+        "estimated_cost": float(estimated_cost) if estimated_cost is not None else None,
         "reserve_tx": reserve_tx,
+        "team_id": chosen_team,
     }
 
 
 # ---- admin endpoints ----
+# columns /status returns; selected as a plain row instead of hydrating a BulkJob
+_STATUS_COLUMNS = (
+    BulkJob.job_id,
+    BulkJob.status,
+    BulkJob.total,
+    BulkJob.processed,
+    BulkJob.valid,
+    BulkJob.invalid,
+    BulkJob.input_path,
+    BulkJob.output_path,
+    BulkJob.error_message,
+    BulkJob.team_id,
+    BulkJob.estimated_cost,
+)
+
+
 @router.get("/status/{job_id}")
-def job_status(job_id: str, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
-        if not job:
-            raise HTTPException(status_code=404, detail="job_not_found")
-        return {
-            "job_id": job.job_id,
-            "status": job.status,
-            "total": job.total,
-            "processed": job.processed,
-            "valid": job.valid,
-            "invalid": job.invalid,
-            "input_path": job.input_path,
-            "output_path": job.output_path,
-            "error_message": job.error_message,
-            "team_id": getattr(job, "team_id", None),
-            "estimated_cost": float(getattr(job, "estimated_cost", 0) or 0),
-        }
-    finally:
-        db.close()
+def job_status(job_id: str, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    job = (
+        db.query(BulkJob)
+        .with_entities(*_STATUS_COLUMNS)
+        .filter(BulkJob.job_id == job_id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="job_not_found")
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "total": job.total,
+        "processed": job.processed,
+        "valid": job.valid,
+        "invalid": job.invalid,
+        "input_path": job.input_path,
+        "output_path": job.output_path,
+        "error_message": job.error_message,
+        "team_id": job.team_id,
+        "estimated_cost": float(job.estimated_cost or 0),
+    }
 
 
 @router.get("/download/{job_id}")
-def download_results(job_id: str, admin = Depends(get_current_admin)):
-    db = SessionLocal()
-    try:
-        job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
-        if not job or not job.output_path:
-            raise HTTPException(status_code=404, detail="results_not_ready")
-        return {"output_path": job.output_path}
-    finally:
-        db.close()
+def download_results(job_id: str, admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+    output_path = db.query(BulkJob.output_path).filter(BulkJob.job_id == job_id).scalar()
+    if not output_path:
+        raise HTTPException(status_code=404, detail="results_not_ready")
+    return {"output_path": output_path}
 
 
 # ---- user endpoints ----
-@router.get("/my-jobs")
-def list_my_jobs(page: int = 1, per_page: int = 20, current_user = Depends(get_current_user)):
-    db = SessionLocal()
+# columns /my-jobs returns (plus id for the cursor); plain rows, no ORM instances
+_MY_JOBS_COLUMNS = (
+    BulkJob.id,
+    BulkJob.job_id,
+    BulkJob.status,
+    BulkJob.total,
+    BulkJob.processed,
+    BulkJob.valid,
+    BulkJob.invalid,
+    BulkJob.created_at,
+    BulkJob.output_path,
+    BulkJob.team_id,
+)
+
+
+def _encode_cursor(created_at: datetime, row_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{row_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str):
     try:
-        q = db.query(BulkJob).filter(BulkJob.user_id == current_user.id).order_by(BulkJob.created_at.desc())
-        total = q.count()
-        rows = q.limit(per_page).offset((page-1)*per_page).all()
-        items = []
-        for r in rows:
-            items.append({
-                "job_id": r.job_id,
-                "status": r.status,
-                "total": r.total,
-                "processed": r.processed,
-                "valid": r.valid,
-                "invalid": r.invalid,
-                "created_at": str(r.created_at),
-                "output_path": r.output_path,
-                "team_id": getattr(r, "team_id", None),
-            })
-        return {
-            "page": page,
-            "per_page": per_page,
-            "total": total,
-            "items": items,
-        }
-    finally:
-        db.close()
-
-
-
-@router.get("/download-url/{job_id}")
-def get_signed_download_url(job_id: str, current_user = Depends(get_current_user)):
-    db = SessionLocal()
-    try:
-        job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
-        if not job:
-            raise HTTPException(status_code=404, detail="job_not_found")
-
-        if not job.output_path or not job.output_path.startswith("s3://"):
-            raise HTTPException(status_code=400, detail="no_output_available")
-
-        # Extract object path
-        object_key = job.output_path.replace("s3://", "").split("/", 1)[1]
-
-        from backend.app.services.minio_signed_url import generate_signed_url
-        url = generate_signed_url(object_key, expiry_seconds=1800)
-
-        return {"download_url": url}
-
-    finally:
-        db.close()
-        
-# backend/app/api/v1/bulk.py
-
-import os, io, uuid, csv, zipfile, logging
-from fastapi import APIRouter, Request, Depends, UploadFile, File, HTTPException
-from decimal import Decimal, ROUND_HALF_UP
-
-from backend.app.db import SessionLocal
-from backend.app.models.bulk_job import BulkJob
-from backend.app.services.pricing_service import get_cost_for_key
-from backend.app.services.credits_service import reserve_and_deduct
-from backend.app.services.team_service import is_user_member_of_team
-from backend.app.workers.bulk_tasks import process_bulk_task
-from backend.app.services.minio_client import client, MINIO_BUCKET
-from backend.app.utils.security import get_current_user
-from backend.app.config import settings
-
-logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/bulk", tags=["bulk"])
+        ts, _, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return datetime.fromisoformat(ts), int(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="invalid_cursor")
 
-def _dec(x):
-    return Decimal(str(x)).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
 
-
-# -------------------------
-# SUBMIT BULK JOB
-# -------------------------
-@router.post("/submit")
-async def submit_bulk(
-    file: UploadFile = File(...),
-    webhook_url: str = None,
-    request: Request = None,
-    team_id: int = None,
-    current_user = Depends(get_current_user),
-):
+@router.get("/my-jobs")
+def list_my_jobs(cursor: Optional[str] = None, per_page: int = 20, current_user = Depends(get_current_user), db: Session = Depends(get_db)):
     """
-    Team billing priority:
-      1) If team_id provided → deduct from team pool (if admin or member)
-      2) If insufficient → fall back to user credits
+    Keyset-paginated job list, newest first. Pass the returned `next_cursor`
+    back as `cursor` for the following page; there is no total (see
+    /my-jobs/count). Each page is a range scan of ix_bulk_jobs_user_created_id
+    (user_id, created_at DESC, id DESC) of per_page + 1 rows.
     """
-    user = current_user
-    if not user:
-        raise HTTPException(status_code=401, detail="auth_required")
-
-    # Determine chosen team (query & middleware combined)
-    chosen_team = team_id or getattr(request.state, "team_id", None)
-
-    # If team chosen, validate membership
-    if chosen_team:
-        if not is_user_member_of_team(user.id, chosen_team):
-            raise HTTPException(status_code=403, detail="not_team_member")
-
-    # Read file from user
-    content = await file.read()
-    filename = (file.filename or f"upload-{uuid.uuid4().hex}").lower()
-
-    # ---------------------
-    # SAVE TO MINIO
-    # ---------------------
-    object_name = f"inputs/{user.id}-{uuid.uuid4().hex[:10]}-{filename}"
-
-    client.put_object(
-        MINIO_BUCKET,
-        object_name,
-        io.BytesIO(content),
-        length=len(content),
-        content_type=file.content_type or "application/octet-stream",
+    q = db.query(BulkJob).with_entities(*_MY_JOBS_COLUMNS).filter(BulkJob.user_id == current_user.id)
+    if cursor:
+        q = q.filter(tuple_(BulkJob.created_at, BulkJob.id) < _decode_cursor(cursor))
+    rows = (
+        q.order_by(BulkJob.created_at.desc(), BulkJob.id.desc())
+        .limit(per_page + 1)
+        .all()
     )
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    items = []
+    for r in rows:
+        items.append({
+            "job_id": r.job_id,
+            "status": r.status,
+            "total": r.total,
+            "processed": r.processed,
+            "valid": r.valid,
+            "invalid": r.invalid,
+            "created_at": str(r.created_at),
+            "output_path": r.output_path,
+            "team_id": r.team_id,
+        })
+    return {
+        "per_page": per_page,
+        "items": items,
+        "next_cursor": _encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
+        "has_more": has_more,
+    }
 
-    input_path = f"s3://{MINIO_BUCKET}/{object_name}"
 
-    # ---------------------
-    # PARSE EMAILS
-    # ---------------------
-    emails = []
+@ttl_cache(ttl=MY_JOBS_COUNT_TTL)
+def _count_user_jobs(user_id: int, db: Session) -> int:
+    return db.query(func.count(BulkJob.id)).filter(BulkJob.user_id == user_id).scalar() or 0
 
-    try:
-        if filename.endswith(".zip"):
-            z = zipfile.ZipFile(io.BytesIO(content))
-            for name in z.namelist():
-                if name.lower().endswith(".csv"):
-                    raw = z.read(name).decode("utf-8", errors="ignore")
-                    for row in csv.reader(io.StringIO(raw)):
-                        for col in row:
-                            if "@" in col:
-                                emails.append(col.strip())
-                                break
-                elif name.lower().endswith(".txt"):
-                    for line in z.read(name).decode("utf-8", errors="ignore").splitlines():
-                        if "@" in line:
-                            emails.append(line.strip())
-
-        elif filename.endswith(".csv"):
-            raw = content.decode("utf-8", errors="ignore")
-            for row in csv.reader(io.StringIO(raw)):
-                for col in row:
-                    if "@" in col:
-                        emails.append(col.strip())
-                        break
-        else:
-            # Fallback TXT
-            raw = content.decode("utf-8", errors="ignore")
-            for line in raw.splitlines():
-                if "@" in line:
-                    emails.append(line.strip())
 
-    except Exception as e:
-        logger.exception("parse_failed: %s", e)
-        raise HTTPException(status_code=400, detail="parse_failed")
+@router.get("/my-jobs/count")
+def count_my_jobs(current_user = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Job count for the current user; may be up to MY_JOBS_COUNT_TTL seconds stale."""
+    return {"total": _count_user_jobs(user_id=current_user.id, db=db)}
 
-    # Clean & dedupe
-    emails = [e.lower().strip() for e in emails if "@" in e]
-    emails = list(dict.fromkeys(emails))
 
-    total = len(emails)
-    if total == 0:
-        raise HTTPException(status_code=400, detail="no_valid_emails")
 
-    # ---------------------
-    # PRICING & RESERVATION
-    # ---------------------
-    per_cost = _dec(get_cost_for_key("verify.bulk_per_email"))
-    estimated_cost = (per_cost * Decimal(total)).quantize(Decimal("0.000001"))
+@router.get("/download-url/{job_id}")
+def get_signed_download_url(job_id: str, current_user = Depends(get_current_user), db: Session = Depends(get_db)):
+    job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="job_not_found")
 
-    job_id = f"bulk-{uuid.uuid4().hex[:12]}"
+    if not job.output_path or not job.output_path.startswith("s3://"):
+        raise HTTPException(status_code=400, detail="no_output_available")
 
-    # Reserve credits (team first if provided)
-    reserve_tx = reserve_and_deduct(
-        user.id,
-        estimated_cost,
-        reference=f"{job_id}:reserve",
-        team_id=chosen_team,
-        job_id=job_id,
-    )
+    # Extract object path
+    object_key = job.output_path.replace("s3://", "").split("/", 1)[1]
 
-    # ---------------------
-    # CREATE JOB IN DB
-    # ---------------------
-    db = SessionLocal()
-    try:
-        job = BulkJob(
-            user_id=user.id,
-            job_id=job_id,
-            status="queued",
-            total=total,
-            input_path=input_path,
-            webhook_url=webhook_url,
-            team_id=chosen_team,
-        )
-        db.add(job)
-        db.commit()
-    finally:
-        db.close()
-
-    # ---------------------
-    # ENQUEUE WORKER
-    # ---------------------
-    try:
-        process_bulk_task.delay(job_id, float(estimated_cost))
-    except Exception as e:
-        logger.exception("enqueue_failed: %s", e)
+    from backend.app.services.minio_signed_url import generate_signed_url
+    url = generate_signed_url(object_key, expiry_seconds=1800)
 
-    return {
-        "job_id": job_id,
-        "total": total,
-        "estimated_cost": float(estimated_cost),
-        "reserve_tx": reserve_tx,
-        "team_id": chosen_team,
-    }
-reserve_tx = reserve_and_deduct(
-    user.id,
-    estimated_cost,
-    reference=f"bulk-reserve:{uuid.uuid4().hex[:8]}",
-    team_id=chosen_team,
-    job_id=job_id
-        )
+    return {"download_url": url}
@@ -1,9 +1,11 @@
 
 # backend/app/api/v1/bulk_compat.py
 from fastapi import APIRouter, UploadFile, File, Depends, Request, HTTPException
-from backend.app.utils.security import get_current_user
 from fastapi import status
+from fastapi.security import HTTPAuthorizationCredentials
+from backend.app.utils.security import security, decode_token
 import requests
+import asyncio
 import os
 
 router = APIRouter(prefix="/v1/bulk", tags=["Bulk-Compat"])
@@ -14,19 +16,18 @@ router = APIRouter(prefix="/v1/bulk", tags=["Bulk-Compat"])
 TARGET_BASE = os.getenv("INTERNAL_API_BASE", "http://127.0.0.1:8000")
 
 @router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
-async def upload_csv(file: UploadFile = File(...), request: Request = None, current_user = Depends(get_current_user)):
+async def upload_csv(file: UploadFile = File(...), request: Request = None, creds: HTTPAuthorizationCredentials = Depends(security)):
     """
     Proxy old upload route to new /api/v1/bulk/submit.
-    Streams file to new endpoint; forwards Authorization header.
+    Forwards the spooled upload and the bearer token. The token is checked
+    here (signature / expiry, no user lookup or DB) so unauthenticated
+    uploads are rejected before the file is sent on; the target endpoint
+    still resolves the user.
     """
-    # read file bytes (small overhead). For large files you can write to disk and stream.
-    content = await file.read()
-    headers = {}
-    auth = request.headers.get("authorization")
-    if auth:
-        headers["Authorization"] = auth
+    decode_token(creds.credentials)  # 401 on invalid / expired token
+    headers = {"Authorization": f"Bearer {creds.credentials}"}
 
-    files = {"file": (file.filename, content)}
+    files = {"file": (file.filename, file.file)}
     data = {}
     # If old clients provided webhook_url as form field, forward it
     if "webhook_url" in request.query_params:
@@ -34,7 +35,8 @@ async def upload_csv(file: UploadFile = File(...), request: Request = None, curr
 
     url = f"{TARGET_BASE}/api/v1/bulk/submit"
     try:
-        resp = requests.post(url, headers=headers, files=files, data=data, timeout=30)
+        # requests is blocking; keep it off the event loop
+        resp = await asyncio.to_thread(requests.post, url, headers=headers, files=files, data=data, timeout=30)
     except Exception as e:
         raise HTTPException(status_code=502, detail="proxy_failed")
     if resp.status_code >= 400:
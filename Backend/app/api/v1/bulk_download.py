@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from backend.app.utils.security import get_current_user, get_current_admin
 from backend.app.db import SessionLocal
+from backend.app.models.bulk_job import BulkJob
 import logging
 import os
 
@@ -16,7 +17,6 @@ def download_result(job_id: str, current_user = Depends(get_current_user)):
     """
     db = SessionLocal()
     try:
-        BulkJob = __import__("backend.app.models.bulk_job", fromlist=["BulkJob"]).BulkJob
         job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
         if not job:
             raise HTTPException(status_code=404, detail="job_not_found")
@@ -55,7 +55,6 @@ def download_result(job_id: str, current_user = Depends(get_current_user)):
 def download_admin(job_id: str):
     db = SessionLocal()
     try:
-        BulkJob = __import__("backend.app.models.bulk_job", fromlist=["BulkJob"]).BulkJob
         job = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
         if not job:
             raise HTTPException(status_code=404, detail="job_not_found")
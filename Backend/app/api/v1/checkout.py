@@ -2,7 +2,7 @@
 import stripe
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, Request
-from backend.app.utils.security import get_current_user
+from backend.app.utils.security import get_current_user, invalidate_user
 from backend.app.config import settings
 from backend.app.db import SessionLocal
 from backend.app.models.user import User
@@ -24,13 +24,18 @@ def _ensure_customer(user: User):
         email=user.email,
         metadata={"user_id": user.id}
     )
+    # current_user is a detached per-request copy: write through a row
+    # loaded in this session
     db = SessionLocal()
     try:
-        user.stripe_customer_id = customer.id
-        db.add(user)
-        db.commit()
+        row = db.get(User, user.id)
+        if row is not None:
+            row.stripe_customer_id = customer.id
+            db.commit()
     finally:
         db.close()
+    invalidate_user(user.id)
+    user.stripe_customer_id = customer.id
 
     return customer.id
 
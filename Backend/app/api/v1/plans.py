@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Any
 from backend.app.utils.security import get_current_admin
 from backend.app.db import SessionLocal
+from backend.app.models.user import User
 import logging
 
 router = APIRouter(prefix="/api/v1/plans", tags=["plans"])
@@ -64,7 +65,6 @@ def assign_plan_admin(user_id: int, plan_name: str):
         raise HTTPException(status_code=501, detail="plan_service_missing")
     db = SessionLocal()
     try:
-        User = __import__("backend.app.models.user", fromlist=["User"]).User
         user = db.query(User).get(user_id)
         if not user:
             raise HTTPException(status_code=404, detail="user_not_found")
@@ -1,6 +1,7 @@
 # backend/app/api/v1/subscription_events.py
 from fastapi import APIRouter, Request, HTTPException
 import logging
+import orjson
 from backend.app.db import SessionLocal
 
 router = APIRouter(prefix="/api/v1/subscription-events", tags=["subscriptions"])
@@ -15,11 +16,13 @@ async def subscription_webhook(request: Request):
     - Logs event and saves to DB (if webhook model exists)
     - Returns 200 on success.
     """
+    # read the body once; parse those same bytes (no second read via request.json())
     payload = await request.body()
+    raw = payload.decode("utf-8", errors="ignore")
     try:
-        data = await request.json()
-    except Exception:
-        data = {"raw": payload.decode("utf-8", errors="ignore")}
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        data = {"raw": raw}
 
     logger.info("subscription webhook received: %s", (data if isinstance(data, dict) else str(data)[:200]))
 
@@ -38,7 +41,7 @@ async def subscription_webhook(request: Request):
                 WebhookEvent = None
 
         if WebhookEvent:
-            ev = WebhookEvent(payload=str(data))
+            ev = WebhookEvent(payload=raw)
             db.add(ev)
             db.commit()
         db.close()
@@ -5,6 +5,7 @@ from backend.app.services.acl_check import require_team_permission
 from backend.app.services.acl_matrix import TEAM_PERMISSIONS
 from backend.app.services.team_context import get_user_team
 from backend.app.db import SessionLocal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from backend.app.models.team import Team
 from backend.app.models.team_member import TeamMember, TEAM_ROLES
@@ -114,22 +115,16 @@ def invite_member(payload: InvitePayload, request: Request, current_user=Depends
             db.commit()
             db.refresh(user)
 
-        # check if already member
-        exists = (
-            db.query(TeamMember)
-            .filter(TeamMember.team_id == team_id, TeamMember.user_id == user.id)
-            .first()
-        )
-        if exists:
+        # uq_team_members_team_user rejects duplicates: nothing returned
+        # means the user is already a member
+        inserted = db.execute(
+            pg_insert(TeamMember)
+            .values(team_id=team_id, user_id=user.id, role=payload.role, invited=True)
+            .on_conflict_do_nothing(constraint="uq_team_members_team_user")
+            .returning(TeamMember.id)
+        ).scalar()
+        if inserted is None:
             raise HTTPException(status_code=400, detail="already_member")
-
-        tm = TeamMember(
-            team_id=team_id,
-            user_id=user.id,
-            role=payload.role,
-            invited=True,
-        )
-        db.add(tm)
         db.commit()
 
         return {"ok": True, "user_id": user.id, "role": payload.role}
@@ -4,6 +4,7 @@ from backend.app.db import SessionLocal
 from backend.app.models.team import Team
 from backend.app.models.team_member import TeamMember
 from backend.app.utils.security import get_current_user, get_current_admin
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import uuid
 
 router = APIRouter(prefix="/api/v1/teams", tags=["teams"])
@@ -31,8 +32,12 @@ def add_member(team_id: int, user_id: int, role: str = "member", current_user =
             raise HTTPException(status_code=404, detail="team_not_found")
         if team.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="owner_required")
-        tm = TeamMember(team_id=team_id, user_id=user_id, role=role)
-        db.add(tm); db.commit()
+        db.execute(
+            pg_insert(TeamMember)
+            .values(team_id=team_id, user_id=user_id, role=role)
+            .on_conflict_do_nothing(constraint="uq_team_members_team_user")
+        )
+        db.commit()
         return {"ok": True}
     finally:
         db.close()
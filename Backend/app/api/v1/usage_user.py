@@ -5,6 +5,7 @@ from backend.app.utils.security import get_current_user
 from backend.app.db import SessionLocal
 from datetime import datetime, timedelta
 from sqlalchemy import func
+from backend.app.models.usage_log import UsageLog
 import logging
 
 router = APIRouter(prefix="/api/v1/usage", tags=["usage"])
@@ -19,11 +20,6 @@ def my_usage(days: int = Query(7, ge=1, le=365), current_user = Depends(get_curr
     if not user:
         raise HTTPException(status_code=401, detail="auth_required")
 
-    try:
-        UsageLog = __import__("backend.app.models.usage_log", fromlist=["UsageLog"]).UsageLog
-    except Exception:
-        raise HTTPException(status_code=501, detail="usage_model_missing")
-
     db = SessionLocal()
     try:
         since = datetime.utcnow() - timedelta(days=days)
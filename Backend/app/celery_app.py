@@ -84,8 +84,10 @@ def make_celery_app(app_name: str = "email_verification_saas") -> Celery:
         backend=RESULT_BACKEND,
         include=[
             "backend.app.tasks.bulk_tasks",
+            "backend.app.workers.bulk_tasks",
             "backend.app.tasks.webhook_tasks",
             "backend.app.tasks.dlq_retry_task",
+            "backend.app.tasks.scheduled",
         ],
     )
 
@@ -108,7 +110,7 @@ def make_celery_app(app_name: str = "email_verification_saas") -> Celery:
         timezone=getattr(settings, "TIMEZONE", "UTC"),
         enable_utc=True,
 
-        broker_pool_limit=10,
+        broker_pool_limit=20,
         broker_heartbeat=30,
         result_expires=3600,
 
@@ -137,6 +139,10 @@ def make_celery_app(app_name: str = "email_verification_saas") -> Celery:
             "queue": "bulk_jobs",
             "routing_key": "bulk_jobs",
         },
+        "bulk.process_bulk_task": {
+            "queue": "bulk_jobs",
+            "routing_key": "bulk_jobs",
+        },
         "webhook.task": {
             "queue": "webhooks",
             "routing_key": "webhooks",
@@ -148,13 +154,21 @@ def make_celery_app(app_name: str = "email_verification_saas") -> Celery:
     }
 
     # -----------------------------
-    # CELERY BEAT (DLQ auto retry)
+    # CELERY BEAT (DLQ auto retry, usage rollups, usage_logs partitions)
     # -----------------------------
     celery.conf.beat_schedule = {
         "retry-dlq-every-5min": {
             "task": "dlq.retry.worker",
             "schedule": 300,
-        }
+        },
+        "usage-rollup-every-5min": {
+            "task": "daily_usage_rollup",
+            "schedule": 300,
+        },
+        "usage-log-partitions-daily": {
+            "task": "usage_log_partitions",
+            "schedule": 86400,
+        },
     }
 
     # -----------------------------
@@ -174,3 +188,6 @@ def make_celery_app(app_name: str = "email_verification_saas") -> Celery:
 # Singleton Instance
 # ---------------------------------------------------------
 celery_app = make_celery_app()
+
+# registers the ORM listeners that drop cached job status on every job update
+import backend.app.services.job_status_cache  # noqa: E402,F401
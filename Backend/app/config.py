@@ -4,6 +4,9 @@ from pydantic import BaseSettings, Field
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = Field("sqlite:///./dev.db", env="DATABASE_URL")
+    DB_POOL_SIZE: int = Field(20, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(20, env="DB_MAX_OVERFLOW")
+    DB_POOL_RECYCLE: int = Field(3600, env="DB_POOL_RECYCLE")
 
     # Redis / Celery
     REDIS_URL: str = Field("redis://localhost:6379/0", env="REDIS_URL")
@@ -13,6 +13,7 @@ Features:
 - Use: uvicorn backend.app.main:app --reload
 """
 
+import asyncio
 import importlib
 import logging
 import os
@@ -33,6 +34,31 @@ try:
 except Exception:
     PROM_ENABLED = False
 
+# Migration lifecycle: sync (block startup), async (background task), skip.
+# RUN_MIGRATIONS=1 is kept as an alias for sync.
+MIGRATION_MODE = os.getenv(
+    "MIGRATION_MODE",
+    "sync" if os.getenv("RUN_MIGRATIONS", "0") == "1" else "skip",
+).lower()
+MIGRATION_STATUS = {"mode": MIGRATION_MODE, "state": "skipped" if MIGRATION_MODE == "skip" else "pending"}
+
+
+async def run_migrations_async():
+    """
+    Run `alembic upgrade head` in a worker thread so the event loop keeps
+    serving requests; progress is reported via /health/migrations.
+    """
+    MIGRATION_STATUS["state"] = "running"
+    try:
+        proc = await asyncio.to_thread(subprocess.run, ["alembic", "upgrade", "head"], check=False)
+        MIGRATION_STATUS["returncode"] = proc.returncode
+        MIGRATION_STATUS["state"] = "done" if proc.returncode == 0 else "failed"
+        logger.info(f"Alembic migrations finished (rc={proc.returncode})")
+    except Exception as e:
+        MIGRATION_STATUS["state"] = "failed"
+        MIGRATION_STATUS["error"] = str(e)[:200]
+        logger.debug(f"Alembic migration attempt failed: {e}")
+
 
 # SINGLE APP INSTANCE (app factory pattern)
 def create_app() -> FastAPI:
@@ -234,6 +260,23 @@ except Exception as e:
     async def health():
         return {"status": "ok"}
 
+    @app.get("/health/migrations")
+    async def health_migrations():
+        status = dict(MIGRATION_STATUS)
+        try:
+            from alembic.runtime.migration import MigrationContext
+            from backend.app.db import engine
+
+            def _current_revision():
+                with engine.connect() as conn:
+                    return MigrationContext.configure(conn).get_current_revision()
+
+            status["current_revision"] = await asyncio.to_thread(_current_revision)
+        except Exception as e:
+            status["current_revision"] = None
+            status["revision_error"] = str(e)[:200]
+        return status
+
     @app.get("/ready")
     async def ready():
         checks = {}
@@ -296,14 +339,13 @@ except Exception as e:
         except Exception as e:
             logger.debug(f"MinIO ensure skipped: {e}")
 
-        # optional alembic migrations (run only if env says so)
-        try:
-            if os.environ.get("RUN_MIGRATIONS", "0") == "1":
-                # run migrations synchronously, catch errors
-                subprocess.run(["alembic", "upgrade", "head"], check=False)
-                logger.info("Alembic migrations attempted")
-        except Exception as e:
-            logger.debug(f"Alembic migration attempt failed: {e}")
+        # optional alembic migrations (MIGRATION_MODE=sync|async|skip)
+        if MIGRATION_MODE == "sync":
+            await run_migrations_async()
+        elif MIGRATION_MODE == "async":
+            # keep a reference: the loop holds tasks weakly, an unreferenced
+            # one can be garbage-collected mid-run
+            app.state.migration_task = asyncio.create_task(run_migrations_async())
 
     return app
 
@@ -1,6 +1,9 @@
 from datetime import datetime
+from decimal import Decimal
+
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, DateTime, func
+from sqlalchemy import BigInteger, Integer, DateTime, func
+from sqlalchemy.types import TypeDecorator
 
 
 class IdMixin:
@@ -15,11 +18,25 @@ class IdMixin:
     )
 
 
+class BigIdMixin:
+    """
+    BIGINT auto-increment primary key for append-heavy tables
+    (usage logs, ledger rows, bulk jobs) that can outgrow INT4.
+    """
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=True,
+        index=True
+    )
+
+
 class TimestampMixin:
     """
     Adds created_at and updated_at timestamps.
     - created_at: set on insert
-    - updated_at: updated automatically on update
+    - updated_at: set on update by the set_updated_at() DB trigger
+      (server_onupdate makes the ORM re-fetch it after a flush)
     """
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -33,3 +50,28 @@ class TimestampMixin:
         server_onupdate=func.now(),
         nullable=False
     )
+
+
+# 1 credit (or 1 USD) = 1_000_000 micro-credits
+MICRO_CREDITS_SCALE = 1_000_000
+_MICRO_QUANT = Decimal("0.000001")
+
+
+class MicroCredits(TypeDecorator):
+    """
+    Credit / money amount stored as a BIGINT count of micro-credits.
+    Python code keeps working with Decimal (6 decimal places); Postgres
+    does int8 arithmetic instead of arbitrary-precision numeric.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((Decimal(str(value)) * MICRO_CREDITS_SCALE).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return (Decimal(value) / MICRO_CREDITS_SCALE).quantize(_MICRO_QUANT)
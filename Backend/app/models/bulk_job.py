@@ -4,19 +4,19 @@ from sqlalchemy import (
     String,
     Text,
     ForeignKey,
-    Numeric,
     Boolean,
     DateTime,
-    Index
+    Index,
+    text
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import BigIdMixin, TimestampMixin, MicroCredits
 
 
-class BulkJob(Base, IdMixin, TimestampMixin):
+class BulkJob(Base, BigIdMixin, TimestampMixin):
     """
     Represents a bulk email verification job.
     Supports:
@@ -33,15 +33,14 @@ class BulkJob(Base, IdMixin, TimestampMixin):
     # --------------------------------------
     # Ownership
     # --------------------------------------
+    # user_id / team_id lookups are served by the composite indexes below
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
         nullable=False
     )
 
     team_id: Mapped[int | None] = mapped_column(
         ForeignKey("teams.id", ondelete="SET NULL"),
-        index=True,
         nullable=True
     )
 
@@ -64,7 +63,7 @@ class BulkJob(Base, IdMixin, TimestampMixin):
         default="queued",
         index=True
     )
-    # queued, running, completed, failed, cancelled
+    # counting (zip, total not known yet), queued, running, completed, failed, cancelled
 
     # --------------------------------------
     # File paths (local or S3)
@@ -96,7 +95,7 @@ class BulkJob(Base, IdMixin, TimestampMixin):
     # Billing
     # --------------------------------------
     estimated_cost: Mapped[float | None] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=True
     )
 
@@ -107,6 +106,8 @@ class BulkJob(Base, IdMixin, TimestampMixin):
     __table_args__ = (
         Index("idx_bulkjob_status_user", "status", "user_id"),
         Index("idx_bulkjob_status_team", "status", "team_id"),
+        Index("ix_bulk_jobs_team_status", "team_id", "status"),
+        Index("ix_bulk_jobs_user_created_id", "user_id", text("created_at DESC"), text("id DESC")),
     )
 
     def __repr__(self):
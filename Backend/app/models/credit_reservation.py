@@ -1,6 +1,5 @@
 from sqlalchemy import (
     Integer,
-    Numeric,
     String,
     Boolean,
     DateTime,
@@ -10,10 +9,10 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import BigIdMixin, TimestampMixin, MicroCredits
 
 
-class CreditReservation(Base, IdMixin, TimestampMixin):
+class CreditReservation(Base, BigIdMixin, TimestampMixin):
     """
     Temporary reservation of credits for:
     - bulk jobs
@@ -46,7 +45,7 @@ class CreditReservation(Base, IdMixin, TimestampMixin):
     # Reservation details
     # --------------------------------------
     amount: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False
     )
 
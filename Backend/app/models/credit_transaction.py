@@ -1,6 +1,5 @@
 from sqlalchemy import (
     Integer,
-    Numeric,
     String,
     Text,
     ForeignKey,
@@ -9,10 +8,10 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import BigIdMixin, TimestampMixin, MicroCredits
 
 
-class CreditTransaction(Base, IdMixin, TimestampMixin):
+class CreditTransaction(Base, BigIdMixin, TimestampMixin):
     """
     Record of credit usage:
     - amount positive = topup
@@ -44,12 +43,12 @@ class CreditTransaction(Base, IdMixin, TimestampMixin):
     # Transaction details
     # --------------------------------------
     amount: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False
     )
 
     balance_after: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False
     )
 
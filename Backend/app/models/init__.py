@@ -46,6 +46,7 @@ from .webhook_dlq import WebhookDLQ
 from .usage_log import UsageLog
 from .audit_log import AuditLog
 from .api_usage_summary import ApiUsageSummary
+from .usage_log_daily import UsageLogDaily, UsageLogDailyUser, UsageLogDailyKey
 
 # -----------------------------------
 # Enterprise Add-Ons
@@ -5,9 +5,10 @@ from sqlalchemy import (
     Numeric,
     DateTime,
     ForeignKey,
-    Text,
     Index,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.db import Base
@@ -116,11 +117,22 @@ class Subscription(Base, IdMixin, TimestampMixin):
     # ----------------------------------------
     # Raw Stripe Webhook Data (Optional)
     # ----------------------------------------
-    raw: Mapped[str | None] = mapped_column(Text, nullable=True)
+    raw: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     __table_args__ = (
         Index("idx_subscription_user_status", "user_id", "status"),
         Index("idx_subscription_plan_status", "plan_id", "status"),
+        Index(
+            "ix_subscriptions_active_user",
+            "user_id",
+            postgresql_where=text("status IN ('active', 'trialing')"),
+        ),
+        Index(
+            "ix_subscriptions_raw_gin",
+            "raw",
+            postgresql_using="gin",
+            postgresql_ops={"raw": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self):
@@ -4,14 +4,14 @@ from sqlalchemy import (
     String,
     Boolean,
     ForeignKey,
-    Numeric,
     JSON,
     Index,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import IdMixin, TimestampMixin, MicroCredits
 
 
 class Team(Base, IdMixin, TimestampMixin):
@@ -47,7 +47,7 @@ class Team(Base, IdMixin, TimestampMixin):
     # Billing & Credits
     # ------------------------------------
     credits: Mapped[float] = mapped_column(
-        Numeric(18, 2),
+        MicroCredits,
         nullable=False,
         server_default="0"
     )
@@ -56,6 +56,9 @@ class Team(Base, IdMixin, TimestampMixin):
 
     settings: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
+    # "metadata" is reserved by Declarative → stored as meta_json
+    meta_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # ------------------------------------
@@ -1,13 +1,12 @@
 from sqlalchemy import (
     Integer,
-    Numeric,
     ForeignKey,
     Index
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import IdMixin, TimestampMixin, MicroCredits
 
 
 class TeamBalance(Base, IdMixin, TimestampMixin):
@@ -34,7 +33,7 @@ class TeamBalance(Base, IdMixin, TimestampMixin):
     # Current Balance
     # --------------------------------------
     balance: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False,
         default=0
     )
@@ -1,15 +1,15 @@
 from sqlalchemy import (
     Integer,
-    Numeric,
     String,
-    Text,
     ForeignKey,
     Index
 )
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import IdMixin, TimestampMixin, MicroCredits
 
 
 class TeamCreditTransaction(Base, IdMixin, TimestampMixin):
@@ -34,12 +34,12 @@ class TeamCreditTransaction(Base, IdMixin, TimestampMixin):
     # Transaction values
     # --------------------------------------
     amount: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False
     )  # positive = topup, negative = debit
 
     balance_after: Mapped[float] = mapped_column(
-        Numeric(18, 6),
+        MicroCredits,
         nullable=False
     )
 
@@ -54,14 +54,21 @@ class TeamCreditTransaction(Base, IdMixin, TimestampMixin):
         nullable=True
     )
 
-    # SQLAlchemy reserved keyword → rename to details
-    details: Mapped[str | None] = mapped_column(
-        Text,
-        nullable=True
+    # SQLAlchemy reserved keyword "metadata" → stored as meta_json
+    meta_json: Mapped[dict | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        server_default=text("'{}'::jsonb")
     )
 
     __table_args__ = (
         Index("idx_team_credit_txn_team_type", "team_id", "type"),
+        Index(
+            "ix_team_credit_transactions_meta_gin",
+            "meta_json",
+            postgresql_using="gin",
+            postgresql_ops={"meta_json": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self):
@@ -3,7 +3,8 @@ from sqlalchemy import (
     String,
     Boolean,
     ForeignKey,
-    DateTime
+    DateTime,
+    UniqueConstraint
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -30,9 +31,9 @@ class TeamMember(Base, IdMixin, TimestampMixin):
     # --------------------------------------
     # Foreign Keys
     # --------------------------------------
+    # lookups by team_id use the uq_team_members_team_user prefix
     team_id: Mapped[int] = mapped_column(
         ForeignKey("teams.id", ondelete="CASCADE"),
-        index=True,
         nullable=False
     )
 
@@ -65,6 +66,11 @@ class TeamMember(Base, IdMixin, TimestampMixin):
     team = relationship("Team", back_populates="members")
     user = relationship("User", back_populates="teams")
 
+    __table_args__ = (
+        # created by 0015_team_members_unique_team_user
+        UniqueConstraint("team_id", "user_id", name="uq_team_members_team_user"),
+    )
+
     def __repr__(self):
         return (
             f"<TeamMember id={self.id} team={self.team_id} "
@@ -9,10 +9,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from backend.app.db import Base
-from backend.app.models.base import IdMixin
+from backend.app.models.base import BigIdMixin
 
 
-class UsageLog(Base, IdMixin):
+class UsageLog(Base, BigIdMixin):
     """
     Records every API usage event:
     - which user made the request
@@ -74,15 +74,24 @@ class UsageLog(Base, IdMixin):
     # --------------------------------------
     # Timestamp
     # --------------------------------------
+    # partition key: part of the primary key (id, created_at), as in 0007
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
-        index=True
+        nullable=False
     )
 
     __table_args__ = (
         Index("idx_usage_user_time", "user_id", "created_at"),
         Index("idx_usage_api_key_time", "api_key_id", "created_at"),
+        # time-window scans (usage rollup) are index-only
+        Index(
+            "ix_usage_logs_created_endpoint",
+            "created_at",
+            "endpoint",
+            postgresql_include=["user_id", "api_key_id"],
+        ),
     )
 
     def __repr__(self):
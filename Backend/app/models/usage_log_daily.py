@@ -0,0 +1,48 @@
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    String,
+    Date,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db import Base
+
+
+class UsageLogDaily(Base):
+    """
+    Requests per (UTC day, endpoint), rolled up from usage_logs by the
+    daily_usage_rollup task. Admin analytics read this instead of
+    scanning usage_logs.
+    """
+
+    __tablename__ = "usage_log_daily"
+
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    endpoint: Mapped[str] = mapped_column(String(255), primary_key=True)
+    requests: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<UsageLogDaily day={self.day} endpoint={self.endpoint} requests={self.requests}>"
+
+
+class UsageLogDailyUser(Base):
+    """
+    Distinct users seen per UTC day (unique-user counts over a window).
+    """
+
+    __tablename__ = "usage_log_daily_users"
+
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+class UsageLogDailyKey(Base):
+    """
+    Distinct API keys seen per UTC day (unique-key counts over a window).
+    """
+
+    __tablename__ = "usage_log_daily_keys"
+
+    day: Mapped[Date] = mapped_column(Date, primary_key=True)
+    api_key_id: Mapped[int] = mapped_column(Integer, primary_key=True)
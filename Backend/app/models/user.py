@@ -1,13 +1,12 @@
 from sqlalchemy import (
     String,
     Boolean,
-    Numeric,
     Index,
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from backend.app.db import Base
-    from backend.app.models.base import IdMixin, TimestampMixin
+from backend.app.models.base import IdMixin, TimestampMixin, MicroCredits
 
 
 class User(Base, IdMixin, TimestampMixin):
@@ -56,7 +55,7 @@ class User(Base, IdMixin, TimestampMixin):
     )
 
     credits: Mapped[float] = mapped_column(
-        Numeric(18, 2),
+        MicroCredits,
         nullable=False,
         server_default="0"
     )
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     String,
     Integer,
     Boolean,
@@ -7,6 +8,7 @@ from sqlalchemy import (
     Index,
     Text,
     DateTime,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -42,6 +44,7 @@ class VerificationResult(Base, IdMixin, TimestampMixin):
     )
 
     bulk_job_id: Mapped[int | None] = mapped_column(
+        BigInteger,
         ForeignKey("bulk_jobs.id", ondelete="SET NULL"),
         nullable=True,
         index=True
@@ -131,6 +134,9 @@ class VerificationResult(Base, IdMixin, TimestampMixin):
     __table_args__ = (
         Index("idx_verify_user_email", "user_id", "email"),
         Index("idx_verify_domain_status", "domain", "status"),
+        # admin recent-failures / per-user history: index order matches the ORDER BY
+        Index("ix_vr_invalid_created", text("created_at DESC"), postgresql_where=text("status = 'invalid'")),
+        Index("ix_vr_user_created", "user_id", text("created_at DESC")),
     )
 
     def __repr__(self):
@@ -10,9 +10,10 @@ class WebhookDLQ(Base):
     payload = Column(Text, nullable=False)
     headers = Column(Text, nullable=True)
 
-    error_message = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
     attempts = Column(Integer, default=0)
-    resolved = Column(Boolean, default=False)
+    processed = Column(Boolean, default=False, nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
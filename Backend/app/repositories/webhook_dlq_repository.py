@@ -1,10 +1,28 @@
 # backend/app/repositories/webhook_dlq_repository.py
 
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from backend.app.db import SessionLocal
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.db import SessionLocal, get_db
 from backend.app.models.webhook_dlq import WebhookDLQ
 
+# columns the admin list endpoints return
+_LIST_COLUMNS = (
+    WebhookDLQ.id,
+    WebhookDLQ.url,
+    WebhookDLQ.payload,
+    WebhookDLQ.headers,
+    WebhookDLQ.error,
+    WebhookDLQ.attempts,
+    WebhookDLQ.processed,
+    WebhookDLQ.created_at,
+)
+
 
 class WebhookDLQRepository:
     """
@@ -14,8 +32,25 @@ class WebhookDLQRepository:
     - Mark processed
     - Increment attempts
     - List all or only failed
+
+    Pass the request's session (see get_dlq_repo) from API handlers; without
+    one (Celery tasks) every call opens and closes its own session.
     """
 
+    def __init__(self, db: Session | None = None):
+        self.db = db
+
+    @contextmanager
+    def _session(self):
+        if self.db is not None:
+            yield self.db
+            return
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
     def save(self,
              url: str,
              payload: Dict[str, Any] | str,
@@ -25,8 +60,7 @@ class WebhookDLQRepository:
         """
         Save a permanently failed webhook entry into DLQ.
         """
-        db = SessionLocal()
-        try:
+        with self._session() as db:
             entry = WebhookDLQ(
                 url=url,
                 payload=payload if isinstance(payload, (dict, list)) else payload,
@@ -39,8 +73,6 @@ class WebhookDLQRepository:
             db.commit()
             db.refresh(entry)
             return entry
-        finally:
-            db.close()
 
     def list(self,
              limit: int = 100,
@@ -50,8 +82,7 @@ class WebhookDLQRepository:
         List DLQ entries.
         Set only_unprocessed=False -> fetch ALL entries.
         """
-        db = SessionLocal()
-        try:
+        with self._session() as db:
             q = db.query(WebhookDLQ)
             if only_unprocessed:
                 q = q.filter(WebhookDLQ.processed == False)
@@ -60,23 +91,32 @@ class WebhookDLQRepository:
                     .limit(limit) \
                     .offset(offset) \
                     .all()
-        finally:
-            db.close()
+
+    def list_rows(self,
+                  limit: int = 100,
+                  offset: int = 0,
+                  only_unprocessed: bool = True) -> List[Dict[str, Any]]:
+        """
+        Same as list(), but as plain column mappings: no ORM instances,
+        identity map or attribute instrumentation for read-only listings.
+        """
+        stmt = select(*_LIST_COLUMNS)
+        if only_unprocessed:
+            stmt = stmt.where(WebhookDLQ.processed == False)
+        stmt = stmt.order_by(WebhookDLQ.created_at.asc()).limit(limit).offset(offset)
+        with self._session() as db:
+            return db.execute(stmt).mappings().all()
 
     def get(self, entry_id: int) -> Optional[WebhookDLQ]:
-        db = SessionLocal()
-        try:
-            return db.query(WebhookDLQ).get(entry_id)
-        finally:
-            db.close()
+        with self._session() as db:
+            return db.get(WebhookDLQ, entry_id)
 
     def mark_processed(self, entry_id: int) -> bool:
         """
         Mark a DLQ entry as resolved.
         """
-        db = SessionLocal()
-        try:
-            entry = db.query(WebhookDLQ).get(entry_id)
+        with self._session() as db:
+            entry = db.get(WebhookDLQ, entry_id)
             if not entry:
                 return False
 
@@ -86,32 +126,45 @@ class WebhookDLQRepository:
             db.add(entry)
             db.commit()
             return True
-        finally:
-            db.close()
+
+    def mark_processed_many(self, entry_ids: List[int]) -> int:
+        """
+        Mark many DLQ entries as resolved with a single UPDATE.
+        Returns the number of rows updated.
+        """
+        if not entry_ids:
+            return 0
+        with self._session() as db:
+            updated = (
+                db.query(WebhookDLQ)
+                .filter(WebhookDLQ.id.in_(entry_ids))
+                .update(
+                    {WebhookDLQ.processed: True, WebhookDLQ.processed_at: datetime.utcnow()},
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return updated
 
     def delete(self, entry_id: int) -> bool:
         """
         Permanently delete DLQ entry.
         """
-        db = SessionLocal()
-        try:
-            entry = db.query(WebhookDLQ).get(entry_id)
+        with self._session() as db:
+            entry = db.get(WebhookDLQ, entry_id)
             if not entry:
                 return False
 
             db.delete(entry)
             db.commit()
             return True
-        finally:
-            db.close()
 
     def increment_attempts(self, entry_id: int, error: str | None = None) -> None:
         """
         Increment retry attempts + update last error message.
         """
-        db = SessionLocal()
-        try:
-            entry = db.query(WebhookDLQ).get(entry_id)
+        with self._session() as db:
+            entry = db.get(WebhookDLQ, entry_id)
             if not entry:
                 return
 
@@ -121,5 +174,8 @@ class WebhookDLQRepository:
 
             db.add(entry)
             db.commit()
-        finally:
-            db.close()
+
+
+def get_dlq_repo(db: Session = Depends(get_db)) -> WebhookDLQRepository:
+    """FastAPI dependency: DLQ repository bound to the request's session."""
+    return WebhookDLQRepository(db)
@@ -27,6 +27,10 @@ except Exception:
 DOMAIN_REPUTATION_KEY = "domain:reputation:{}"     # stores JSON
 GOOD_KEY = "domain:{}:good"
 BAD_KEY = "domain:{}:bad"
+GOOD_RATIO_ZSET = "domain:ratios"        # member=domain, score=good / total
+FAIL_RATE_ZSET = "domain:fail_rates"     # member=domain, score=bad / total
+TOTALS_HASH = "deliverability:totals"    # fields good / bad, summed over all domains
+RANKINGS_SEEDED_KEY = "domain:rankings:seeded"
 
 REPUTATION_CACHE_TTL = 86400   # 24 hours (optional)
 
@@ -35,23 +39,103 @@ REPUTATION_CACHE_TTL = 86400   # 24 hours (optional)
 # RECORD DOMAIN HISTORY
 # ---------------------------------------------
 
+# KEYS: good counter, bad counter, ratio zset, fail-rate zset, totals hash
+# ARGV: domain, "1" on success / "0" on failure
+# Bumps the counter and the global totals and re-scores the domain in both
+# rankings atomically, in one round-trip, so neither top-K nor summary
+# reads have to touch every domain.
+_RECORD_RESULT_LUA = """
+local good = tonumber(redis.call('GET', KEYS[1]) or '0')
+local bad = tonumber(redis.call('GET', KEYS[2]) or '0')
+if ARGV[2] == '1' then
+  good = redis.call('INCR', KEYS[1])
+  redis.call('HINCRBY', KEYS[5], 'good', 1)
+else
+  bad = redis.call('INCR', KEYS[2])
+  redis.call('HINCRBY', KEYS[5], 'bad', 1)
+end
+local total = good + bad
+redis.call('ZADD', KEYS[3], tostring(good / total), ARGV[1])
+redis.call('ZADD', KEYS[4], tostring(bad / total), ARGV[1])
+return total
+"""
+
+_RECORD_RESULT = REDIS.register_script(_RECORD_RESULT_LUA) if REDIS else None
+
+
 def record_domain_result(domain: str, success: bool):
     """
-    Increment historical counters.
+    Increment historical counters and the domain rankings.
     """
     if not REDIS:
         return
 
     try:
-        if success:
-            REDIS.incr(GOOD_KEY.format(domain))
-        else:
-            REDIS.incr(BAD_KEY.format(domain))
+        _RECORD_RESULT(
+            keys=[GOOD_KEY.format(domain), BAD_KEY.format(domain), GOOD_RATIO_ZSET, FAIL_RATE_ZSET, TOTALS_HASH],
+            args=[domain, "1" if success else "0"],
+        )
     except Exception:
         # NEVER break main verification flow
         pass
 
 
+def rebuild_domain_rankings(r=None) -> int:
+    """
+    Re-score every domain in GOOD_RATIO_ZSET / FAIL_RATE_ZSET and reset
+    TOTALS_HASH from the domain:<d>:good|bad counters, which stay the source
+    of truth (for counters written before the aggregates existed). SCANs the
+    keyspace and pipelines the reads. Returns the number of domains ranked.
+    """
+    r = r or REDIS
+    if not r:
+        return 0
+
+    domains = set()
+    for suffix in ("good", "bad"):
+        for k in r.scan_iter(match=f"domain:*:{suffix}", count=1000):
+            domains.add(k.decode().split(":")[1])
+    domains = list(domains)
+
+    pipe = r.pipeline(transaction=False)
+    for domain in domains:
+        pipe.get(GOOD_KEY.format(domain))
+        pipe.get(BAD_KEY.format(domain))
+    values = pipe.execute()
+
+    ratios, fail_rates = {}, {}
+    good_total = bad_total = 0
+    for i, domain in enumerate(domains):
+        good, bad = int(values[2 * i] or 0), int(values[2 * i + 1] or 0)
+        good_total += good
+        bad_total += bad
+        total = good + bad
+        if total == 0:
+            continue
+        ratios[domain] = good / total
+        fail_rates[domain] = bad / total
+
+    pipe = r.pipeline(transaction=False)
+    if ratios:
+        pipe.zadd(GOOD_RATIO_ZSET, ratios)
+        pipe.zadd(FAIL_RATE_ZSET, fail_rates)
+    pipe.hset(TOTALS_HASH, mapping={"good": good_total, "bad": bad_total})
+    pipe.set(RANKINGS_SEEDED_KEY, 1)
+    pipe.execute()
+    return len(ratios)
+
+
+def ensure_domain_aggregates(r=None):
+    """
+    Seed the rankings / totals once per Redis dataset. record_domain_result
+    creates the keys on the first event, so their existence alone does not
+    mean older counters were folded in.
+    """
+    r = r or REDIS
+    if r and not r.exists(RANKINGS_SEEDED_KEY):
+        rebuild_domain_rankings(r)
+
+
 # ---------------------------------------------
 # COMPUTE DOMAIN REPUTATION SCORE
 # ---------------------------------------------
@@ -0,0 +1,77 @@
+# backend/app/services/job_status_cache.py
+"""
+Short-lived Redis cache for admin job-status polling.
+
+Admin UIs poll bulk / extractor job status every second or two. Each poll is
+a cheap PK read, but concurrent pollers still hold pool connections; the
+job dict is cached for JOB_CACHE_TTL seconds. Redis errors fall through to
+the DB.
+
+Invalidation:
+- the after_update listeners below fire on ORM flushes of a job row only;
+  Core update() and raw-SQL writes (migration backfills, bulk UPDATEs) skip
+  them and are served stale for up to one TTL.
+- the listeners run at flush, before the commit, so a poll in between can
+  re-cache the old row. Workers therefore call invalidate_job() after each
+  status / progress commit.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from sqlalchemy import event
+
+from backend.app.config import settings
+from backend.app.models.bulk_job import BulkJob
+from backend.app.models.extractor_job import ExtractorJob
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS = redis.from_url(settings.REDIS_URL)
+except Exception:
+    REDIS = None  # no cache, always read the DB
+
+JOB_CACHE_KEY = "job:{}:{}"     # kind ("bulk" / "extractor"), job_id
+JOB_CACHE_TTL = 3               # seconds
+
+
+def get_cached_job(kind: str, job_id: str) -> Optional[Dict[str, Any]]:
+    if not REDIS:
+        return None
+    try:
+        raw = REDIS.get(JOB_CACHE_KEY.format(kind, job_id))
+    except redis.exceptions.RedisError:
+        return None
+    return orjson.loads(raw) if raw else None
+
+
+def cache_job(kind: str, job_id: str, payload: Dict[str, Any]) -> None:
+    if not REDIS:
+        return
+    try:
+        REDIS.setex(JOB_CACHE_KEY.format(kind, job_id), JOB_CACHE_TTL, orjson.dumps(payload))
+    except redis.exceptions.RedisError:
+        logger.debug("job cache write skipped for %s:%s", kind, job_id)
+
+
+def invalidate_job(kind: str, job_id: str) -> None:
+    if not REDIS or not job_id:
+        return
+    try:
+        REDIS.delete(JOB_CACHE_KEY.format(kind, job_id))
+    except redis.exceptions.RedisError:
+        logger.debug("job cache invalidation skipped for %s:%s", kind, job_id)
+
+
+# ORM flushes of a job row (API handlers and anything else using the Session)
+@event.listens_for(BulkJob, "after_update")
+def _bulk_job_updated(mapper, connection, target):
+    invalidate_job("bulk", target.job_id)
+
+
+@event.listens_for(ExtractorJob, "after_update")
+def _extractor_job_updated(mapper, connection, target):
+    invalidate_job("extractor", target.job_id)
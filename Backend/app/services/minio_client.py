@@ -246,7 +246,10 @@ Provides:
 from minio import Minio
 from minio.error import S3Error
 from backend.app.config import settings
-import io, logging
+import io, os, logging
+
+import certifi
+import urllib3
 
 logger = logging.getLogger(__name__)
 
@@ -255,12 +258,29 @@ MINIO_ACCESS_KEY = getattr(settings, "MINIO_ROOT_USER", getattr(settings, "MINIO
 MINIO_SECRET_KEY = getattr(settings, "MINIO_ROOT_PASSWORD", getattr(settings, "MINIO_SECRET_KEY", "minioadmin"))
 MINIO_BUCKET = getattr(settings, "MINIO_BUCKET", "app-uploads")
 
-# Create MinIO client
+# keep-alive connections shared by every request/task in the process;
+# urllib3's default of 10 per host starves concurrent bulk uploads
+MINIO_POOL_MAXSIZE = int(getattr(settings, "MINIO_POOL_MAXSIZE", 64))
+
+
+def _http_client() -> urllib3.PoolManager:
+    return urllib3.PoolManager(
+        num_pools=4,
+        maxsize=MINIO_POOL_MAXSIZE,
+        timeout=urllib3.Timeout(connect=10, read=300),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=3, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504]),
+    )
+
+
+# Create MinIO client (one per process, reused for every call)
 client = Minio(
     MINIO_ENDPOINT,
     access_key=MINIO_ACCESS_KEY,
     secret_key=MINIO_SECRET_KEY,
-    secure=str(getattr(settings, "MINIO_SECURE", "false")).lower() in ("1", "true", "yes")
+    secure=str(getattr(settings, "MINIO_SECURE", "false")).lower() in ("1", "true", "yes"),
+    http_client=_http_client(),
 )
 
 def ensure_bucket(bucket_name: str = None):
@@ -299,6 +319,19 @@ def get_object_bytes(object_name: str, bucket: str = None) -> bytes:
         logger.exception("get_object_bytes failed")
         raise
 
+def open_object(object_name: str, bucket: str = None):
+    """
+    Streaming counterpart of get_object_bytes: returns the raw (file-like)
+    response so callers can read it incrementally. Caller must close() and
+    release_conn() it.
+    """
+    b = bucket or MINIO_BUCKET
+    try:
+        return client.get_object(b, object_name)
+    except Exception:
+        logger.exception("open_object failed")
+        raise
+
 def presign_get(bucket: str, object_name: str, expires: int = 3600) -> str:
     """
     Return presigned GET URL for object. expires in seconds (int).
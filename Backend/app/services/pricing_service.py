@@ -1,10 +1,11 @@
 # backend/app/services/pricing_service.py
 
 import logging
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict
 
 from backend.app.config import settings
+from backend.app.utils.ttl_cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +34,17 @@ DEFAULT_PRICING: Dict[str, Decimal] = {
 
 PRICING_OVERRIDE = getattr(settings, "PRICING_OVERRIDE", {}) or {}
 
+# pricing only changes on deploy or admin override; hot paths (bulk submit)
+# reuse the computed map for this long (set_pricing_map clears it)
+PRICING_CACHE_TTL = 60
 
-def get_pricing_map() -> Dict[str, Decimal]:
-    """
-    Returns final computed pricing map:
-        DEFAULT_PRICING → overridden by environment (if provided)
-    """
+# credit amounts are 6-dp everywhere; prices are quantized once per build so
+# callers can multiply them directly instead of re-normalizing per request
+_Q6 = Decimal("0.000001")
+
+
+@ttl_cache(ttl=PRICING_CACHE_TTL, maxsize=1)
+def _build_pricing_map() -> Dict[str, Decimal]:
     pricing = DEFAULT_PRICING.copy()
 
     # apply environment overrides
@@ -48,16 +54,33 @@ def get_pricing_map() -> Dict[str, Decimal]:
     except Exception as e:
         logger.error("Invalid pricing override in settings: %s", e)
 
-    return pricing
+    return {k: v.quantize(_Q6, rounding=ROUND_HALF_UP) for k, v in pricing.items()}
+
+
+def get_pricing_map() -> Dict[str, Decimal]:
+    """
+    Returns final computed pricing map:
+        DEFAULT_PRICING → overridden by environment (if provided)
+    """
+    return dict(_build_pricing_map())
+
+
+def set_pricing_map(overrides: Dict[str, float]) -> None:
+    """
+    Admin override (in-memory, per process). Clears the cached map so the
+    new prices apply immediately in this worker.
+    """
+    PRICING_OVERRIDE.update({k: str(v) for k, v in overrides.items()})
+    _build_pricing_map.cache_clear()
 
 
 def get_cost_for_key(key: str) -> Decimal:
     """
-    Get cost for an operation.
+    Get cost for an operation, already quantized to 6 dp.
     Returns Decimal("0") if key unknown.
     """
     try:
-        return get_pricing_map().get(key, Decimal("0"))
+        return _build_pricing_map().get(key, Decimal("0"))
     except Exception as e:
         logger.error("Invalid pricing lookup for '%s': %s", key, e)
         return Decimal("0")
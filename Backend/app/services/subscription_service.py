@@ -41,7 +41,7 @@ def upsert_subscription_from_stripe(sub: dict):
             existing.price_interval = sub["items"]["data"][0]["price"]["recurring"]["interval"]
             existing.current_period_start = sub["current_period_start"]
             existing.current_period_end = sub["current_period_end"]
-            existing.raw = str(sub)
+            existing.raw = sub
             db.commit()
             return existing
 
@@ -57,7 +57,7 @@ def upsert_subscription_from_stripe(sub: dict):
             price_interval=sub["items"]["data"][0]["price"]["recurring"]["interval"],
             current_period_start=sub.get("current_period_start"),
             current_period_end=sub.get("current_period_end"),
-            raw=str(sub)
+            raw=sub
         )
 
         db.add(new)
@@ -0,0 +1,229 @@
+# backend/app/services/usage_rollup.py
+"""
+Daily rollups of usage_logs for the admin analytics / billing endpoints.
+
+usage_log_daily holds requests per (UTC day, endpoint); usage_log_daily_users
+and usage_log_daily_keys hold the distinct users / API keys seen per day, so a
+window's unique count is a COUNT(DISTINCT) over at most (days x active users)
+rows instead of every request in the window.
+
+Unique users / API keys over a window are answered from Redis HyperLogLogs
+(one per UTC day plus an all-time one, ~0.8% error) fed from the rows the
+rollup inserts; the exact COUNT(DISTINCT) over the per-day tables is the
+fallback when Redis is down or not seeded yet.
+
+usage_logs itself is RANGE-partitioned by month (migration 0007); the months
+ahead are created by ensure_usage_log_partitions on a schedule, so new rows
+never pile up in usage_logs_default.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import text
+
+from backend.app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS = redis.from_url(settings.REDIS_URL)
+except Exception:
+    REDIS = None  # exact SQL fallback
+
+# today's bucket keeps growing and yesterday's can still get late rows,
+# so every run re-aggregates both
+ROLLUP_LOOKBACK_DAYS = 1
+
+_DAY = "(created_at AT TIME ZONE 'UTC')::date"
+
+_ROLLUP_REQUESTS = text(
+    f"""
+    INSERT INTO usage_log_daily (day, endpoint, requests)
+    SELECT {_DAY}, endpoint, count(*)
+    FROM usage_logs
+    WHERE created_at >= :since
+    GROUP BY 1, 2
+    ON CONFLICT (day, endpoint) DO UPDATE SET requests = EXCLUDED.requests
+    """
+)
+
+# RETURNING only yields rows that were actually inserted, i.e. the
+# (day, id) pairs not seen by an earlier run -> exactly what the HLLs miss
+_ROLLUP_USERS = text(
+    f"""
+    INSERT INTO usage_log_daily_users (day, user_id)
+    SELECT DISTINCT {_DAY}, user_id
+    FROM usage_logs
+    WHERE created_at >= :since AND user_id IS NOT NULL
+    ON CONFLICT DO NOTHING
+    RETURNING day, user_id
+    """
+)
+
+_ROLLUP_KEYS = text(
+    f"""
+    INSERT INTO usage_log_daily_keys (day, api_key_id)
+    SELECT DISTINCT {_DAY}, api_key_id
+    FROM usage_logs
+    WHERE created_at >= :since AND api_key_id IS NOT NULL
+    ON CONFLICT DO NOTHING
+    RETURNING day, api_key_id
+    """
+)
+
+# ---------------------------------------------
+# MONTHLY PARTITIONS
+# ---------------------------------------------
+# months created ahead of the current one (the scheduler runs daily, so a
+# missed run or two never leaves a month without its partition)
+USAGE_LOG_PARTITION_MONTHS_AHEAD = 3
+
+_PARTITION_EXISTS = text("SELECT to_regclass(:name) IS NOT NULL")
+
+# ---------------------------------------------
+# HYPERLOGLOG KEYS
+# ---------------------------------------------
+USERS_HLL_KEY = "usage:hll:users:{}"     # {} = YYYY-MM-DD or "all"
+KEYS_HLL_KEY = "usage:hll:keys:{}"
+HLL_SEEDED_KEY = "usage:hll:seeded"      # set once the history is folded in
+HLL_DAY_TTL = 400 * 86400                # longest window asked for is a year
+
+_ALL_USERS = text("SELECT day, user_id FROM usage_log_daily_users")
+_ALL_KEYS = text("SELECT day, api_key_id FROM usage_log_daily_keys")
+
+
+def rollup_since(lookback_days: int = ROLLUP_LOOKBACK_DAYS) -> datetime:
+    """Start (UTC midnight) of the oldest day a rollup run re-aggregates."""
+    first_day = datetime.utcnow().date() - timedelta(days=lookback_days)
+    return datetime(first_day.year, first_day.month, first_day.day)
+
+
+def refresh_usage_rollup(db, lookback_days: int = ROLLUP_LOOKBACK_DAYS) -> datetime:
+    """
+    Upsert the daily rollups for every day from `lookback_days` ago up to
+    today. Idempotent: request counts are overwritten, distinct rows ignored
+    on conflict.
+    """
+    since = rollup_since(lookback_days)
+    params = {"since": since}
+    db.execute(_ROLLUP_REQUESTS, params)
+    new_users = db.execute(_ROLLUP_USERS, params).all()
+    new_keys = db.execute(_ROLLUP_KEYS, params).all()
+    db.commit()
+    try:
+        if REDIS and REDIS.exists(HLL_SEEDED_KEY):
+            _pfadd_days(REDIS, USERS_HLL_KEY, new_users)
+            _pfadd_days(REDIS, KEYS_HLL_KEY, new_keys)
+        ensure_usage_hll(db)
+    except redis.exceptions.RedisError:
+        logger.warning("usage HLL update skipped: redis unavailable")
+    logger.info("usage rollup refreshed since %s", since.date())
+    return since
+
+
+def _month_start(d: date, offset: int) -> date:
+    y, m = divmod(d.month - 1 + offset, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def ensure_usage_log_partitions(db, months_ahead: int = USAGE_LOG_PARTITION_MONTHS_AHEAD) -> List[str]:
+    """
+    Create the usage_logs partitions for the current UTC month and the next
+    `months_ahead` months, skipping those that exist. Returns the names
+    created. A month whose rows already landed in usage_logs_default cannot
+    get its partition (Postgres rejects it); that is logged and skipped.
+    """
+    first = datetime.utcnow().date().replace(day=1)
+    created = []
+    for i in range(months_ahead + 1):
+        start, end = _month_start(first, i), _month_start(first, i + 1)
+        name = f"usage_logs_{start:%Y_%m}"
+        if db.execute(_PARTITION_EXISTS, {"name": name}).scalar():
+            continue
+        try:
+            # creating a partition locks the parent; don't queue inserts behind it
+            db.execute(text("SET LOCAL lock_timeout = '5s'"))
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF usage_logs "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            db.commit()
+            created.append(name)
+        except Exception:
+            db.rollback()
+            logger.exception("could not create usage_logs partition %s", name)
+    if created:
+        logger.info("created usage_logs partitions: %s", ", ".join(created))
+    return created
+
+
+def window_days(days: int):
+    """The UTC days of a `days`-long window ending today, oldest first."""
+    today = datetime.utcnow().date()
+    days = max(days, 1)
+    return [today - timedelta(days=days - 1 - i) for i in range(days)]
+
+
+def window_start(days: int):
+    """First UTC day of a `days`-long window ending today."""
+    return datetime.utcnow().date() - timedelta(days=max(days, 1) - 1)
+
+
+def _pfadd_days(r, key_fmt, rows):
+    """PFADD (day, id) rows into the per-day and all-time HLLs, one pipeline."""
+    by_day = {}
+    for day, ident in rows:
+        by_day.setdefault(day.isoformat(), []).append(ident)
+    if not by_day:
+        return
+    pipe = r.pipeline(transaction=False)
+    for day, ids in by_day.items():
+        pipe.pfadd(key_fmt.format(day), *ids)
+        pipe.expire(key_fmt.format(day), HLL_DAY_TTL)
+        pipe.pfadd(key_fmt.format("all"), *ids)
+    pipe.execute()
+
+
+def rebuild_usage_hll(db, r=None, batch_size: int = 10000):
+    """
+    (Re)build every HLL from the per-day distinct tables and mark the dataset
+    seeded. Rows are streamed in batches so memory stays flat.
+    """
+    r = r or REDIS
+    for key_fmt, query in ((USERS_HLL_KEY, _ALL_USERS), (KEYS_HLL_KEY, _ALL_KEYS)):
+        result = db.execute(query.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            _pfadd_days(r, key_fmt, rows)
+    r.set(HLL_SEEDED_KEY, 1)
+
+
+def ensure_usage_hll(db, r=None):
+    """Seed the HLLs from the rollup tables once per Redis dataset."""
+    r = r or REDIS
+    if r and not r.exists(HLL_SEEDED_KEY):
+        rebuild_usage_hll(db, r)
+
+
+def approx_unique(key_fmt: str, window=None) -> Optional[int]:
+    """
+    Approximate distinct users / keys (key_fmt = USERS_HLL_KEY / KEYS_HLL_KEY)
+    over `window` (dates, see window_days), or all-time when window is None.
+    Returns None when Redis can't answer; callers then count exactly.
+    """
+    if not REDIS:
+        return None
+    if window is None:
+        keys = [key_fmt.format("all")]
+    else:
+        keys = [key_fmt.format(d.isoformat()) for d in window]
+    try:
+        if not REDIS.exists(HLL_SEEDED_KEY):
+            return None
+        # PFCOUNT over several keys counts their union
+        return int(REDIS.pfcount(*keys))
+    except redis.exceptions.RedisError:
+        logger.warning("usage HLL unavailable, falling back to exact count")
+        return None
@@ -21,11 +21,14 @@ from __future__ import annotations
 import io
 import csv
 import json
+import shutil
 import logging
 import zipfile
+import tempfile
 import asyncio
+from contextlib import contextmanager, ExitStack
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Set
 
 from backend.app.celery_app import celery_app
 from backend.app.db import SessionLocal
@@ -34,12 +37,15 @@ from backend.app.models.credit_reservation import CreditReservation
 
 from backend.app.services.verification_engine import verify_email_sync
 from backend.app.services.minio_client import (
-    get_object_bytes,
+    open_object,
     put_bytes,
     ensure_bucket,
     MINIO_BUCKET,
 )
 from backend.app.services.pricing_service import get_cost_for_key
+from backend.app.services.job_status_cache import invalidate_job
+from backend.app.utils.csv_emails import extract_csv_emails
+from backend.app.utils.email_scan import scan_emails
 from backend.app.services.credits_service import (
     capture_reservation,
     release_reservation_by_job,
@@ -62,6 +68,9 @@ logger = logging.getLogger(__name__)
 
 OUTPUT_PREFIX = "outputs/bulk"
 
+# read size when streaming inputs off MinIO
+READ_CHUNK_SIZE = 1024 * 1024
+
 
 def _dec(x) -> Decimal:
     """Convert to Decimal with 6 decimal places precision"""
@@ -118,6 +127,38 @@ def _publish_failed(job_id: str, error: str, user_id: Optional[int]):
         _publish(f"user:{user_id}:verification", user_payload)
 
 
+def _collect(unique: Set[str], found: Iterable[str]) -> None:
+    """Fold parsed addresses (all contain "@") into the unique set, lowercased."""
+    unique.update(map(str.lower, found))
+
+
+@contextmanager
+def _open_input(input_path: str, is_zip: bool):
+    """
+    Yield the job input as a binary stream without holding it in Python bytes.
+    CSV/TXT are parsed as they come off the file or the MinIO response; zip
+    objects are streamed to an unnamed temp file first, because ZipFile must
+    seek to the central directory (reads then come from the page cache).
+    """
+    if not input_path.startswith("s3://"):
+        with open(input_path, "rb") as fh:
+            yield fh
+        return
+
+    resp = open_object(input_path.replace("s3://", "").split("/", 1)[1])
+    try:
+        if is_zip:
+            with tempfile.TemporaryFile() as fh:
+                shutil.copyfileobj(resp, fh, READ_CHUNK_SIZE)
+                fh.seek(0)
+                yield fh
+        else:
+            yield io.BufferedReader(resp, READ_CHUNK_SIZE)
+    finally:
+        resp.close()
+        resp.release_conn()
+
+
 # ---------------------------
 # Celery Task (full processor)
 # ---------------------------
@@ -135,6 +176,7 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
     """
     logger.info("Celery: starting bulk job %s", job_id)
     db = SessionLocal()
+    inputs = ExitStack()
 
     try:
         job: Optional[BulkJob] = db.query(BulkJob).filter(BulkJob.job_id == job_id).first()
@@ -154,75 +196,57 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
         job.status = "running"
         db.add(job)
         db.commit()
+        invalidate_job("bulk", job_id)
         db.refresh(job)
 
-        # 1) Load file content
+        # 1) Open input (streamed, never copied into Python bytes)
+        filename = job.input_path.split("/")[-1].lower()
         try:
-            if str(job.input_path).startswith("s3://"):
-                s = job.input_path.replace("s3://", "").split("/", 1)
-                obj = s[1]
-                content = get_object_bytes(obj)
-            else:
-                with open(job.input_path, "rb") as fh:
-                    content = fh.read()
+            content = inputs.enter_context(_open_input(str(job.input_path), filename.endswith(".zip")))
         except Exception as e:
             logger.exception("Failed to read input for job %s", job_id)
             job.status = "failed"
             job.error_message = "input_read_failed"
             db.add(job)
             db.commit()
+            invalidate_job("bulk", job_id)
             _publish_failed(job_id, "input_read_failed", user_id)
             return {"ok": False, "reason": "input_read_failed"}
 
         # 2) Parse emails (csv / zip / plain)
-        emails: List[str] = []
-        filename = job.input_path.split("/")[-1].lower()
+        # deduped as each source is parsed; input order is not kept (a plain
+        # set is ~40% smaller than an ordered dict on multi-million uploads)
+        unique: Set[str] = set()
         try:
             if filename.endswith(".zip"):
-                z = zipfile.ZipFile(io.BytesIO(content))
+                z = zipfile.ZipFile(content)
                 for name in z.namelist():
                     if name.endswith("/") or name.startswith("__MACOSX"):
                         continue
-                    raw = z.read(name).decode("utf-8", errors="ignore")
-                    if name.lower().endswith(".csv"):
-                        reader = csv.reader(io.StringIO(raw))
-                        for row in reader:
-                            for col in row:
-                                col_str = col.strip()
-                                if "@" in col_str:
-                                    emails.append(col_str)
-                                    break
-                    else:
-                        for line in raw.splitlines():
-                            line_str = line.strip()
-                            if "@" in line_str:
-                                emails.append(line_str)
+                    # stream each member (inflate + parse line by line) instead
+                    # of z.read(), so only one line is decompressed at a time
+                    with z.open(name) as member:
+                        if name.lower().endswith(".csv"):
+                            _collect(unique, extract_csv_emails(member))
+                        else:
+                            # txt dumps / logs: one regex pass per block (re2 DFA if installed)
+                            unique.update(scan_emails(member))
             elif filename.endswith(".csv"):
-                raw = content.decode("utf-8", errors="ignore")
-                reader = csv.reader(io.StringIO(raw))
-                for row in reader:
-                    for col in row:
-                        col_str = col.strip()
-                        if "@" in col_str:
-                            emails.append(col_str)
-                            break
+                _collect(unique, extract_csv_emails(content))
             else:
-                raw = content.decode("utf-8", errors="ignore")
-                for line in raw.splitlines():
-                    line_str = line.strip()
-                    if "@" in line_str:
-                        emails.append(line_str)
+                unique.update(scan_emails(content))
         except Exception as e:
             logger.exception("Parse failed for job %s", job_id)
             job.status = "failed"
             job.error_message = "parse_failed"
             db.add(job)
             db.commit()
+            invalidate_job("bulk", job_id)
             _publish_failed(job_id, "parse_failed", user_id)
             return {"ok": False, "reason": "parse_failed"}
 
-        # dedupe case-insensitive
-        emails = list(dict.fromkeys([e.lower() for e in emails if "@" in e]))
+        # deduped case-insensitively while parsing
+        emails = list(unique)
         total = len(emails)
 
         if total == 0:
@@ -231,6 +255,7 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
             job.error_message = "no_valid_emails"
             db.add(job)
             db.commit()
+            invalidate_job("bulk", job_id)
             _publish_failed(job_id, "no_valid_emails", user_id)
             return {"ok": False, "reason": "no_valid_emails"}
 
@@ -316,6 +341,7 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
             job.status = "finished"
             db.add(job)
             db.commit()
+            invalidate_job("bulk", job_id)
         except Exception:
             logger.exception("Failed to update job row for %s", job_id, exc_info=True)
 
@@ -326,7 +352,7 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
                 CreditReservation.locked == True
             ).all()
 
-            cost_per = _dec(get_cost_for_key("verify.bulk_per_email") or 0)
+            cost_per = get_cost_for_key("verify.bulk_per_email")
             actual_cost = (cost_per * Decimal(processed)).quantize(Decimal("0.000001"))
             remaining_cost = actual_cost
 
@@ -417,12 +443,14 @@ def process_bulk_job_task(self, job_id: str, estimated_cost: float = 0.0) -> Dic
                 j.error_message = "worker_failed"
                 db.add(j)
                 db.commit()
+                invalidate_job("bulk", job_id)
             # publish failure event
             _publish_failed(job_id, "worker_failed", getattr(j, "user_id", None) if j else None)
         except Exception:
             logger.exception("Failed to mark job failure", exc_info=True)
         raise
     finally:
+        inputs.close()
         try:
             db.close()
         except Exception:
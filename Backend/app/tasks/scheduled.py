@@ -8,6 +8,8 @@ from backend.app.db import SessionLocal
 from backend.app.models.credit_reservation import CreditReservation
 from backend.app.services.domain_backoff import clear_backoff
 from backend.app.models.bulk_job import BulkJob
+from backend.app.services.job_status_cache import invalidate_job
+from backend.app.services.usage_rollup import refresh_usage_rollup, ensure_usage_log_partitions
 
 logger = get_task_logger(__name__)
 
@@ -73,6 +75,8 @@ def fix_stuck_bulk_jobs():
             db.add(job)
 
         db.commit()
+        for job in stuck_jobs:
+            invalidate_job("bulk", job.job_id)
 
         return {"fixed": len(stuck_jobs)}
 
@@ -85,6 +89,31 @@ def fix_stuck_bulk_jobs():
 # ----------------------------------------------------
 @shared_task(name="daily_usage_rollup")
 def daily_usage_rollup():
-    logger.info("Daily analytics rollup triggered.")
-    # Good place to aggregate: total verifications, spam detections, billing summaries
-    return {"status": "ok"}
+    """
+    Re-aggregate today's and yesterday's usage_logs into the usage_log_daily*
+    rollups read by the admin analytics / billing endpoints.
+    """
+    db = SessionLocal()
+    try:
+        since = refresh_usage_rollup(db)
+        return {"status": "ok", "since": since.date().isoformat()}
+    finally:
+        db.close()
+
+
+# ----------------------------------------------------
+# USAGE LOG PARTITIONS (created months ahead)
+# ----------------------------------------------------
+@shared_task(name="usage_log_partitions")
+def usage_log_partitions():
+    """
+    Make sure usage_logs has its monthly partitions for the coming months, so
+    rows keep being routed (and pruned) by month instead of falling into
+    usage_logs_default. Idempotent.
+    """
+    db = SessionLocal()
+    try:
+        created = ensure_usage_log_partitions(db)
+        return {"status": "ok", "created": created}
+    finally:
+        db.close()
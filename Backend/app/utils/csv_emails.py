@@ -0,0 +1,87 @@
+# backend/app/utils/csv_emails.py
+"""
+First-address-per-row extraction from CSV streams, shared by the bulk workers.
+
+Uses pyarrow's C CSV reader when it is installed (block-wise tokenizing, no
+per-cell Python work) and falls back to the stdlib csv module otherwise.
+Both paths keep the same rule: per row, the first cell containing "@",
+stripped.
+"""
+
+import csv
+import io
+from typing import Iterable, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# columns forced to binary (no type inference, no UTF-8 validation);
+# names beyond the file's real width are ignored by the reader
+ARROW_MAX_COLUMNS = 1024
+ARROW_BLOCK_SIZE = 8 << 20
+
+
+def _first_email_per_row(rows: Iterable[List[str]]) -> List[str]:
+    emails: List[str] = []
+    for row in rows:
+        for col in row:
+            if "@" in col:
+                emails.append(col.strip())
+                break
+    return emails
+
+
+def _extract_with_csv_module(stream) -> List[str]:
+    text = io.TextIOWrapper(stream, encoding="utf-8", errors="ignore", newline="")
+    try:
+        return _first_email_per_row(csv.reader(text))
+    finally:
+        text.detach()
+
+
+def _extract_with_arrow(stream) -> List[str]:
+    # rows whose width differs from the first row are handed back here and
+    # parsed with the csv module afterwards (appended last) instead of dropped
+    ragged: List[str] = []
+
+    def keep_ragged(row):
+        ragged.append(row.text)
+        return "skip"
+
+    try:
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(autogenerate_column_names=True, block_size=ARROW_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=keep_ragged),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={f"f{i}": pa.binary() for i in range(ARROW_MAX_COLUMNS)},
+            ),
+        )
+    except pa.ArrowInvalid as exc:
+        if "Empty CSV" in str(exc):
+            return []
+        raise
+    emails: List[str] = []
+    for batch in reader:
+        masked = [pc.if_else(pc.match_substring(col, "@"), col, None) for col in batch.columns]
+        first = pc.coalesce(*masked) if len(masked) > 1 else masked[0]
+        emails.extend(v.decode("utf-8", errors="ignore").strip() for v in first.drop_null().to_pylist())
+
+    if ragged:
+        emails.extend(_first_email_per_row(csv.reader(ragged)))
+    return emails
+
+
+def extract_csv_emails(stream) -> List[str]:
+    """
+    Return, for each CSV row of the binary `stream`, the first cell that
+    contains "@" (stripped). The stream is consumed, not closed.
+    """
+    if PYARROW_AVAILABLE:
+        return _extract_with_arrow(stream)
+    return _extract_with_csv_module(stream)
@@ -0,0 +1,52 @@
+# backend/app/utils/migrations.py
+"""
+Timeout and index-build helpers shared by the alembic revisions.
+
+Every revision runs in its own transaction (see alembic/env.py). Its
+statements get transaction-scoped timeouts (SET LOCAL), so nothing leaks into
+the autocommit blocks that build indexes CONCURRENTLY or VALIDATE
+constraints: those scan whole tables and run without a statement timeout.
+"""
+
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+from alembic import op
+
+# leftover of a cancelled / failed CONCURRENTLY build
+_INVALID_INDEX = sa.text(
+    "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relname = :name AND NOT i.indisvalid"
+)
+
+
+def migration_timeouts() -> None:
+    """Fail fast instead of queueing behind long transactions (this transaction only)."""
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '10min'")
+    op.execute("SET LOCAL idle_in_transaction_session_timeout = '30s'")
+
+
+@contextmanager
+def concurrent_block():
+    """
+    op.get_context().autocommit_block() for CONCURRENTLY builds and VALIDATE
+    scans: no statement timeout inside, and the transaction alembic reopens
+    afterwards gets migration_timeouts() again.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("SET statement_timeout = 0")
+        yield
+        op.execute("RESET statement_timeout")
+    migration_timeouts()
+
+
+def create_index_concurrently(name: str, definition: str, unique: bool = False) -> None:
+    """
+    CREATE [UNIQUE] INDEX CONCURRENTLY IF NOT EXISTS `name` `definition`,
+    inside concurrent_block(). An INVALID index left by an earlier cancelled
+    build is dropped first; IF NOT EXISTS would silently keep it otherwise.
+    """
+    if op.get_bind().execute(_INVALID_INDEX, {"name": name}).scalar():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
@@ -1,15 +1,21 @@
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 from datetime import datetime, timedelta
+from sqlalchemy.orm import make_transient_to_detached
 
 from backend.app.config import settings
 from backend.app.db import SessionLocal
 from backend.app.models.user import User
+from backend.app.utils.ttl_cache import ttl_cache
 
 security = HTTPBearer()
 
+# seconds a resolved user row is reused (role / deactivation changes apply after this)
+USER_CACHE_TTL = 30
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[int] = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(seconds=(expires_delta or settings.ACCESS_TOKEN_EXPIRE_SECONDS))
@@ -36,17 +42,36 @@ def get_current_user(creds: HTTPAuthorizationCredentials = Depends(security)) ->
     except Exception:
         raise HTTPException(status_code=401, detail="invalid_user_id")
 
+    row = _load_user_row(user_id)
+    if not row:
+        raise HTTPException(status_code=401, detail="user_not_found")
+    # a fresh detached User per request, never shared between requests or
+    # sessions; handlers that write must reload the user in their own session
+    user = User(**row)
+    make_transient_to_detached(user)
+    return user
+
+# dashboards fire several authenticated calls per page; the token is still
+# decoded (and expiry checked) on every call, only the users row is reused.
+# Only the column values are cached (read-only), not the ORM instance.
+@ttl_cache(ttl=USER_CACHE_TTL, maxsize=4096)
+def _load_user_row(user_id: int) -> Optional[Mapping[str, Any]]:
     db = SessionLocal()
     try:
         user = db.get(User, user_id)
-        if not user:
-            raise HTTPException(status_code=401, detail="user_not_found")
-        return user
+        if user is None:
+            return None
+        return MappingProxyType({attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs})
     finally:
         db.close()
 
-def get_current_admin(creds: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    user = get_current_user(creds)
+def invalidate_user(user_id: int) -> None:
+    """Drop the cached row after writing to the user, so the next request sees it."""
+    _load_user_row.cache_pop(user_id)
+
+def get_current_admin(user: User = Depends(get_current_user)) -> User:
+    # depends on get_current_user (not a direct call) so FastAPI resolves the
+    # user once per request even when a route also asks for current_user
     if not getattr(user, "is_admin", False):
         raise HTTPException(status_code=403, detail="admin_required")
     return user
@@ -0,0 +1,57 @@
+# backend/app/utils/ttl_cache.py
+"""
+Small in-process LRU + TTL cache for read-mostly endpoints (admin dashboards
+poll aggregates that barely change minute to minute).
+
+Per worker process only: every uvicorn/gunicorn worker keeps its own copy,
+so entries can be up to `ttl` seconds stale and differ between workers.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# request-scoped dependencies that must never be part of the cache key
+_UNCACHED_ARGS = ("db", "admin", "current_user")
+
+
+def ttl_cache(ttl: float = 60, maxsize: int = 512):
+    """
+    Memoize a handler's return value for `ttl` seconds, keyed by its keyword
+    arguments (query/path params). Least recently used entries are evicted
+    past `maxsize`. FastAPI still sees the wrapped signature.
+    """
+    def decorator(fn):
+        entries = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted((k, v) for k, v in kwargs.items() if k not in _UNCACHED_ARGS))
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and hit[0] > now:
+                    entries.move_to_end(key)
+                    return hit[1]
+
+            value = fn(*args, **kwargs)
+
+            with lock:
+                entries[key] = (now + ttl, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_pop(*args, **kwargs):
+            key = args + tuple(sorted((k, v) for k, v in kwargs.items() if k not in _UNCACHED_ARGS))
+            with lock:
+                entries.pop(key, None)
+
+        wrapper.cache_clear = entries.clear
+        wrapper.cache_pop = cache_pop
+        return wrapper
+
+    return decorator
@@ -10,6 +10,7 @@ from decimal import Decimal
 from backend.app.celery_app import celery_app
 from backend.app.db import SessionLocal
 from backend.app.models.bulk_job import BulkJob
+from backend.app.services.job_status_cache import invalidate_job
 from backend.app.services.dm_bulk_ws_manager import dm_bulk_ws_manager
 from backend.app.services.decision_maker_service import search_decision_makers  # reuse search pipeline (sync or adapt)
 from backend.app.services.minio_client import put_bytes, ensure_bucket, MINIO_BUCKET
@@ -37,7 +38,7 @@ def process_dm_bulk(self, job_id: str):
             logger.exception("Failed to read input file: %s", e)
             job.status = "error"
             job.error_message = "input_read_failed"
-            db.add(job); db.commit()
+            db.add(job); db.commit(); invalidate_job("bulk", job_id)
             # broadcast fail
             try:
                 import asyncio
@@ -65,7 +66,7 @@ def process_dm_bulk(self, job_id: str):
             # update job progress in DB
             try:
                 job.processed = processed
-                db.add(job); db.commit()
+                db.add(job); db.commit(); invalidate_job("bulk", job_id)
             except Exception:
                 db.rollback()
 
@@ -101,7 +102,7 @@ def process_dm_bulk(self, job_id: str):
                 pass
 
         job.status = "finished"
-        db.add(job); db.commit()
+        db.add(job); db.commit(); invalidate_job("bulk", job_id)
 
         # broadcast completed
         try:
@@ -117,7 +118,7 @@ def process_dm_bulk(self, job_id: str):
         try:
             job.status = "error"
             job.error_message = "worker_failed"
-            db.add(job); db.commit()
+            db.add(job); db.commit(); invalidate_job("bulk", job_id)
             import asyncio
             asyncio.run(dm_bulk_ws_manager.broadcast_job(job_id, {"event":"failed","error":"worker_failed"}))
         except Exception:
@@ -15,6 +15,7 @@ from backend.app.models.extractor_job import ExtractorJob
 from backend.app.services.extractor_engine import parse_with_bs, http_fetch  # we will use http_fetch for raw html
 from backend.app.services.minio_client import get_object_bytes, put_bytes, ensure_bucket, MINIO_BUCKET
 from backend.app.services.pricing_service import get_cost_for_key
+from backend.app.services.job_status_cache import invalidate_job
 from backend.app.services.credits_service import capture_reservation_by_job, release_reservation_by_job
 from backend.app.services.credits_service import get_cost_for_job_estimate_key
 from backend.app.services.verification_engine import verify_email_sync  # optional
@@ -112,7 +113,7 @@ async def _process_extractor_job_async(job_id: str, use_browser: bool = False):
         urls = [u for u in urls if u and u.startswith(("http://", "https://"))]
         total = len(urls)
         if total == 0:
-            job.status = "error"; job.error_message = "no_urls_found"; db.add(job); db.commit()
+            job.status = "error"; job.error_message = "no_urls_found"; db.add(job); db.commit(); invalidate_job("extractor", job_id)
             return {"error": "no_urls_found"}
 
         # concurrency fetch
@@ -173,6 +174,7 @@ async def _process_extractor_job_async(job_id: str, use_browser: bool = False):
         job.status = "finished"
         db.add(job)
         db.commit()
+        invalidate_job("extractor", job_id)
 
         # === Billing finalization: capture reservation(s) by job_id ===
         try:
@@ -187,7 +189,7 @@ async def _process_extractor_job_async(job_id: str, use_browser: bool = False):
     except Exception as exc:
         logger.exception("extractor worker unexpected: %s", exc)
         try:
-            job.status = "error"; job.error_message = "worker_failed"; db.add(job); db.commit()
+            job.status = "error"; job.error_message = "worker_failed"; db.add(job); db.commit(); invalidate_job("extractor", job_id)
         except Exception:
             pass
         raise
@@ -20,6 +20,7 @@ from backend.app.models.extractor_job import ExtractorJob
 from backend.app.services.extractor_engine import extract_url
 from backend.app.services.credits_service import capture_reservation_and_charge, release_reservation_by_job
 from backend.app.services.pricing_service import get_cost_for_key
+from backend.app.services.job_status_cache import invalidate_job
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
@@ -45,7 +46,7 @@ def process_extractor_job(self, job_id: str, estimated_cost: float):
 
         job.status = "finished"
         job.result_preview = str(results[:50])
-        db.add(job); db.commit()
+        db.add(job); db.commit(); invalidate_job("extractor", job_id)
 
         # compute actual cost and finalize reservations similar to bulk
         per_cost = Decimal(str(get_cost_for_key("extractor.bulk_per_url") or 0))
@@ -73,6 +74,7 @@ from backend.app.models.extractor_job import ExtractorJob
 from backend.app.services.extractor_engine import extract_url
 from backend.app.services.minio_client import get_object_bytes, put_bytes, ensure_bucket, MINIO_BUCKET
 from backend.app.services.pricing_service import get_cost_for_key
+from backend.app.services.job_status_cache import invalidate_job
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +143,7 @@ def process_extractor_job(self, job_id: str, use_browser: bool = False):
             except Exception as e:
                 logger.exception("read input failed: %s", e)
                 job.status = "error"; job.error_message = "input_read_failed"
-                db.add(job); db.commit()
+                db.add(job); db.commit(); invalidate_job("extractor", job_id)
                 return {"error": "input_read_failed"}
 
         # parse urls
@@ -150,7 +152,7 @@ def process_extractor_job(self, job_id: str, use_browser: bool = False):
         total = len(urls)
         if total == 0:
             job.status = "error"; job.error_message = "no_urls_found"
-            db.add(job); db.commit()
+            db.add(job); db.commit(); invalidate_job("extractor", job_id)
             return {"error": "no_urls_found"}
 
         results = []
@@ -213,6 +215,7 @@ def process_extractor_job(self, job_id: str, use_browser: bool = False):
         job.status = "finished"
         db.add(job)
         db.commit()
+        invalidate_job("extractor", job_id)
 
         # NOTE: billing capture/refund: we expect reservation.job_id to be set earlier.
         # Worker can locate reservations and call capture if you implemented capture_reservation_by_job.
@@ -224,7 +227,7 @@ def process_extractor_job(self, job_id: str, use_browser: bool = False):
         logger.exception("extractor worker unexpected: %s", exc)
         try:
             job.status = "error"; job.error_message = "worker_failed"
-            db.add(job); db.commit()
+            db.add(job); db.commit(); invalidate_job("extractor", job_id)
         except Exception:
             pass
         raise
@@ -28,6 +28,7 @@ def reset_daily():
 from backend.app.celery_app import celery_app
 from backend.app.services.credits_service import release_reservation_by_job
 from backend.app.services.reservation_finalizer import finalize_reservations_for_job
+from sqlalchemy import update
 from backend.app.db import SessionLocal
 from backend.app.models.credit_reservation import CreditReservation
 from datetime import datetime
@@ -45,12 +46,14 @@ def cleanup_expired_reservations():
     db = SessionLocal()
     try:
         now = datetime.utcnow()
-        expired = db.query(CreditReservation).filter(CreditReservation.expires_at < now, CreditReservation.locked == True).all()
-        for r in expired:
-            logger.info("releasing expired reservation %s", r.id)
-            r.locked = False
-            db.add(r)
+        # one UPDATE instead of loading and dirtying every expired row
+        released = db.execute(
+            update(CreditReservation)
+            .where(CreditReservation.expires_at < now, CreditReservation.locked == True)
+            .values(locked=False)
+        ).rowcount
         db.commit()
+        logger.info("released %s expired reservations", released)
     finally:
         db.close()
 
@@ -63,6 +66,9 @@ celery_app.conf.beat_schedule.update({
     }
 })
 
+from backend.app.models.bulk_job import BulkJob
+from backend.app.services.job_status_cache import invalidate_job
+
 @celery_app.task
 def recover_dead_jobs():
     db = SessionLocal()
@@ -71,13 +77,17 @@ def recover_dead_jobs():
             BulkJob.status.in_(["queued", "processing"])
         ).all()
 
+        recovered = []
         for job in stuck:
             # if job older than 45 minutes = dead
             if (datetime.utcnow() - job.created_at).seconds > 2700:
                 job.status = "error"
                 job.error_message = "auto_recovered_stuck_job"
                 db.add(job)
+                recovered.append(job.job_id)
         db.commit()
+        for job_id in recovered:
+            invalidate_job("bulk", job_id)
     finally:
         db.close()
         
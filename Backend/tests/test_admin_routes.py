@@ -0,0 +1,51 @@
+# backend/tests/test_admin_routes.py
+import ast
+from collections import Counter
+from pathlib import Path
+
+ADMIN_MODULE = Path(__file__).resolve().parents[1] / "app" / "api" / "v1" / "admin.py"
+
+
+def _module():
+    return ast.parse(ADMIN_MODULE.read_text())
+
+
+def test_admin_declares_one_router():
+    routers = [
+        node for node in _module().body
+        if isinstance(node, ast.Assign)
+        and any(isinstance(t, ast.Name) and t.id == "router" for t in node.targets)
+    ]
+    assert len(routers) == 1
+
+
+def test_admin_routes_are_unique():
+    """A second handler for the same method + path is silently shadowed."""
+    routes = Counter()
+    for node in _module().body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for dec in node.decorator_list:
+            if (
+                isinstance(dec, ast.Call)
+                and isinstance(dec.func, ast.Attribute)
+                and isinstance(dec.func.value, ast.Name)
+                and dec.func.value.id == "router"
+            ):
+                routes[(dec.func.attr, dec.args[0].value)] += 1
+
+    assert routes
+    assert [r for r, n in routes.items() if n > 1] == []
+
+
+def test_admin_handler_names_are_unique():
+    """Handlers must not shadow each other or the service functions they call."""
+    module = _module()
+    names = Counter(n.name for n in module.body if isinstance(n, ast.FunctionDef))
+    imported = {
+        alias.asname or alias.name
+        for n in module.body if isinstance(n, ast.ImportFrom)
+        for alias in n.names
+    }
+    assert [name for name, n in names.items() if n > 1] == []
+    assert set(names) & imported == set()
@@ -0,0 +1,23 @@
+import io
+
+import pytest
+
+from backend.app.utils import csv_emails
+
+SAMPLE = b'name,email,n\nx, a@b.com ,1\ny,c@d.org,2\nz,,3\n'
+
+
+def test_csv_module_takes_first_address_per_row():
+    assert csv_emails._extract_with_csv_module(io.BytesIO(SAMPLE)) == ["a@b.com", "c@d.org"]
+
+
+def test_arrow_matches_csv_module():
+    pytest.importorskip("pyarrow")
+    assert csv_emails._extract_with_arrow(io.BytesIO(SAMPLE)) == ["a@b.com", "c@d.org"]
+
+
+def test_arrow_keeps_ragged_rows_and_empty_input():
+    pytest.importorskip("pyarrow")
+    ragged = b"name,email\nx,a@b.com\nlonely@x.com\n"
+    assert sorted(csv_emails._extract_with_arrow(io.BytesIO(ragged))) == ["a@b.com", "lonely@x.com"]
+    assert csv_emails._extract_with_arrow(io.BytesIO(b"")) == []
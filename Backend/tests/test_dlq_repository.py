@@ -21,3 +21,36 @@ def test_dlq_repo_save(monkeypatch):
 
     assert len(saved_items) == 1
     assert isinstance(saved_items[0], WebhookDLQ)
+
+
+def test_dlq_repo_mark_processed_many_empty(monkeypatch):
+    def no_session():
+        raise AssertionError("no session needed for an empty batch")
+
+    monkeypatch.setattr(
+        "backend.app.repositories.webhook_dlq_repository.SessionLocal",
+        no_session
+    )
+
+    assert WebhookDLQRepository().mark_processed_many([]) == 0
+
+
+def test_dlq_repo_uses_bound_session_without_closing(monkeypatch):
+    class FakeDB:
+        def __init__(self):
+            self.items, self.closed = [], False
+        def add(self, x): self.items.append(x)
+        def commit(self): pass
+        def refresh(self, x): pass
+        def close(self): self.closed = True
+
+    monkeypatch.setattr(
+        "backend.app.repositories.webhook_dlq_repository.SessionLocal",
+        lambda: (_ for _ in ()).throw(AssertionError("bound repo must not open a session"))
+    )
+
+    db = FakeDB()
+    WebhookDLQRepository(db).save("http://example.com", {"a": 1})
+
+    assert len(db.items) == 1
+    assert db.closed is False
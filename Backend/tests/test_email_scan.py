@@ -0,0 +1,60 @@
+import io
+
+from backend.app.utils import email_scan
+
+
+def test_scan_emails_dedupes_lowercased_tokens():
+    raw = b'John <John@Example.com>, x@y.org\nlog: x@y.org; "bad@host" other@Mail.NET\n'
+    assert email_scan.scan_emails(io.BytesIO(raw)) == {"john@example.com", "x@y.org", "other@mail.net"}
+
+
+def test_scanner_keeps_matches_split_across_chunks():
+    scanner = email_scan.EmailScanner()
+    scanner.feed(b"first@a.com\nsplit@exa")
+    scanner.feed(b"mple.com\nlast@b.io")
+    assert scanner.close() == {"first@a.com", "split@example.com", "last@b.io"}
+
+
+def test_addresses_are_kept_whole():
+    raw = "o'brien@example.com\nuser@mail.xn--p1ai\njürgen@müller.de\n".encode("utf-8")
+    assert email_scan.scan_emails(io.BytesIO(raw)) == {
+        "o'brien@example.com",
+        "user@mail.xn--p1ai",
+        "jürgen@müller.de",
+    }
+
+
+def test_no_substring_of_a_longer_token_is_picked_out():
+    raw = b"a@b@example.com x!y@host.c0m@ user@.com\n"
+    assert email_scan.scan_emails(io.BytesIO(raw)) == set()
+
+
+def test_non_utf8_tokens_are_dropped_not_the_block():
+    raw = "ok@example.com jürgen@example.de\n".encode("latin-1")
+    assert email_scan.scan_emails(io.BytesIO(raw)) == {"ok@example.com"}
+
+
+def test_streamed_scan_matches_worker_scan():
+    # submit feeds MinIO-part-sized chunks, the workers read 1 MB blocks:
+    # both must price / verify the same set
+    raw = "o'brien@example.com, Jürgen@Müller.de;<x@y.org>\nuser@mail.xn--p1ai a@b@c.com\n".encode("utf-8") * 3
+    scanner = email_scan.EmailScanner()
+    for i in range(0, len(raw), 7):
+        scanner.feed(raw[i:i + 7])
+    assert scanner.close() == email_scan.scan_emails(io.BytesIO(raw))
+
+
+def test_single_line_upload_does_not_grow_the_carry():
+    scanner = email_scan.EmailScanner()
+    for i in range(1000):
+        scanner.feed(b"user%d@example.com," % i)
+        assert len(scanner._tail) <= email_scan.MAX_TOKEN
+    assert len(scanner.close()) == 1000
+
+
+def test_over_long_token_is_skipped_whole():
+    scanner = email_scan.EmailScanner()
+    scanner.feed(b"a" * (email_scan.MAX_TOKEN + 1))
+    scanner.feed(b"x" * 10)
+    scanner.feed(b"@example.com next@example.com")
+    assert scanner.close() == {"next@example.com"}
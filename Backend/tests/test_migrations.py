@@ -0,0 +1,31 @@
+# backend/tests/test_migrations.py
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("alembic")
+from alembic.script import ScriptDirectory
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[1] / "app" / "alembic"
+
+
+def _script():
+    """Load every revision under alembic/versions, like `alembic upgrade` does."""
+    return ScriptDirectory(str(ALEMBIC_DIR))
+
+
+def test_single_head_and_single_base():
+    script = _script()
+    assert len(script.get_heads()) == 1, f"multiple heads: {script.get_heads()}"
+    assert script.get_bases() == ["0001_initial"]
+
+
+def test_chain_is_linear():
+    script = _script()
+    revisions = list(script.walk_revisions())
+    for rev in revisions:
+        assert not rev.is_merge_point, f"{rev.revision} merges {rev.down_revision}"
+        assert len(rev.nextrev) <= 1, f"multiple children after {rev.revision}: {rev.nextrev}"
+
+    ids = {rev.revision for rev in revisions}
+    assert "0002_add_plans_and_billing" in ids
@@ -0,0 +1,64 @@
+import time
+
+from backend.app.utils.ttl_cache import ttl_cache
+
+
+def test_repeat_calls_hit_the_cache():
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def summary(days=7, db=None, admin=None):
+        calls.append(days)
+        return {"days": days}
+
+    assert summary(days=7, db=object(), admin=object()) == {"days": 7}
+    assert summary(days=7, db=object(), admin=object()) == {"days": 7}
+    assert summary(days=30, db=object(), admin=object()) == {"days": 30}
+    assert calls == [7, 30]
+
+
+def test_entries_expire_after_ttl():
+    calls = []
+
+    @ttl_cache(ttl=0.01)
+    def summary(days=7):
+        calls.append(days)
+        return days
+
+    summary(days=7)
+    time.sleep(0.02)
+    summary(days=7)
+    assert calls == [7, 7]
+
+
+def test_least_recently_used_entry_is_evicted():
+    calls = []
+
+    @ttl_cache(ttl=60, maxsize=2)
+    def summary(days=7):
+        calls.append(days)
+        return days
+
+    summary(days=1)
+    summary(days=2)
+    summary(days=1)
+    summary(days=3)  # evicts days=2
+    summary(days=1)
+    summary(days=2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_cache_pop_drops_only_that_entry():
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def load(user_id):
+        calls.append(user_id)
+        return user_id
+
+    load(1)
+    load(2)
+    load.cache_pop(1)
+    load(1)
+    load(2)
+    assert calls == [1, 2, 1]